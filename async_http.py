@@ -0,0 +1,343 @@
+"""
+aiohttp counterparts of http_transport, page_fetch, page_cache and path_probe.
+
+AsyncHttpTransport applies the same policy as HttpTransport (browser headers,
+per-host connection limits, per-host HostScheduler token buckets, jittered
+exponential backoff on connection errors, 429 and 5xx for idempotent requests)
+to one aiohttp session. fetch_page_async streams bodies through the same
+StreamedBody reader as fetch_page, and AsyncPageCache shares PageCache's
+entries and rules. Errors are raised as requests exceptions, so callers handle
+both engines the same way.
+"""
+
+import asyncio
+import random
+from contextlib import asynccontextmanager
+from typing import TYPE_CHECKING, AsyncIterator, Callable, Dict, Iterable, List, Optional, Tuple
+from urllib.parse import urlsplit
+
+import aiohttp
+import requests
+from requests.structures import CaseInsensitiveDict
+
+from http_transport import DEFAULT_HEADERS, IDEMPOTENT_METHODS, RETRY_STATUSES
+from page_cache import PERMANENT_ERRORS, PageCache, normalize_url
+from page_fetch import CHUNK_SIZE, HTML_CONTENT_TYPES, FetchedPage, StreamedBody
+from path_probe import HEAD_UNSUPPORTED_STATUSES, probe_urls
+from rate_limiter import DEFAULT_HOST_BURST, DEFAULT_HOST_RATE, HostScheduler
+
+if TYPE_CHECKING:
+    from http_cache import HttpCache
+
+
+def _as_requests_error(error: Exception) -> requests.exceptions.RequestException:
+    """The requests exception matching an aiohttp/asyncio error"""
+    if isinstance(error, asyncio.TimeoutError):
+        return requests.exceptions.Timeout(str(error) or "Request timed out")
+    if isinstance(error, aiohttp.ClientConnectionError):
+        return requests.exceptions.ConnectionError(str(error))
+    return requests.exceptions.RequestException(str(error))
+
+
+def _requests_response(response: aiohttp.ClientResponse) -> requests.Response:
+    """Body-less requests.Response with an aiohttp response's status, URL and headers"""
+    converted = requests.Response()
+    converted.status_code = response.status
+    converted.reason = response.reason
+    converted.url = str(response.url)
+    converted.headers = CaseInsensitiveDict(response.headers)
+    return converted
+
+
+class AsyncHttpTransport:
+    """One pooled aiohttp session per event loop, with HttpTransport's retry policy"""
+
+    def __init__(
+        self,
+        headers: Optional[Dict[str, str]] = None,
+        max_connections: int = 100,
+        pool_maxsize: int = 16,
+        host_pool_sizes: Optional[Dict[str, int]] = None,
+        host_rates: Optional[Dict[str, float]] = None,
+        max_retries: int = 3,
+        backoff_factor: float = 0.5,
+        retry_statuses: Iterable[int] = RETRY_STATUSES,
+        default_host_rate: float = DEFAULT_HOST_RATE,
+        default_host_burst: float = DEFAULT_HOST_BURST,
+        scheduler: Optional[HostScheduler] = None
+    ):
+        """
+        Args:
+            headers: Headers sent with every request (default: DEFAULT_HEADERS)
+            max_connections: Open connections across all hosts
+            pool_maxsize: Open connections per host
+            host_pool_sizes: Connections per host for specific hosts, e.g. {"www.linkedin.com": 4}
+            host_rates: Requests per second for specific domains and their subdomains,
+                e.g. {"linkedin.com": 1.0} (default: rate_limiter.DEFAULT_HOST_RATES)
+            max_retries: Retries of idempotent requests on connection errors and retry_statuses
+            backoff_factor: Base of the exponential backoff between retries (seconds)
+            retry_statuses: HTTP statuses that are retried
+            default_host_rate: Requests per second for each other host (0 = unlimited)
+            default_host_burst: Requests each other host may receive at once after being idle
+            scheduler: HostScheduler to share with another transport instead of
+                host_rates/default_host_rate/default_host_burst
+        """
+        self.headers = dict(DEFAULT_HEADERS if headers is None else headers)
+        self.max_connections = max_connections
+        self.pool_maxsize = pool_maxsize
+        self.host_pool_sizes = dict(host_pool_sizes or {})
+        self.scheduler = scheduler or HostScheduler(
+            host_rates, default_host_rate, default_burst=default_host_burst
+        )
+        self.max_retries = max_retries
+        self.backoff_factor = backoff_factor
+        self.retry_statuses = frozenset(retry_statuses)
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._loop = None
+        self._host_slots: Dict[str, asyncio.Semaphore] = {}
+
+    @classmethod
+    def from_config(cls, config: Dict) -> "AsyncHttpTransport":
+        """Build a transport from a config dict with any of the constructor's keyword arguments"""
+        return cls(**config)
+
+    @property
+    def session(self) -> aiohttp.ClientSession:
+        """The running event loop's session (created on first use)"""
+        loop = asyncio.get_running_loop()
+        if self._session is None or self._session.closed or self._loop is not loop:
+            self._close_stale_session()
+            connector = aiohttp.TCPConnector(limit=self.max_connections, limit_per_host=self.pool_maxsize)
+            self._session = aiohttp.ClientSession(connector=connector, headers=self.headers)
+            self._loop = loop
+            self._host_slots = {
+                host: asyncio.Semaphore(size) for host, size in self.host_pool_sizes.items()
+            }
+        return self._session
+
+    def _close_stale_session(self) -> None:
+        """
+        Close the session of the event loop used before, on that loop
+
+        A session can only be closed by its own loop: one still running (in
+        another thread) closes it right away, an idle one the next time it
+        runs. A loop that has already been closed can't close it any more,
+        which is why aclose() should be awaited before a loop ends.
+        """
+        session, loop = self._session, self._loop
+        if session is None or session.closed or loop is None or loop.is_closed():
+            return
+        if loop.is_running():
+            asyncio.run_coroutine_threadsafe(session.close(), loop)
+        else:
+            loop.create_task(session.close())
+
+    def _backoff(self, attempt: int, response: Optional[aiohttp.ClientResponse] = None) -> float:
+        """Seconds to wait before retry number `attempt` (Retry-After wins if present)"""
+        retry_after = response.headers.get("Retry-After") if response is not None else None
+        if retry_after and retry_after.strip().isdigit():
+            return float(retry_after)
+        backoff = self.backoff_factor * 2 ** attempt
+        return backoff + random.uniform(0, backoff)
+
+    @asynccontextmanager
+    async def request(self, method: str, url: str, timeout: float = 10, **kwargs) -> AsyncIterator[aiohttp.ClientResponse]:
+        """
+        Send a request and yield the response; the body can be read inside the block
+
+        Idempotent requests are retried on connection errors and retry statuses.
+        aiohttp and timeout errors (also from reading the body) are raised as
+        the matching requests exceptions.
+
+        Args:
+            method: HTTP method
+            url: Request URL
+            timeout: Total timeout per attempt in seconds
+            **kwargs: Passed on to aiohttp (params, json, headers, allow_redirects, ...)
+        """
+        session = self.session
+        host = (urlsplit(url).hostname or "").lower()
+        slots = self._host_slots.get(host)
+        bucket = self.scheduler.bucket(url)
+        retries = self.max_retries if method.upper() in IDEMPOTENT_METHODS else 0
+        client_timeout = aiohttp.ClientTimeout(total=timeout)
+
+        if slots is not None:
+            await slots.acquire()
+        try:
+            for attempt in range(retries + 1):
+                await bucket.acquire_async()
+                try:
+                    response = await session.request(method, url, timeout=client_timeout, **kwargs)
+                except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                    if attempt == retries:
+                        raise _as_requests_error(e) from e
+                    await asyncio.sleep(self._backoff(attempt))
+                    continue
+
+                if response.status in self.retry_statuses and attempt < retries:
+                    wait = self._backoff(attempt, response)
+                    response.release()
+                    await asyncio.sleep(wait)
+                    continue
+
+                try:
+                    yield response
+                except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                    raise _as_requests_error(e) from e
+                finally:
+                    response.release()
+                return
+        finally:
+            if slots is not None:
+                slots.release()
+
+    async def aclose(self) -> None:
+        """Close the session"""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+
+
+async def fetch_page_async(
+    transport: AsyncHttpTransport,
+    url: str,
+    max_bytes: int = 2 * 1024 * 1024,
+    allowed_types: Optional[Tuple[str, ...]] = HTML_CONTENT_TYPES,
+    stop_when: Optional[Callable[[str], bool]] = None,
+    timeout: float = 10,
+    http_cache: Optional["HttpCache"] = None,
+    **kwargs
+) -> FetchedPage:
+    """
+    fetch_page for AsyncHttpTransport (same arguments, result and errors)
+
+    HTTP cache reads and writes run in a worker thread, off the event loop.
+
+    Args:
+        transport: Transport to fetch with
+        **kwargs: Passed on to aiohttp (allow_redirects, headers, ...)
+    """
+    entry = None
+    if http_cache is not None:
+        entry = await asyncio.to_thread(http_cache.lookup, url, partial_ok=stop_when is not None)
+        if entry is not None:
+            if http_cache.is_fresh(entry):
+                return http_cache.serve_fresh(entry)
+            kwargs["headers"] = {**(kwargs.get("headers") or {}), **http_cache.validators(entry)}
+
+    async with transport.request("GET", url, timeout=timeout, **kwargs) as res:
+        response = _requests_response(res)
+        if entry is not None and response.status_code == 304:
+            return await asyncio.to_thread(http_cache.serve_revalidated, url, entry, response)
+
+        if not response.ok:
+            page = FetchedPage(response, "")
+        else:
+            body = StreamedBody(response, url, max_bytes, allowed_types, stop_when)
+            async for chunk in res.content.iter_chunked(CHUNK_SIZE):
+                if body.feed(chunk):
+                    break
+            page = body.page()
+
+    if http_cache is not None:
+        await asyncio.to_thread(http_cache.store, url, page)
+    return page
+
+
+async def path_exists_async(transport: AsyncHttpTransport, url: str, timeout: float = 5) -> bool:
+    """path_probe.path_exists for AsyncHttpTransport"""
+    try:
+        async with transport.request("HEAD", url, timeout=timeout, allow_redirects=True) as res:
+            status = res.status
+        if status in HEAD_UNSUPPORTED_STATUSES:
+            async with transport.request("GET", url, timeout=timeout, allow_redirects=True) as res:
+                status = res.status
+        return status == 200
+    except requests.exceptions.RequestException:
+        return False
+
+
+async def probe_paths_async(
+    transport: AsyncHttpTransport,
+    base_url: str,
+    paths: List[str],
+    timeout: float = 5
+) -> Optional[str]:
+    """path_probe.probe_paths for AsyncHttpTransport (same arguments and result)"""
+    urls = probe_urls(base_url, paths)
+    tasks = [asyncio.ensure_future(path_exists_async(transport, url, timeout)) for url in urls]
+    try:
+        for url, task in zip(urls, tasks):
+            if await task:
+                return url
+        return None
+    finally:
+        for task in tasks:
+            task.cancel()
+
+
+class AsyncPageCache(PageCache):
+    """
+    PageCache for fetch_page_async
+
+    Concurrent fetches of the same URL share one download: later callers wait
+    for the first one's page (or error) instead of fetching it again.
+    """
+
+    def __init__(self, max_pages: int = 256):
+        super().__init__(max_pages)
+        self._in_flight: Dict[Tuple[str, bool, int], asyncio.Future] = {}
+
+    async def fetch(
+        self,
+        transport: AsyncHttpTransport,
+        url: str,
+        max_bytes: int,
+        stop_when: Optional[Callable[[str], bool]] = None,
+        **kwargs
+    ) -> FetchedPage:
+        """fetch_page_async through the cache"""
+        key = normalize_url(url)
+        cached = self._lookup(key, stop_when, max_bytes)
+        if cached is not None:
+            if isinstance(cached, Exception):
+                raise cached
+            return cached
+
+        # A download that may stop early is only shared with callers that allow that too,
+        # and one capped at max_bytes only with callers using the same cap
+        flight = (key, stop_when is not None, max_bytes)
+        pending = self._in_flight.get(flight)
+        if pending is not None:
+            with self._lock:
+                # Counted as a miss by _lookup, but nothing is downloaded for this caller
+                self.misses -= 1
+                self.hits += 1
+            try:
+                return await asyncio.shield(pending)
+            except asyncio.CancelledError:
+                if not pending.cancelled():
+                    raise
+                # The first caller was cancelled mid-download, fetch it ourselves
+                return await self.fetch(transport, url, max_bytes, stop_when, **kwargs)
+
+        future = asyncio.get_running_loop().create_future()
+        self._in_flight[flight] = future
+        try:
+            page = await fetch_page_async(transport, url, max_bytes, stop_when=stop_when, **kwargs)
+        except requests.exceptions.RequestException as e:
+            if isinstance(e, PERMANENT_ERRORS):
+                self._store(key, e)
+            future.set_exception(e)
+            future.exception()  # Retrieved, so asyncio doesn't warn when nobody else waited
+            raise
+        except BaseException:
+            future.cancel()
+            raise
+        finally:
+            self._in_flight.pop(flight, None)
+
+        self._store_page(key, page, max_bytes)
+        future.set_result(page)
+        return page
@@ -0,0 +1,189 @@
+"""
+Validate and benchmark the LinkedIn guest job card parser
+
+Runs the precompiled lxml parser (guest_cards.parse_guest_job_cards) and the
+original BeautifulSoup loop on saved guest search responses, checks that both
+return the same jobs, and prints the median parse time per page.
+
+--check runs only the checks on the committed fixture corpus (fixtures/guest):
+both parsers must agree and return the job IDs in expected_job_ids.json.
+"""
+
+import json
+import os
+import sys
+import time
+import statistics
+from typing import Dict, List
+from urllib.parse import quote_plus
+
+import requests
+
+from benchmark_parsers import load_pages
+from guest_cards import parse_guest_job_cards, parse_guest_job_cards_soup
+
+DEFAULT_LOCATION = "United States"
+FIXTURE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures", "guest")
+EXPECTED_IDS_FILE = "expected_job_ids.json"
+
+
+def save_guest_responses(directory: str, keyword: str, location: str, pages: int = 4) -> None:
+    """Download guest search responses into `directory` as a fixture corpus"""
+    os.makedirs(directory, exist_ok=True)
+    headers = {
+        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
+    }
+    for page in range(pages):
+        start = page * 25
+        url = (
+            "https://www.linkedin.com/jobs-guest/jobs/api/seeMoreJobPostings/search"
+            f"?keywords={quote_plus(keyword)}&location={quote_plus(location)}&start={start}"
+        )
+        try:
+            res = requests.get(url, headers=headers, timeout=15)
+            res.raise_for_status()
+        except requests.exceptions.RequestException as e:
+            print(f"❌ start={start}: {e}")
+            break
+        name = f"{keyword}_{location}_{start}".replace(" ", "-").replace("/", "-").lower()
+        path = os.path.join(directory, f"{name}.html")
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(res.text)
+        print(f"💾 start={start} -> {path} ({len(res.text) // 1024} KB)")
+        time.sleep(1)  # Be respectful
+
+
+def _median_time(parse, html: str, repeat: int) -> float:
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        parse(html)
+        timings.append(time.perf_counter() - start)
+    return statistics.median(timings)
+
+
+def validate_and_benchmark(pages: Dict[str, str], repeat: int = 5) -> bool:
+    """
+    Compare both parsers on every page
+
+    Returns:
+        True if both parsers returned the same jobs for every page
+    """
+    parsers = {
+        "soup (html.parser)": lambda html: parse_guest_job_cards_soup(html, DEFAULT_LOCATION, "html.parser"),
+        "soup (lxml)": lambda html: parse_guest_job_cards_soup(html, DEFAULT_LOCATION, "lxml"),
+        "precompiled": lambda html: parse_guest_job_cards(html, DEFAULT_LOCATION),
+    }
+    totals = {name: 0.0 for name in parsers}
+    mismatches: List[str] = []
+
+    print(f"\n{'page':<40} {'jobs':>5}  " + "  ".join(f"{name:>18}" for name in parsers))
+    for name, html in pages.items():
+        expected = parsers["soup (html.parser)"](html)
+        actual = parsers["precompiled"](html)
+        if actual != expected:
+            mismatches.append(name)
+
+        row = []
+        for parser_name, parse in parsers.items():
+            median = _median_time(parse, html, repeat)
+            totals[parser_name] += median
+            row.append(f"{median * 1000:>16.2f}ms")
+        label = os.path.basename(name)[:40]
+        print(f"{label:<40} {len(expected or []):>5}  " + "  ".join(row))
+
+    print("\nTotal (median per page):")
+    baseline = totals["soup (html.parser)"]
+    for parser_name, total in totals.items():
+        speedup = f" ({baseline / total:.1f}x)" if total else ""
+        print(f"  {parser_name:<20} {total * 1000:8.2f}ms{speedup}")
+
+    if mismatches:
+        print(f"\n❌ Parsers disagree on {len(mismatches)} page(s):")
+        for name in mismatches:
+            print(f"   {name}")
+        return False
+
+    print(f"\n✅ Both parsers returned identical jobs for all {len(pages)} page(s)")
+    return True
+
+
+def check_fixtures(directory: str = FIXTURE_DIR) -> bool:
+    """
+    Check both parsers against a fixture corpus, without timing them
+
+    Every parser must return the same jobs, and the job IDs listed for each
+    page in the corpus' expected_job_ids.json (null for pages without cards).
+
+    Returns:
+        True if every check passed
+    """
+    with open(os.path.join(directory, EXPECTED_IDS_FILE), "r", encoding="utf-8") as f:
+        expected_ids = json.load(f)
+    pages = load_pages([directory])
+
+    parsers = {
+        "soup (html.parser)": lambda html: parse_guest_job_cards_soup(html, DEFAULT_LOCATION, "html.parser"),
+        "soup (lxml)": lambda html: parse_guest_job_cards_soup(html, DEFAULT_LOCATION, "lxml"),
+        "precompiled": lambda html: parse_guest_job_cards(html, DEFAULT_LOCATION),
+    }
+    failures: List[str] = []
+    for name, html in pages.items():
+        page = os.path.basename(name)
+        results = {parser_name: parse(html) for parser_name, parse in parsers.items()}
+        reference = results["soup (html.parser)"]
+        for parser_name, jobs in results.items():
+            if jobs != reference:
+                failures.append(f"{page}: {parser_name} disagrees with soup (html.parser)")
+
+        if page not in expected_ids:
+            failures.append(f"{page}: missing from {EXPECTED_IDS_FILE}")
+            continue
+        job_ids = None if reference is None else [job["job_id"] for job in reference]
+        if job_ids != expected_ids[page]:
+            failures.append(f"{page}: job IDs {job_ids} != expected {expected_ids[page]}")
+
+    if failures:
+        print(f"❌ {len(failures)} fixture check(s) failed:")
+        for failure in failures:
+            print(f"   {failure}")
+        return False
+
+    print(f"✅ All parsers agree and return the expected job IDs for {len(pages)} fixture page(s)")
+    return True
+
+
+if __name__ == "__main__":
+    if len(sys.argv) < 2:
+        print("Usage: python benchmark_guest_cards.py <html_file_or_dir>... [--repeat N]")
+        print("       python benchmark_guest_cards.py --save <dir> <keyword> <location> [pages]")
+        print("       python benchmark_guest_cards.py --check [fixture_dir]")
+        print("\nExample:")
+        print('  python benchmark_guest_cards.py --save fixtures/guest "software engineer" "United States" 4')
+        print("  python benchmark_guest_cards.py fixtures/guest")
+        print("  python benchmark_guest_cards.py --check")
+        sys.exit(1)
+
+    args = sys.argv[1:]
+    if args[0] == "--check":
+        sys.exit(0 if check_fixtures(*args[1:2]) else 1)
+
+    if args[0] == "--save":
+        if len(args) < 4:
+            print("❌ Error: --save needs a directory, keyword and location")
+            sys.exit(1)
+        save_guest_responses(args[1], args[2], args[3], int(args[4]) if len(args) > 4 else 4)
+        sys.exit(0)
+
+    repeat = 5
+    if "--repeat" in args:
+        index = args.index("--repeat")
+        repeat = int(args[index + 1])
+        del args[index:index + 2]
+
+    pages = load_pages(args)
+    if not pages:
+        print("❌ Error: No .html pages found")
+        sys.exit(1)
+
+    sys.exit(0 if validate_and_benchmark(pages, repeat=repeat) else 1)
@@ -0,0 +1,124 @@
+"""
+Benchmark BeautifulSoup parser backends on saved HTML pages
+
+Parses every page with each installed backend (lxml, html.parser, html5lib),
+both into a full tree and anchor-only (as the link-scanning stages do),
+collects links the way career-page detection does, and prints the median
+parse time per page and backend.
+"""
+
+import os
+import sys
+import time
+import statistics
+from typing import Dict, List
+from urllib.parse import urlparse
+
+import requests
+from bs4 import BeautifulSoup, FeatureNotFound
+
+from html_parsing import ANCHOR_STRAINER, HTML_PARSERS
+
+
+def save_pages(directory: str, urls: List[str]) -> None:
+    """Download pages into `directory` so they can be benchmarked offline"""
+    os.makedirs(directory, exist_ok=True)
+    headers = {
+        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
+    }
+    for url in urls:
+        try:
+            res = requests.get(url, headers=headers, timeout=15)
+            res.raise_for_status()
+        except requests.exceptions.RequestException as e:
+            print(f"❌ {url}: {e}")
+            continue
+        parsed = urlparse(url)
+        name = (parsed.netloc + parsed.path).strip("/").replace("/", "_") or "page"
+        path = os.path.join(directory, f"{name}.html")
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(res.text)
+        print(f"💾 {url} -> {path} ({len(res.text) // 1024} KB)")
+
+
+def load_pages(paths: List[str]) -> Dict[str, str]:
+    """Read .html files from the given files and directories"""
+    pages = {}
+    for path in paths:
+        files = [path]
+        if os.path.isdir(path):
+            files = [os.path.join(path, name) for name in sorted(os.listdir(path)) if name.endswith((".html", ".htm"))]
+        for file in files:
+            with open(file, "r", encoding="utf-8", errors="replace") as f:
+                pages[file] = f.read()
+    return pages
+
+
+def benchmark(pages: Dict[str, str], repeat: int = 5) -> None:
+    """Time each available parser backend on every page"""
+    variants = {}
+    for parser in HTML_PARSERS:
+        try:
+            BeautifulSoup("", parser)
+        except FeatureNotFound:
+            print(f"⚠️  {parser} not installed, skipping")
+            continue
+        variants[parser] = (parser, None)
+        # html5lib ignores parse_only
+        if parser != "html5lib":
+            variants[f"{parser}/anchors"] = (parser, ANCHOR_STRAINER)
+
+    totals = {label: 0.0 for label in variants}
+
+    print(f"\n{'page':<40} {'KB':>6}  " + "  ".join(f"{label:>17}" for label in variants))
+    for name, html in pages.items():
+        row = []
+        for label, (parser, strainer) in variants.items():
+            timings = []
+            for _ in range(repeat):
+                start = time.perf_counter()
+                soup = BeautifulSoup(html, parser, parse_only=strainer)
+                links = soup.find_all("a", href=True)
+                timings.append(time.perf_counter() - start)
+            median = statistics.median(timings)
+            totals[label] += median
+            row.append(f"{median * 1000:>11.1f}ms/{len(links):<4}")
+        label = os.path.basename(name)[:40]
+        print(f"{label:<40} {len(html) // 1024:>6}  " + "  ".join(row))
+
+    print("\nTotal (median per page, ms/links found):")
+    baseline = totals.get("html.parser")
+    for label, total in totals.items():
+        speedup = f" ({baseline / total:.1f}x vs html.parser)" if baseline and total else ""
+        print(f"  {label:<20} {total * 1000:8.1f}ms{speedup}")
+
+
+if __name__ == "__main__":
+    if len(sys.argv) < 2:
+        print("Usage: python benchmark_parsers.py <html_file_or_dir>... [--repeat N]")
+        print("       python benchmark_parsers.py --save <dir> <url>...")
+        print("\nExample:")
+        print("  python benchmark_parsers.py --save saved_pages https://www.linkedin.com/company/google https://about.google")
+        print("  python benchmark_parsers.py saved_pages")
+        sys.exit(1)
+
+    args = sys.argv[1:]
+    if args[0] == "--save":
+        if len(args) < 3:
+            print("❌ Error: --save needs a directory and at least one URL")
+            sys.exit(1)
+        save_pages(args[1], args[2:])
+        sys.exit(0)
+
+    repeat = 5
+    if "--repeat" in args:
+        index = args.index("--repeat")
+        repeat = int(args[index + 1])
+        del args[index:index + 2]
+
+    pages = load_pages(args)
+    if not pages:
+        print("❌ Error: No .html pages found")
+        sys.exit(1)
+
+    benchmark(pages, repeat=repeat)
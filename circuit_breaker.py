@@ -0,0 +1,104 @@
+"""
+Circuit breaker for discovery sources.
+
+A source that keeps failing (or answering too slowly) is skipped for a
+cooldown period instead of costing a full request timeout on every call.
+After the cooldown one probe call is let through (half-open): success
+closes the circuit again, failure re-opens it.
+"""
+
+import threading
+import time
+from collections import deque
+from typing import Optional, Dict
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+class CircuitBreaker:
+    """Thread-safe circuit breaker tracking recent failures and latency of one source"""
+
+    def __init__(
+        self,
+        name: str,
+        failure_threshold: int = 3,
+        cooldown: float = 300.0,
+        slow_call_seconds: Optional[float] = None,
+        window: int = 20
+    ):
+        """
+        Args:
+            name: Source name (for logs and status)
+            failure_threshold: Consecutive failures that open the circuit
+            cooldown: Seconds the circuit stays open before a half-open probe
+            slow_call_seconds: Calls slower than this count as failures (None = never)
+            window: Number of recent calls kept for latency/failure stats
+        """
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.cooldown = cooldown
+        self.slow_call_seconds = slow_call_seconds
+
+        self.state = CLOSED
+        self.consecutive_failures = 0
+        self.opened_at: Optional[float] = None
+        self._probe_in_flight = False
+        self._recent = deque(maxlen=window)  # (succeeded, latency)
+        self._lock = threading.Lock()
+
+    def allow_request(self) -> bool:
+        """Whether a call may go through now (moves open -> half-open after the cooldown)"""
+        with self._lock:
+            if self.state == CLOSED:
+                return True
+
+            if self.state == OPEN and time.monotonic() - self.opened_at >= self.cooldown:
+                self.state = HALF_OPEN
+
+            if self.state == HALF_OPEN and not self._probe_in_flight:
+                self._probe_in_flight = True
+                return True
+
+            return False
+
+    def record_success(self, latency: float) -> None:
+        """Record a successful call (a slow call counts as a failure)"""
+        if self.slow_call_seconds is not None and latency > self.slow_call_seconds:
+            self.record_failure(latency)
+            return
+
+        with self._lock:
+            self._recent.append((True, latency))
+            self.consecutive_failures = 0
+            self.state = CLOSED
+            self.opened_at = None
+            self._probe_in_flight = False
+
+    def record_failure(self, latency: float) -> None:
+        """Record a failed call, opening the circuit past the threshold or on a failed probe"""
+        with self._lock:
+            self._recent.append((False, latency))
+            self.consecutive_failures += 1
+            if self.state == HALF_OPEN or self.consecutive_failures >= self.failure_threshold:
+                self.state = OPEN
+                self.opened_at = time.monotonic()
+            self._probe_in_flight = False
+
+    def status(self) -> Dict:
+        """Snapshot of the breaker state and recent stats"""
+        with self._lock:
+            latencies = [latency for _, latency in self._recent]
+            failures = sum(1 for succeeded, _ in self._recent if not succeeded)
+            retry_in = None
+            if self.state == OPEN:
+                retry_in = max(0.0, self.cooldown - (time.monotonic() - self.opened_at))
+            return {
+                "state": self.state,
+                "consecutive_failures": self.consecutive_failures,
+                "recent_calls": len(self._recent),
+                "recent_failures": failures,
+                "avg_latency": sum(latencies) / len(latencies) if latencies else None,
+                "retry_in": retry_in
+            }
@@ -0,0 +1,139 @@
+"""
+On-disk TTL cache for job discovery responses.
+
+Parsed discovery pages are stored as one JSON file per
+(source, keyword, location, page offset). Entries expire after a TTL and
+the oldest entries are evicted once the cache grows past its size limit,
+so quick reruns don't spend API quota on pages fetched minutes ago.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+from typing import Optional, Dict, List
+
+logger = logging.getLogger(__name__)
+
+
+class DiscoveryCache:
+    """Disk-backed, size-bounded TTL cache of discovery results"""
+
+    def __init__(
+        self,
+        directory: str = ".discovery_cache",
+        ttl: float = 3600.0,
+        max_mb: float = 100.0
+    ):
+        """
+        Args:
+            directory: Directory holding the cache files
+            ttl: Seconds an entry stays valid
+            max_mb: Total cache size after which the oldest entries are evicted
+        """
+        self.directory = directory
+        self.ttl = ttl
+        self.max_bytes = int(max_mb * 1024 * 1024)
+        self._lock = threading.Lock()
+        os.makedirs(self.directory, exist_ok=True)
+
+    @classmethod
+    def from_config(cls, config: Dict) -> "DiscoveryCache":
+        """Build a cache from a config dict with optional directory, ttl and max_mb keys"""
+        return cls(
+            directory=config.get("directory", ".discovery_cache"),
+            ttl=config.get("ttl", 3600.0),
+            max_mb=config.get("max_mb", 100.0)
+        )
+
+    def _path(self, source: str, keyword: str, location: str, offset: int) -> str:
+        key = json.dumps([source, keyword.strip().lower(), location.strip().lower(), offset])
+        digest = hashlib.sha256(key.encode("utf-8")).hexdigest()
+        return os.path.join(self.directory, f"{digest}.json")
+
+    def get(self, source: str, keyword: str, location: str, offset: int = 0) -> Optional[List[Dict]]:
+        """Cached jobs for this page, or None on a miss or expired entry"""
+        path = self._path(source, keyword, location, offset)
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                entry = json.load(f)
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as e:
+            logger.debug(f"Unreadable cache entry {path}: {e}")
+            return None
+
+        if time.time() - entry.get("stored_at", 0) > self.ttl:
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+            return None
+
+        logger.info(f"💾 [Cache] Hit: {source} / {keyword} / {location} @ {offset}")
+        return entry.get("jobs")
+
+    def set(self, source: str, keyword: str, location: str, offset: int, jobs: List[Dict]) -> None:
+        """
+        Store the jobs of one page, evicting the oldest entries if the cache is full
+
+        Empty pages are not stored: an empty answer is often a soft failure
+        (quota, bot wall, changed markup), and caching it would hide real
+        results for the whole TTL.
+        """
+        if not jobs:
+            return
+        path = self._path(source, keyword, location, offset)
+        tmp_path = f"{path}.{threading.get_ident()}.tmp"
+        try:
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump({"stored_at": time.time(), "jobs": jobs}, f)
+            os.replace(tmp_path, path)
+        except (OSError, TypeError, ValueError) as e:
+            logger.debug(f"Could not write cache entry {path}: {e}")
+            return
+
+        self._evict()
+
+    def _evict(self) -> None:
+        """Delete expired entries, then the oldest ones until the cache fits in max_bytes"""
+        with self._lock:
+            entries = []
+            total = 0
+            now = time.time()
+            for name in os.listdir(self.directory):
+                if not name.endswith(".json"):
+                    continue
+                path = os.path.join(self.directory, name)
+                try:
+                    stat = os.stat(path)
+                except OSError:
+                    continue
+                if now - stat.st_mtime > self.ttl:
+                    self._remove(path)
+                    continue
+                entries.append((stat.st_mtime, stat.st_size, path))
+                total += stat.st_size
+
+            entries.sort()
+            for _, size, path in entries:
+                if total <= self.max_bytes:
+                    break
+                self._remove(path)
+                total -= size
+
+    @staticmethod
+    def _remove(path: str) -> None:
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+
+    def clear(self) -> None:
+        """Delete every cache entry"""
+        with self._lock:
+            for name in os.listdir(self.directory):
+                if name.endswith(".json"):
+                    self._remove(os.path.join(self.directory, name))
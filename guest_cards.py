@@ -0,0 +1,190 @@
+"""
+Parser for LinkedIn guest job search responses.
+
+The guest endpoint (jobs-guest/jobs/api/seeMoreJobPostings/search) returns
+an HTML fragment with one card per job. parse_guest_job_cards reads it with
+lxml and XPath expressions compiled once at import; parse_guest_job_cards_soup
+is the original BeautifulSoup loop, kept as the fallback when lxml is not
+installed and as the reference benchmark_guest_cards.py validates against.
+"""
+
+import logging
+import re
+from typing import Dict, List, Optional
+
+from bs4 import BeautifulSoup
+
+from job_records import extract_linkedin_job_id
+
+logger = logging.getLogger(__name__)
+
+try:
+    from lxml import etree
+except ImportError:
+    etree = None
+
+LINKEDIN_BASE_URL = "https://www.linkedin.com"
+
+# Cards carry the posting ID as data-entity-urn="urn:li:jobPosting:<id>"
+_JOB_POSTING_URN = re.compile(r"urn:li:jobPosting:(\d+)")
+
+if etree is not None:
+    # Case-insensitive class test, like the soup parser's re.I class matchers
+    _CLASS = "translate(@class, 'ABCDEFGHIJKLMNOPQRSTUVWXYZ', 'abcdefghijklmnopqrstuvwxyz')"
+
+    # Same lookups as the soup parser; each returns at most the first match in document order
+    _CARDS = etree.XPath(f"//div[contains({_CLASS}, 'base-card') or contains({_CLASS}, 'job-result-card')]")
+    _FALLBACK_CARDS = etree.XPath(f"//li[contains({_CLASS}, 'result-card')]")
+    _URN = etree.XPath("(descendant-or-self::*/@data-entity-urn)[1]")
+    _LINK = etree.XPath("(.//a[contains(@href, '/jobs/view/')])[1]")
+    _TITLE = etree.XPath(f"(.//h3[contains({_CLASS}, 'title')])[1]")
+    _H3 = etree.XPath("(.//h3)[1]")
+    _COMPANY = etree.XPath(f"(.//h4[contains({_CLASS}, 'company') or contains({_CLASS}, 'subtitle')])[1]")
+    _H4 = etree.XPath("(.//h4)[1]")
+    _COMPANY_LINK = etree.XPath(f"(.//a[contains({_CLASS}, 'company')])[1]")
+    _LOCATION = etree.XPath(f"(.//span[contains({_CLASS}, 'location')])[1]")
+    _LOCATION_DIV = etree.XPath(f"(.//div[contains({_CLASS}, 'location')])[1]")
+
+# Class matchers of the soup parser
+_CARD_CLASS = re.compile(r"base-card|job-result-card", re.I)
+_FALLBACK_CARD_CLASS = re.compile(r"result-card", re.I)
+_JOB_VIEW_HREF = re.compile(r"/jobs/view/")
+_TITLE_CLASS = re.compile(r"title|job-title", re.I)
+_COMPANY_CLASS = re.compile(r"company|subtitle", re.I)
+_COMPANY_LINK_CLASS = re.compile(r"company", re.I)
+_LOCATION_SPAN_CLASS = re.compile(r"location|job-location", re.I)
+_LOCATION_DIV_CLASS = re.compile(r"location", re.I)
+
+
+def _job_record(job_path: str, urn: Optional[str], title: str, company_name: str, job_location: str) -> Dict:
+    job_url = job_path if job_path.startswith("http") else LINKEDIN_BASE_URL + job_path
+    # The card's entity URN is authoritative; the URL is the fallback
+    urn_match = _JOB_POSTING_URN.search(urn or "")
+    return {
+        "job_url": job_url,
+        "job_id": urn_match.group(1) if urn_match else extract_linkedin_job_id(job_url),
+        "title": title,
+        "company_name": company_name,
+        "location": job_location,
+        "source": "linkedin_public_api"
+    }
+
+
+def _first(xpath, node):
+    found = xpath(node)
+    return found[0] if found else None
+
+
+def _text(element) -> str:
+    return "".join(element.itertext()).strip()
+
+
+def parse_guest_job_cards(html: str, default_location: str) -> Optional[List[Dict]]:
+    """
+    Parse a guest job search response
+
+    Args:
+        html: Response body
+        default_location: Location used for cards that don't show one
+
+    Returns:
+        Job dictionaries, or None if the response had no job cards
+    """
+    if etree is None:
+        return parse_guest_job_cards_soup(html, default_location)
+    if not html or not html.strip():
+        return None
+
+    try:
+        root = etree.HTML(html)
+    except ValueError:
+        # Strings with an XML encoding declaration must be parsed as bytes
+        root = etree.HTML(html.encode("utf-8"))
+    if root is None:
+        return None
+
+    cards = _CARDS(root) or _FALLBACK_CARDS(root)
+    if not cards:
+        return None
+
+    jobs = []
+    for card in cards:
+        try:
+            link = _first(_LINK, card)
+            if link is None:
+                continue
+
+            title = _first(_TITLE, card)
+            if title is None:
+                title = _first(_H3, card)
+
+            company = _first(_COMPANY, card)
+            if company is None:
+                company = _first(_H4, card)
+            if company is None:
+                company = _first(_COMPANY_LINK, card)
+
+            location = _first(_LOCATION, card)
+            if location is None:
+                location = _first(_LOCATION_DIV, card)
+
+            jobs.append(_job_record(
+                link.get("href", ""),
+                _first(_URN, card),
+                _text(title) if title is not None else "Unknown",
+                _text(company) if company is not None else "Unknown",
+                _text(location) if location is not None else default_location
+            ))
+        except Exception as e:
+            logger.debug(f"Error parsing job card: {e}")
+            continue
+
+    return jobs
+
+
+def parse_guest_job_cards_soup(html: str, default_location: str, parser: str = "html.parser") -> Optional[List[Dict]]:
+    """
+    BeautifulSoup version of parse_guest_job_cards (same arguments and result)
+
+    Args:
+        parser: BeautifulSoup parser backend
+    """
+    soup = BeautifulSoup(html, parser)
+
+    job_cards = soup.find_all("div", class_=_CARD_CLASS)
+    if not job_cards:
+        # Try alternative selectors
+        job_cards = soup.find_all("li", class_=_FALLBACK_CARD_CLASS)
+    if not job_cards:
+        return None
+
+    jobs = []
+    for card in job_cards:
+        try:
+            link_elem = card.find("a", href=_JOB_VIEW_HREF)
+            if not link_elem:
+                continue
+
+            title_elem = card.find("h3", class_=_TITLE_CLASS) or \
+                card.find("h3") or \
+                link_elem.find("h3")
+            company_elem = card.find("h4", class_=_COMPANY_CLASS) or \
+                card.find("h4") or \
+                card.find("a", class_=_COMPANY_LINK_CLASS)
+            location_elem = card.find("span", class_=_LOCATION_SPAN_CLASS) or \
+                card.find("div", class_=_LOCATION_DIV_CLASS)
+
+            urn_elem = card if card.has_attr("data-entity-urn") else card.find(attrs={"data-entity-urn": True})
+
+            jobs.append(_job_record(
+                link_elem.get("href", ""),
+                urn_elem["data-entity-urn"] if urn_elem else None,
+                title_elem.text.strip() if title_elem else "Unknown",
+                company_elem.text.strip() if company_elem else "Unknown",
+                location_elem.text.strip() if location_elem else default_location
+            ))
+        except Exception as e:
+            logger.debug(f"Error parsing job card: {e}")
+            continue
+
+    return jobs
@@ -0,0 +1,34 @@
+"""
+HTML parsing helpers shared by the job source agents.
+"""
+
+import logging
+
+from bs4 import BeautifulSoup, FeatureNotFound, SoupStrainer
+
+logger = logging.getLogger(__name__)
+
+# lxml is faster than Python's built-in html.parser, especially on large pages
+DEFAULT_HTML_PARSER = "lxml"
+
+# Backends BeautifulSoup can use, fastest first
+HTML_PARSERS = ["lxml", "html.parser", "html5lib"]
+
+# Link-scanning stages only need <a href> elements; passed as parse_only, the
+# rest of the page is never built into the tree
+ANCHOR_STRAINER = SoupStrainer("a", href=True)
+
+
+def resolve_html_parser(name: str = DEFAULT_HTML_PARSER) -> str:
+    """
+    Return `name` if BeautifulSoup can use it, otherwise fall back to html.parser
+
+    Args:
+        name: BeautifulSoup parser backend ("lxml", "html.parser", "html5lib")
+    """
+    try:
+        BeautifulSoup("", name)
+        return name
+    except FeatureNotFound:
+        logger.warning(f"⚠️  HTML parser '{name}' not installed, falling back to html.parser")
+        return "html.parser"
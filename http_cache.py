@@ -0,0 +1,211 @@
+"""
+Persistent conditional-GET cache for company homepages and career pages.
+
+These pages rarely change between runs, but are downloaded in full every
+time. HttpCache keeps each page's body with its ETag / Last-Modified
+validators on disk. On the next run fetch_page sends If-None-Match /
+If-Modified-Since, and a 304 Not Modified is answered with the stored body,
+so sites that support validators cost one tiny response instead of a page.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+from typing import Dict, Optional
+
+import requests
+from requests.structures import CaseInsensitiveDict
+
+from page_cache import normalize_url
+from page_fetch import FetchedPage
+
+logger = logging.getLogger(__name__)
+
+
+class HttpCache:
+    """Disk-backed store of validated page bodies, with hit/revalidated/miss counts"""
+
+    def __init__(
+        self,
+        directory: str = ".http_cache",
+        max_age: float = 0.0,
+        max_mb: float = 200.0
+    ):
+        """
+        Args:
+            directory: Directory holding the cache files
+            max_age: Seconds a stored page is served without asking the server
+                (0 = always revalidate)
+            max_mb: Total cache size after which the oldest entries are evicted
+        """
+        self.directory = directory
+        self.max_age = max_age
+        self.max_bytes = int(max_mb * 1024 * 1024)
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.revalidated = 0
+        self.misses = 0
+        os.makedirs(self.directory, exist_ok=True)
+
+    @classmethod
+    def from_config(cls, config: Dict) -> "HttpCache":
+        """Build a cache from a config dict with optional directory, max_age and max_mb keys"""
+        return cls(
+            directory=config.get("directory", ".http_cache"),
+            max_age=config.get("max_age", 0.0),
+            max_mb=config.get("max_mb", 200.0)
+        )
+
+    def _path(self, url: str) -> str:
+        digest = hashlib.sha256(normalize_url(url).encode("utf-8")).hexdigest()
+        return os.path.join(self.directory, f"{digest}.json")
+
+    def lookup(self, url: str, partial_ok: bool = False) -> Optional[Dict]:
+        """
+        Stored entry for a URL, or None
+
+        Args:
+            partial_ok: Whether a body cut short by a stop_when check will do
+        """
+        path = self._path(url)
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                entry = json.load(f)
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as e:
+            logger.debug(f"Unreadable HTTP cache entry {path}: {e}")
+            return None
+
+        if entry.get("stopped_early") and not partial_ok:
+            return None
+        return entry
+
+    def is_fresh(self, entry: Dict) -> bool:
+        """Whether the entry can be served without revalidating"""
+        return time.time() - entry.get("validated_at", 0) < self.max_age
+
+    @staticmethod
+    def validators(entry: Dict) -> Dict[str, str]:
+        """Conditional request headers for a stored entry"""
+        headers = {}
+        if entry.get("etag"):
+            headers["If-None-Match"] = entry["etag"]
+        if entry.get("last_modified"):
+            headers["If-Modified-Since"] = entry["last_modified"]
+        return headers
+
+    @staticmethod
+    def page(entry: Dict) -> FetchedPage:
+        """FetchedPage for a stored entry (a 200 with the stored URL, headers and body)"""
+        response = requests.Response()
+        response.status_code = 200
+        response.reason = "OK"
+        response.url = entry["url"]
+        response.headers = CaseInsensitiveDict(entry.get("headers") or {})
+        return FetchedPage(response, entry["body"], entry.get("truncated", False), entry.get("stopped_early", False))
+
+    def serve_fresh(self, entry: Dict) -> FetchedPage:
+        """Serve an entry that is still fresh (counted as a hit)"""
+        with self._lock:
+            self.hits += 1
+        return self.page(entry)
+
+    def serve_revalidated(self, url: str, entry: Dict, not_modified: requests.Response) -> FetchedPage:
+        """Serve an entry the server confirmed with 304 Not Modified (counted as revalidated)"""
+        with self._lock:
+            self.revalidated += 1
+        entry["validated_at"] = time.time()
+        # A 304 may carry updated validators
+        entry["etag"] = not_modified.headers.get("ETag") or entry.get("etag")
+        entry["last_modified"] = not_modified.headers.get("Last-Modified") or entry.get("last_modified")
+        self._write(url, entry)
+        return self.page(entry)
+
+    def store(self, url: str, page: FetchedPage) -> None:
+        """Record a downloaded page (counted as a miss) and keep it if it has validators"""
+        with self._lock:
+            self.misses += 1
+
+        headers = page.headers
+        etag = headers.get("ETag")
+        last_modified = headers.get("Last-Modified")
+        if page.status_code != 200 or not (etag or last_modified):
+            return
+        if "no-store" in headers.get("Cache-Control", "").lower():
+            return
+
+        self._write(url, {
+            "url": page.url,
+            "headers": {"Content-Type": headers.get("Content-Type", "")},
+            "etag": etag,
+            "last_modified": last_modified,
+            "body": page.text,
+            "truncated": page.truncated,
+            "stopped_early": page.stopped_early,
+            "validated_at": time.time()
+        })
+
+    def _write(self, url: str, entry: Dict) -> None:
+        path = self._path(url)
+        tmp_path = f"{path}.{threading.get_ident()}.tmp"
+        try:
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(entry, f)
+            os.replace(tmp_path, path)
+        except (OSError, TypeError, ValueError) as e:
+            logger.debug(f"Could not write HTTP cache entry {path}: {e}")
+            return
+
+        self._evict()
+
+    def _evict(self) -> None:
+        """Delete the least recently validated entries until the cache fits in max_bytes"""
+        with self._lock:
+            entries = []
+            total = 0
+            for name in os.listdir(self.directory):
+                if not name.endswith(".json"):
+                    continue
+                path = os.path.join(self.directory, name)
+                try:
+                    stat = os.stat(path)
+                except OSError:
+                    continue
+                entries.append((stat.st_mtime, stat.st_size, path))
+                total += stat.st_size
+
+            entries.sort()
+            for _, size, path in entries:
+                if total <= self.max_bytes:
+                    break
+                try:
+                    os.remove(path)
+                except OSError:
+                    pass
+                total -= size
+
+    def stats(self) -> Dict[str, int]:
+        """Fresh hits, 304 revalidations and full downloads since the last reset_stats()"""
+        with self._lock:
+            return {"hits": self.hits, "revalidated": self.revalidated, "misses": self.misses}
+
+    def reset_stats(self) -> None:
+        """Zero the counters (called at the start of each pipeline run)"""
+        with self._lock:
+            self.hits = 0
+            self.revalidated = 0
+            self.misses = 0
+
+    def clear(self) -> None:
+        """Delete every cache entry"""
+        with self._lock:
+            for name in os.listdir(self.directory):
+                if name.endswith(".json"):
+                    try:
+                        os.remove(os.path.join(self.directory, name))
+                    except OSError:
+                        pass
@@ -0,0 +1,218 @@
+"""
+Pooled HTTP transport shared by the job source agents.
+
+Each thread gets its own requests.Session (sessions are not thread-safe, so
+connection pools are per thread too), all built the same way: default browser headers, HTTPAdapters mounted with
+tuned connection pools (optionally sized per host), and a retry policy that
+retries idempotent requests on connection errors, 429 and 5xx with jittered
+exponential backoff. Every request, and every retry of it, first waits for its
+host's token in a HostScheduler (see rate_limiter.py), so LinkedIn is paced strictly while other
+sites are not held up by it. Pass one HttpTransport to several agents to share
+their threads' sessions and the per-host budgets. Sessions of threads that
+have exited are closed when the next session is created.
+"""
+
+import random
+import threading
+import weakref
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from rate_limiter import DEFAULT_HOST_BURST, DEFAULT_HOST_RATE, HostScheduler
+
+DEFAULT_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
+    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
+    'Accept-Language': 'en-US,en;q=0.5',
+    'Accept-Encoding': 'gzip, deflate',
+    'Connection': 'keep-alive',
+}
+
+# Only requests that can safely be sent twice are retried
+IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS"})
+RETRY_STATUSES = (429, 500, 502, 503, 504)
+
+
+class JitteredRetry(Retry):
+    """Retry whose exponential backoff is spread out by up to 100% random jitter"""
+
+    def get_backoff_time(self) -> float:
+        backoff = super().get_backoff_time()
+        return backoff + random.uniform(0, backoff) if backoff else 0.0
+
+
+class ThrottledRetry(JitteredRetry):
+    """
+    JitteredRetry that waits for the host's turn in a HostScheduler before each retry
+
+    urllib3 repeats a request inside a single adapter send, so the adapter's
+    token only covers the first attempt.
+    """
+
+    def __init__(self, *args, scheduler: Optional[HostScheduler] = None, retry_url: Optional[str] = None, **kwargs):
+        """
+        Args:
+            scheduler: Scheduler to take retry tokens from (None = retries are not paced)
+            retry_url: Origin of the request being retried, set by increment()
+            *args, **kwargs: Passed on to urllib3's Retry
+        """
+        super().__init__(*args, **kwargs)
+        self.scheduler = scheduler
+        self.retry_url = retry_url
+
+    def new(self, **kw) -> "ThrottledRetry":
+        kw.setdefault("scheduler", self.scheduler)
+        return super().new(**kw)
+
+    def increment(self, method=None, url=None, response=None, error=None, _pool=None, _stacktrace=None) -> "ThrottledRetry":
+        retry = super().increment(method, url, response, error, _pool, _stacktrace)
+        if _pool is not None:
+            retry.retry_url = f"{_pool.scheme}://{_pool.host}"
+        return retry
+
+    def sleep(self, response=None) -> None:
+        super().sleep(response)
+        if self.scheduler is not None and self.retry_url:
+            self.scheduler.acquire(self.retry_url)
+
+
+class ThrottledHTTPAdapter(HTTPAdapter):
+    """HTTPAdapter that waits for the request host's turn in a HostScheduler (retries: see ThrottledRetry)"""
+
+    def __init__(self, scheduler: HostScheduler, **kwargs):
+        self.scheduler = scheduler
+        super().__init__(**kwargs)
+
+    def send(self, request, **kwargs):
+        self.scheduler.acquire(request.url)
+        return super().send(request, **kwargs)
+
+
+class HttpTransport:
+    """Factory for per-thread sessions with pooled adapters and a retry policy"""
+
+    def __init__(
+        self,
+        headers: Optional[Dict[str, str]] = None,
+        pool_connections: int = 32,
+        pool_maxsize: int = 16,
+        host_pool_sizes: Optional[Dict[str, int]] = None,
+        max_retries: int = 3,
+        backoff_factor: float = 0.5,
+        retry_statuses: Iterable[int] = RETRY_STATUSES,
+        host_rates: Optional[Dict[str, float]] = None,
+        default_host_rate: float = DEFAULT_HOST_RATE,
+        default_host_burst: float = DEFAULT_HOST_BURST,
+        scheduler: Optional[HostScheduler] = None,
+        max_workers: int = 16
+    ):
+        """
+        Args:
+            headers: Headers sent with every request (default: DEFAULT_HEADERS)
+            pool_connections: Number of per-host pools kept by the default adapter
+            pool_maxsize: Connections kept open per host
+            host_pool_sizes: Connections per host for specific hosts, e.g. {"www.linkedin.com": 4}
+            max_retries: Retries of idempotent requests on connection errors and retry_statuses
+            backoff_factor: Base of the exponential backoff between retries (seconds)
+            retry_statuses: HTTP statuses that are retried
+            host_rates: Requests per second for specific domains and their subdomains,
+                e.g. {"linkedin.com": 1.0} (default: rate_limiter.DEFAULT_HOST_RATES)
+            default_host_rate: Requests per second for each other host (0 = unlimited)
+            default_host_burst: Requests each other host may receive at once after being idle
+            scheduler: HostScheduler to share with another transport instead of
+                host_rates/default_host_rate/default_host_burst
+            max_workers: Threads of the shared pool used for concurrent requests
+                such as career path probes
+        """
+        self.headers = dict(DEFAULT_HEADERS if headers is None else headers)
+        self.pool_connections = pool_connections
+        self.pool_maxsize = pool_maxsize
+        self.host_pool_sizes = dict(host_pool_sizes or {})
+        self.scheduler = scheduler or HostScheduler(
+            host_rates, default_host_rate, default_burst=default_host_burst
+        )
+        self.retry = ThrottledRetry(
+            total=max_retries,
+            backoff_factor=backoff_factor,
+            status_forcelist=tuple(retry_statuses),
+            allowed_methods=IDEMPOTENT_METHODS,
+            respect_retry_after_header=True,
+            raise_on_status=False,
+            scheduler=self.scheduler
+        )
+        self._local = threading.local()
+        # (thread, session) pairs; sessions of exited threads are closed, see _close_dead_sessions
+        self._sessions: List[Tuple[weakref.ref, requests.Session]] = []
+        self._lock = threading.Lock()
+        self.max_workers = max_workers
+        self._executor: Optional[ThreadPoolExecutor] = None
+
+    @classmethod
+    def from_config(cls, config: Dict) -> "HttpTransport":
+        """Build a transport from a config dict with any of the constructor's keyword arguments"""
+        return cls(**config)
+
+    def _adapter(self, pool_maxsize: int) -> HTTPAdapter:
+        return ThrottledHTTPAdapter(
+            self.scheduler,
+            pool_connections=self.pool_connections,
+            pool_maxsize=pool_maxsize,
+            max_retries=self.retry
+        )
+
+    def _new_session(self) -> requests.Session:
+        session = requests.Session()
+        session.headers.update(self.headers)
+        session.mount("https://", self._adapter(self.pool_maxsize))
+        session.mount("http://", self._adapter(self.pool_maxsize))
+        # requests uses the longest matching prefix, so these win for their hosts
+        for host, size in self.host_pool_sizes.items():
+            session.mount(f"https://{host}", self._adapter(size))
+            session.mount(f"http://{host}", self._adapter(size))
+        return session
+
+    @property
+    def session(self) -> requests.Session:
+        """The calling thread's session (created on first use)"""
+        session = getattr(self._local, "session", None)
+        if session is None:
+            session = self._new_session()
+            self._local.session = session
+            with self._lock:
+                self._close_dead_sessions()
+                self._sessions.append((weakref.ref(threading.current_thread()), session))
+        return session
+
+    def _close_dead_sessions(self) -> None:
+        """Close the sessions (and connection pools) of threads that have exited; needs self._lock"""
+        alive = []
+        for thread_ref, session in self._sessions:
+            thread = thread_ref()
+            if thread is not None and thread.is_alive():
+                alive.append((thread_ref, session))
+            else:
+                session.close()
+        self._sessions = alive
+
+    @property
+    def executor(self) -> ThreadPoolExecutor:
+        """Long-lived worker pool for requests sent concurrently (created on first use)"""
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="http")
+            return self._executor
+
+    def close(self) -> None:
+        """Stop the worker pool and close every session created by this transport"""
+        with self._lock:
+            executor, self._executor = self._executor, None
+            sessions, self._sessions = self._sessions, []
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+        for _, session in sessions:
+            session.close()
+        self._local = threading.local()
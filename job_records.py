@@ -0,0 +1,226 @@
+"""
+Job record helpers shared by the job source agents.
+
+Every discovery source returns jobs in its own shape (Scrapin raw dicts,
+SerpAPI's `link`, PhantomBuster's `output` rows, guest search cards).
+These helpers normalize them into one record shape and deduplicate them
+by LinkedIn job ID.
+"""
+
+import json
+import logging
+import os
+import re
+import threading
+from datetime import datetime
+from typing import Optional, Dict, List, Set, Iterable, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Matches /jobs/view/123/, /jobs/view/title-at-company-123/ and ?currentJobId=123.
+# The ID is the last run of digits in the path segment, so digits in the title
+# slug ("python-3-developer-at-web3-co-4012345678") are skipped.
+JOB_ID_PATTERN = re.compile(r"/jobs/view/(?:[^/?#]*-)?(\d+)(?=[/?#]|$)|[?&]currentJobId=(\d+)")
+
+# Candidate keys for each normalized field, in order of preference
+FIELD_ALIASES = {
+    "job_url": ["job_url", "link", "url", "jobUrl", "job_link", "jobLink", "linkedinUrl", "linkedin_url"],
+    "job_id": ["job_id", "jobId", "id"],
+    "title": ["title", "job_title", "jobTitle", "position"],
+    "company_name": ["company_name", "companyName", "company"],
+    "location": ["location", "job_location", "jobLocation"],
+    "date_posted": ["date_posted", "datePosted", "posted_at", "postedAt", "date"],
+}
+
+
+def extract_linkedin_job_id(url: Optional[str]) -> Optional[str]:
+    """
+    Extract the numeric LinkedIn job ID from a job URL
+
+    >>> extract_linkedin_job_id("https://www.linkedin.com/jobs/view/3812345678/")
+    '3812345678'
+    >>> extract_linkedin_job_id("https://www.linkedin.com/jobs/view/engineer-2-at-acme-3812345678")
+    '3812345678'
+    >>> extract_linkedin_job_id("https://www.linkedin.com/jobs/view/python-3-developer-at-web3-co-4012345678?trk=x")
+    '4012345678'
+    >>> extract_linkedin_job_id("https://www.linkedin.com/jobs/view/2024-intern-at-acme-123#top")
+    '123'
+    >>> extract_linkedin_job_id("https://www.linkedin.com/jobs/search/?currentJobId=555&keywords=x")
+    '555'
+    >>> extract_linkedin_job_id("https://www.linkedin.com/jobs/view/engineer-at-acme/") is None
+    True
+    """
+    if not url:
+        return None
+    match = JOB_ID_PATTERN.search(url)
+    if not match:
+        return None
+    return match.group(1) or match.group(2)
+
+
+def _first_value(job: Dict, keys: List[str]):
+    for key in keys:
+        value = job.get(key)
+        if value:
+            return value
+    return None
+
+
+def normalize_job(job: Dict, source: str) -> Dict:
+    """
+    Normalize a raw job dict from any discovery source
+
+    Returns:
+        Dict with job_url, job_id, title, company_name, location, date_posted, source
+    """
+    record = {field: _first_value(job, keys) for field, keys in FIELD_ALIASES.items()}
+
+    # Nested company objects ({"company": {"name": ...}})
+    if isinstance(record["company_name"], dict):
+        record["company_name"] = record["company_name"].get("name")
+
+    if record["job_url"] and not str(record["job_url"]).startswith("http"):
+        record["job_url"] = "https://www.linkedin.com" + record["job_url"]
+
+    url_job_id = extract_linkedin_job_id(record["job_url"])
+    if url_job_id:
+        record["job_id"] = url_job_id
+    elif record["job_id"] is not None:
+        record["job_id"] = str(record["job_id"])
+
+    record["source"] = job.get("source") or source
+    return record
+
+
+def job_key(job: Dict) -> Optional[str]:
+    """
+    Deduplication key: LinkedIn job ID, falling back to the URL without query string
+
+    Also the key SeenJobStore remembers, so postings whose titles share
+    digits must not collide:
+
+    >>> job_key({"job_url": "https://www.linkedin.com/jobs/view/engineer-2-at-acme-3812345678"})
+    '3812345678'
+    >>> job_key({"job_url": "https://www.linkedin.com/jobs/view/engineer-2-at-globex-3812345999"})
+    '3812345999'
+    """
+    job_id = job.get("job_id") or extract_linkedin_job_id(job.get("job_url"))
+    if job_id:
+        return str(job_id)
+    job_url = job.get("job_url")
+    if job_url:
+        return job_url.split("?")[0].rstrip("/").lower()
+    return None
+
+
+def unique_queries(queries: Iterable[Tuple[str, str]]) -> List[Tuple[str, str]]:
+    """
+    (keyword, location) queries in order, each kept once
+
+    A repeated query would be fetched twice and its per-query yield reported
+    as 0 unique on the second pass:
+
+    >>> unique_queries([("a", "x"), ("b", "y"), ("a", "x")])
+    [('a', 'x'), ('b', 'y')]
+    """
+    return list(dict.fromkeys(queries))
+
+
+class JobIndex:
+    """Hash index of job records keyed by LinkedIn job ID, preserving insertion order"""
+
+    def __init__(self):
+        self._jobs: Dict[str, Dict] = {}
+
+    def add(self, job: Dict) -> bool:
+        """
+        Add a job record
+
+        Returns:
+            True if the job was new, False if it was a duplicate (missing fields
+            of the stored record are filled in from the duplicate) or had no key
+        """
+        key = job_key(job)
+        if key is None:
+            return False
+
+        existing = self._jobs.get(key)
+        if existing is None:
+            self._jobs[key] = job
+            return True
+
+        for field, value in job.items():
+            if value and not existing.get(field):
+                existing[field] = value
+        return False
+
+    def __contains__(self, job_id: str) -> bool:
+        return job_id in self._jobs
+
+    def __len__(self) -> int:
+        return len(self._jobs)
+
+    def jobs(self) -> List[Dict]:
+        """All unique job records in insertion order"""
+        return list(self._jobs.values())
+
+
+class SeenJobStore:
+    """
+    Persistent set of already-discovered job keys per (keyword, location)
+
+    Stored as a JSON file so incremental runs can skip postings handled
+    by earlier runs.
+    """
+
+    def __init__(self, path: str = "seen_jobs.json", max_ids_per_query: int = 10000):
+        """
+        Args:
+            path: JSON file used to persist seen job keys
+            max_ids_per_query: Oldest keys beyond this many are forgotten
+        """
+        self.path = path
+        self.max_ids_per_query = max_ids_per_query
+        self._queries: Dict[str, Dict] = {}
+        self._lock = threading.Lock()
+        self._load()
+
+    @staticmethod
+    def _query_key(keyword: str, location: str) -> str:
+        return f"{keyword.strip().lower()}|{location.strip().lower()}"
+
+    def _load(self) -> None:
+        if not os.path.exists(self.path):
+            return
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                self._queries = json.load(f)
+        except (OSError, ValueError) as e:
+            logger.warning(f"⚠️  Could not read seen jobs from {self.path}: {e}")
+            self._queries = {}
+
+    def ids(self, keyword: str, location: str) -> Set[str]:
+        """Job keys already seen for this query"""
+        with self._lock:
+            entry = self._queries.get(self._query_key(keyword, location), {})
+            return set(entry.get("ids", []))
+
+    def add(self, keyword: str, location: str, job_keys: Iterable[str]) -> None:
+        """Record job keys as seen for this query"""
+        with self._lock:
+            entry = self._queries.setdefault(self._query_key(keyword, location), {"ids": []})
+            known = set(entry["ids"])
+            for key in job_keys:
+                if key and key not in known:
+                    entry["ids"].append(key)
+                    known.add(key)
+            entry["ids"] = entry["ids"][-self.max_ids_per_query:]
+            entry["updated_at"] = datetime.now().isoformat()
+
+    def save(self) -> None:
+        """Write the store to disk atomically"""
+        with self._lock:
+            tmp_path = f"{self.path}.tmp"
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(self._queries, f)
+            os.replace(tmp_path, self.path)
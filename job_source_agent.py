@@ -18,11 +18,26 @@ Step 5: Store in Postgres
 
 import requests
 import logging
-from typing import Optional, Dict, List, Tuple
+from typing import Optional, Dict, List, Set, Tuple, Callable, Iterator
 from bs4 import BeautifulSoup
 from urllib.parse import urljoin, urlparse, quote_plus
 import re
 import time
+import json
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor, FIRST_COMPLETED, as_completed, wait
+
+from circuit_breaker import CircuitBreaker
+from discovery_cache import DiscoveryCache
+from http_transport import HttpTransport
+from html_parsing import ANCHOR_STRAINER, DEFAULT_HTML_PARSER, resolve_html_parser
+from keyword_matcher import KeywordMatcher
+from link_ranking import LINK_REGION_STRAINER, rank_links
+from page_fetch import DEFAULT_MAX_PAGE_BYTES, anchor_href_check, fetch_page
+from page_cache import PageCache
+from path_probe import COMMON_CAREER_PATHS, probe_paths
+from http_cache import HttpCache
+from job_records import JobIndex, normalize_job
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -35,13 +50,44 @@ JOB_KEYWORDS = ["job", "opening", "position", "role", "vacancy", "apply"]
 class JobSourceAgent:
     """Autonomous agent with multi-source failover for job discovery"""
     
+    # Career page candidates tried per company before giving up on finding a job posting
+    MAX_CAREER_CANDIDATES = 3
+    
+    # Seconds to wait on a source before hedging with the next one
+    DEFAULT_LATENCY_BUDGETS = {
+        "scrapin": 5.0,
+        "serpapi": 5.0,
+        "phantombuster": 15.0,
+        "direct_scraping": 10.0
+    }
+    
+    # Seconds after which a successful source call still counts as a breaker failure;
+    # PhantomBuster runs legitimately take minutes, so it has no slow-call rule
+    DEFAULT_SLOW_CALL_SECONDS = {
+        "scrapin": 20.0,
+        "serpapi": 20.0,
+        "direct_scraping": 20.0
+    }
+    
     def __init__(
         self,
         scrapin_api_key: str,
         serpapi_key: Optional[str] = None,
         phantombuster_key: Optional[str] = None,
         phantombuster_agent_id: Optional[str] = None,
-        postgres_config: Optional[Dict] = None
+        postgres_config: Optional[Dict] = None,
+        breaker_failure_threshold: int = 3,
+        breaker_cooldown: float = 300.0,
+        breaker_slow_call_seconds: Optional[Dict[str, Optional[float]]] = None,
+        discovery_cache_config: Optional[Dict] = None,
+        html_parser: str = DEFAULT_HTML_PARSER,
+        extra_career_keywords: Optional[List[str]] = None,
+        extra_job_keywords: Optional[List[str]] = None,
+        max_page_bytes: Optional[Dict[str, int]] = None,
+        http_cache_config: Optional[Dict] = None,
+        transport: Optional[HttpTransport] = None,
+        transport_config: Optional[Dict] = None,
+        career_paths: Optional[List[str]] = None
     ):
         """
         Initialize the Job Source Agent with multi-source support
@@ -52,6 +98,25 @@ class JobSourceAgent:
             phantombuster_key: Optional API key for PhantomBuster (fallback 2)
             phantombuster_agent_id: Optional PhantomBuster agent ID for scheduled exports
             postgres_config: Optional dict with Postgres connection details
+            breaker_failure_threshold: Consecutive failures before a discovery source is skipped
+            breaker_cooldown: Seconds a failing source is skipped before it is probed again
+            breaker_slow_call_seconds: Optional per-source seconds after which a call
+                counts as a failure, None for no limit (defaults to DEFAULT_SLOW_CALL_SECONDS)
+            discovery_cache_config: Optional dict (directory, ttl, max_mb) enabling the
+                on-disk cache of discovery results
+            html_parser: BeautifulSoup parser backend ("lxml", "html.parser", "html5lib")
+            extra_career_keywords: Keywords added to CAREER_KEYWORDS (e.g. localized "karriere")
+            extra_job_keywords: Keywords added to JOB_KEYWORDS (e.g. localized "empleo")
+            max_page_bytes: Per-stage byte caps for page downloads ("linkedin", "homepage",
+                "career_page"), overriding DEFAULT_MAX_PAGE_BYTES
+            http_cache_config: Optional dict (directory, max_age, max_mb) enabling the
+                on-disk conditional-GET cache of company homepages and career pages
+            transport: Optional HttpTransport to share (per-thread sessions, host rates) with other agents
+            transport_config: Optional dict of HttpTransport settings (pool sizes,
+                host_pool_sizes, max_retries, backoff_factor, host_rates,
+                default_host_rate), used when no transport is given
+            career_paths: Paths probed when no homepage link looks like a career page,
+                most preferred first (default: path_probe.COMMON_CAREER_PATHS)
         """
         self.scrapin_key = scrapin_api_key
         self.serpapi_key = serpapi_key
@@ -59,10 +124,71 @@ class JobSourceAgent:
         self.phantombuster_agent_id = phantombuster_agent_id
         self.postgres_config = postgres_config
         
-        self.session = requests.Session()
-        self.session.headers.update({
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
-        })
+        # Pooled per-thread sessions with retry/backoff for every HTTP call, see http_transport.py
+        self._owns_transport = transport is None
+        self.transport = transport or HttpTransport.from_config(transport_config or {})
+        
+        # Latency (seconds) of each source queried by the last discovery call
+        self.source_latencies: Dict[str, float] = {}
+        # Sources still running when the last hedged/race call returned; their
+        # entry in source_latencies is only a lower bound
+        self.unfinished_sources: Set[str] = set()
+        
+        # One circuit breaker per discovery source, see circuit_breaker_status()
+        slow_call_seconds = dict(self.DEFAULT_SLOW_CALL_SECONDS)
+        if breaker_slow_call_seconds:
+            slow_call_seconds.update(breaker_slow_call_seconds)
+        self.circuit_breakers = {
+            name: CircuitBreaker(
+                name,
+                failure_threshold=breaker_failure_threshold,
+                cooldown=breaker_cooldown,
+                slow_call_seconds=slow_call_seconds.get(name)
+            )
+            for name in ("scrapin", "serpapi", "phantombuster", "direct_scraping")
+        }
+        self._source_call = threading.local()
+        
+        # Background workers for non-blocking PhantomBuster runs, and each run's stop signal
+        self._background_executor: Optional[ThreadPoolExecutor] = None
+        self._phantom_stops: Dict[Future, threading.Event] = {}
+        
+        # Cached discovery pages per (source, keyword, location, offset), see discovery_cache.py
+        self.discovery_cache = DiscoveryCache.from_config(discovery_cache_config) if discovery_cache_config else None
+        
+        # BeautifulSoup backend for every page parse (falls back to html.parser if missing)
+        self.html_parser = resolve_html_parser(html_parser)
+        
+        # Compiled matchers for career-page and job-link keywords
+        self.career_matcher = KeywordMatcher(CAREER_KEYWORDS + list(extra_career_keywords or []))
+        self.job_matcher = KeywordMatcher(JOB_KEYWORDS + list(extra_job_keywords or []))
+        
+        # Page downloads are streamed and cut off at these sizes, see page_fetch.py
+        self.max_page_bytes = {**DEFAULT_MAX_PAGE_BYTES, **(max_page_bytes or {})}
+        
+        # Pages fetched during the current run, so each URL is downloaded and parsed once
+        self.page_cache = PageCache()
+        
+        # Homepages and career pages kept across runs and revalidated with ETag / Last-Modified
+        self.http_cache = HttpCache.from_config(http_cache_config) if http_cache_config else None
+        
+        # Fallback paths probed concurrently with HEAD requests, see path_probe.py
+        self.career_paths = list(COMMON_CAREER_PATHS if career_paths is None else career_paths)
+    
+    @property
+    def session(self) -> requests.Session:
+        """The calling thread's pooled session"""
+        return self.transport.session
+    
+    def close(self) -> None:
+        """Stop background PhantomBuster workers and close the HTTP transport (unless shared)"""
+        for run in list(self._phantom_stops):
+            self.cancel_phantombuster_search(run)
+        if self._background_executor is not None:
+            self._background_executor.shutdown(wait=False, cancel_futures=True)
+            self._background_executor = None
+        if self._owns_transport:
+            self.transport.close()
     
     # ==================== STEP 1: MULTI-SOURCE JOB DISCOVERY ====================
     
@@ -70,52 +196,130 @@ class JobSourceAgent:
         self,
         keyword: str = "software engineer",
         location: str = "United States",
-        limit: int = 100
+        limit: int = 100,
+        page_size: int = 100,
+        concurrency: int = 4
     ) -> List[Dict]:
         """
         PRIMARY: Scrapin Job Search API (BEST, MOST RELIABLE)
         
+        Collects iter_job_listings_scrapin into a list.
+        
         Args:
             keyword: Job search keyword
             location: Job location
-            limit: Maximum results per request
+            limit: Maximum results in total
+            page_size: Maximum results per request
+            concurrency: Number of pages requested in parallel
             
         Returns:
             List of job dictionaries with job_url, company_name, etc.
         """
-        try:
-            endpoint = "https://api.scrapin.io/linkedin/search/jobs"
-            params = {
-                "keyword": keyword,
-                "location": location,
-                "limit": limit,
-                "apikey": self.scrapin_key
-            }
-            
-            logger.info(f"🔍 [Scrapin] Discovering job listings for: {keyword} in {location}")
-            res = self.session.get(endpoint, params=params, timeout=30)
-            res.raise_for_status()
-            
-            data = res.json()
-            jobs = []
-            
-            # Scrapin returns jobs with full details
-            if isinstance(data, list):
-                jobs = data
-            elif isinstance(data, dict) and "jobs" in data:
-                jobs = data["jobs"]
-            elif isinstance(data, dict) and "results" in data:
-                jobs = data["results"]
-            
-            logger.info(f"✅ [Scrapin] Found {len(jobs)} job listings")
-            return jobs
-            
-        except requests.exceptions.RequestException as e:
-            logger.error(f"❌ [Scrapin] Error: {e}")
-            return []
-        except Exception as e:
-            logger.error(f"❌ [Scrapin] Unexpected error: {e}")
-            return []
+        return list(self.iter_job_listings_scrapin(keyword, location, limit, page_size, concurrency))
+    
+    def iter_job_listings_scrapin(
+        self,
+        keyword: str = "software engineer",
+        location: str = "United States",
+        limit: int = 100,
+        page_size: int = 100,
+        concurrency: int = 4
+    ) -> Iterator[Dict]:
+        """
+        Streaming variant of discover_job_listings_scrapin
+        
+        Results are paged by offset. Up to `concurrency` pages are in flight at
+        once and each page's jobs are yielded as soon as it arrives. A failed
+        page is retried on its own; pages that already arrived are kept.
+        """
+        logger.info(f"🔍 [Scrapin] Discovering job listings for: {keyword} in {location}")
+        
+        page_size = max(1, min(page_size, limit))
+        offsets = list(range(0, limit, page_size))
+        found = 0
+        failed_pages = 0
+        
+        with ThreadPoolExecutor(max_workers=max(1, concurrency)) as executor:
+            for window_start in range(0, len(offsets), max(1, concurrency)):
+                window = offsets[window_start:window_start + max(1, concurrency)]
+                futures = {
+                    executor.submit(
+                        self._fetch_scrapin_page, keyword, location, offset,
+                        min(page_size, limit - offset)
+                    ): offset
+                    for offset in window
+                }
+                
+                reached_end = False
+                for future in as_completed(futures):
+                    offset = futures[future]
+                    try:
+                        jobs = future.result()
+                    except requests.exceptions.RequestException as e:
+                        logger.error(f"❌ [Scrapin] Error on page at offset {offset}: {e}")
+                        failed_pages += 1
+                        continue
+                    except Exception as e:
+                        logger.error(f"❌ [Scrapin] Unexpected error on page at offset {offset}: {e}")
+                        failed_pages += 1
+                        continue
+                    
+                    found += len(jobs)
+                    yield from jobs
+                    
+                    # A short page means there is nothing after it
+                    if len(jobs) < min(page_size, limit - offset):
+                        reached_end = True
+                
+                if reached_end:
+                    break
+        
+        if failed_pages and not found:
+            self._record_source_error()
+        
+        logger.info(f"✅ [Scrapin] Found {found} job listings" + (f" ({failed_pages} pages failed)" if failed_pages else ""))
+    
+    def _fetch_scrapin_page(
+        self,
+        keyword: str,
+        location: str,
+        offset: int,
+        page_size: int
+    ) -> List[Dict]:
+        """
+        Fetch one page of Scrapin job search results (transient failures are
+        retried by the HTTP transport)
+        """
+        cache_source = f"scrapin/{page_size}"
+        cached = self._cached_jobs(cache_source, keyword, location, offset)
+        if cached is not None:
+            return cached
+        
+        endpoint = "https://api.scrapin.io/linkedin/search/jobs"
+        params = {
+            "keyword": keyword,
+            "location": location,
+            "limit": page_size,
+            "offset": offset,
+            "apikey": self.scrapin_key
+        }
+        
+        res = self.session.get(endpoint, params=params, timeout=30)
+        res.raise_for_status()
+        
+        data = res.json()
+        
+        # Scrapin returns jobs with full details
+        jobs = []
+        if isinstance(data, list):
+            jobs = data
+        elif isinstance(data, dict) and "jobs" in data:
+            jobs = data["jobs"]
+        elif isinstance(data, dict) and "results" in data:
+            jobs = data["results"]
+        
+        self._cache_jobs(cache_source, keyword, location, offset, jobs)
+        return jobs
     
     def discover_job_listings_serpapi(
         self,
@@ -125,6 +329,8 @@ class JobSourceAgent:
         """
         FALLBACK 1: SerpAPI LinkedIn Jobs Search
         
+        Collects iter_job_listings_serpapi into a list.
+        
         Args:
             keyword: Job search keyword
             location: Job location
@@ -132,9 +338,22 @@ class JobSourceAgent:
         Returns:
             List of job dictionaries
         """
+        return list(self.iter_job_listings_serpapi(keyword, location))
+    
+    def iter_job_listings_serpapi(
+        self,
+        keyword: str = "software engineer",
+        location: str = "United States"
+    ) -> Iterator[Dict]:
+        """Streaming variant of discover_job_listings_serpapi: yields jobs as they are parsed"""
         if not self.serpapi_key:
             logger.warning("⚠️  [SerpAPI] Key not provided, skipping")
-            return []
+            return
+        
+        cached = self._cached_jobs("serpapi", keyword, location)
+        if cached is not None:
+            yield from cached
+            return
         
         try:
             url = "https://serpapi.com/search"
@@ -164,14 +383,15 @@ class JobSourceAgent:
                     })
             
             logger.info(f"✅ [SerpAPI] Found {len(jobs)} job listings")
-            return jobs
+            self._cache_jobs("serpapi", keyword, location, 0, jobs)
+            yield from jobs
             
         except requests.exceptions.RequestException as e:
             logger.error(f"❌ [SerpAPI] Error: {e}")
-            return []
+            self._record_source_error()
         except Exception as e:
             logger.error(f"❌ [SerpAPI] Unexpected error: {e}")
-            return []
+            self._record_source_error()
     
     def discover_job_listings_phantombuster(
         self,
@@ -181,6 +401,8 @@ class JobSourceAgent:
         """
         FALLBACK 2: PhantomBuster LinkedIn Job Search
         
+        Collects iter_job_listings_phantombuster into a list.
+        
         Args:
             keyword: Job search keyword
             location: Job location
@@ -188,9 +410,22 @@ class JobSourceAgent:
         Returns:
             List of job dictionaries
         """
+        return list(self.iter_job_listings_phantombuster(keyword, location))
+    
+    def iter_job_listings_phantombuster(
+        self,
+        keyword: str = "software engineer",
+        location: str = "United States"
+    ) -> Iterator[Dict]:
+        """Streaming variant of discover_job_listings_phantombuster: yields jobs as they are parsed"""
         if not self.phantombuster_key or not self.phantombuster_agent_id:
             logger.warning("⚠️  [PhantomBuster] Key or Agent ID not provided, skipping")
-            return []
+            return
+        
+        cached = self._cached_jobs("phantombuster", keyword, location)
+        if cached is not None:
+            yield from cached
+            return
         
         try:
             # Option 1: Trigger agent run
@@ -218,14 +453,181 @@ class JobSourceAgent:
                 jobs = data["output"]
             
             logger.info(f"✅ [PhantomBuster] Found {len(jobs)} job listings")
-            return jobs
+            self._cache_jobs("phantombuster", keyword, location, 0, jobs)
+            yield from jobs
             
         except requests.exceptions.RequestException as e:
             logger.error(f"❌ [PhantomBuster] Error: {e}")
-            return []
+            self._record_source_error()
         except Exception as e:
             logger.error(f"❌ [PhantomBuster] Unexpected error: {e}")
-            return []
+            self._record_source_error()
+    
+    def launch_phantombuster_search(
+        self,
+        keyword: str = "software engineer",
+        location: str = "United States"
+    ) -> Optional[str]:
+        """
+        Launch the PhantomBuster agent without waiting for it to finish
+        
+        Args:
+            keyword: Job search keyword
+            location: Job location
+            
+        Returns:
+            Container ID of the launched run (pass to poll_phantombuster_results), or None on error
+        """
+        if not self.phantombuster_key or not self.phantombuster_agent_id:
+            logger.warning("⚠️  [PhantomBuster] Key or Agent ID not provided, skipping")
+            return None
+        
+        try:
+            launch_url = "https://api.phantombuster.com/api/v2/agents/launch"
+            payload = {
+                "id": self.phantombuster_agent_id,
+                "argument": {
+                    "searchQuery": keyword,
+                    "location": location
+                }
+            }
+            headers = {"X-Phantombuster-Key": self.phantombuster_key}
+            
+            logger.info(f"🚀 [PhantomBuster] Launching agent for: {keyword}")
+            res = self.session.post(launch_url, json=payload, headers=headers, timeout=15)
+            res.raise_for_status()
+            
+            container_id = res.json().get("containerId")
+            if not container_id:
+                logger.error("❌ [PhantomBuster] Launch response has no containerId")
+                return None
+            
+            logger.info(f"✅ [PhantomBuster] Launched container {container_id}")
+            return str(container_id)
+            
+        except requests.exceptions.RequestException as e:
+            logger.error(f"❌ [PhantomBuster] Launch error: {e}")
+            return None
+        except Exception as e:
+            logger.error(f"❌ [PhantomBuster] Unexpected launch error: {e}")
+            return None
+    
+    def poll_phantombuster_results(
+        self,
+        container_id: str,
+        timeout: float = 600.0,
+        initial_delay: float = 2.0,
+        max_delay: float = 60.0,
+        stop: Optional[threading.Event] = None
+    ) -> List[Dict]:
+        """
+        Poll a launched PhantomBuster run until it finishes, backing off exponentially
+        
+        Args:
+            container_id: Container ID returned by launch_phantombuster_search
+            timeout: Seconds to wait for the run before giving up
+            initial_delay: First delay between polls
+            max_delay: Maximum delay between polls
+            stop: Optional event that ends polling early (the results are no longer needed)
+            
+        Returns:
+            List of job dictionaries (empty if the run failed, timed out or was stopped)
+        """
+        headers = {"X-Phantombuster-Key": self.phantombuster_key}
+        deadline = time.monotonic() + timeout
+        delay = initial_delay
+        stop = stop or threading.Event()
+        
+        while not stop.is_set():
+            try:
+                res = self.session.get(
+                    "https://api.phantombuster.com/api/v2/containers/fetch",
+                    params={"id": container_id}, headers=headers, timeout=15
+                )
+                res.raise_for_status()
+                status = res.json().get("status")
+                
+                if status == "finished":
+                    res = self.session.get(
+                        "https://api.phantombuster.com/api/v2/containers/fetch-result-object",
+                        params={"id": container_id}, headers=headers, timeout=30
+                    )
+                    res.raise_for_status()
+                    result_object = res.json().get("resultObject")
+                    jobs = json.loads(result_object) if isinstance(result_object, str) else result_object
+                    jobs = jobs if isinstance(jobs, list) else []
+                    logger.info(f"✅ [PhantomBuster] Container {container_id} finished: {len(jobs)} job listings")
+                    return jobs
+                
+                logger.debug(f"[PhantomBuster] Container {container_id} status: {status}")
+                
+            except requests.exceptions.RequestException as e:
+                logger.warning(f"⚠️  [PhantomBuster] Poll error (will retry): {e}")
+            except ValueError as e:
+                logger.error(f"❌ [PhantomBuster] Could not parse results: {e}")
+                return []
+            
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                logger.error(f"❌ [PhantomBuster] Container {container_id} did not finish within {timeout:.0f}s")
+                return []
+            
+            stop.wait(min(delay, remaining))
+            delay = min(delay * 2, max_delay)
+        
+        logger.info(f"🛑 [PhantomBuster] Stopped polling container {container_id}")
+        return []
+    
+    def start_phantombuster_search(
+        self,
+        keyword: str = "software engineer",
+        location: str = "United States",
+        timeout: float = 600.0
+    ) -> Future:
+        """
+        Non-blocking PhantomBuster search
+        
+        Launches the agent and polls for its output on a background thread, so
+        other discovery and enrichment work keeps running meanwhile.
+        
+        Args:
+            keyword: Job search keyword
+            location: Job location
+            timeout: Seconds to wait for the run before giving up
+            
+        Returns:
+            Future (the run handle) resolving to the list of job dictionaries;
+            pass it to cancel_phantombuster_search if the results are not needed
+        """
+        stop = threading.Event()
+        
+        def launch_and_poll() -> List[Dict]:
+            cached = self._cached_jobs("phantombuster", keyword, location)
+            if cached is not None:
+                return cached
+            
+            container_id = self.launch_phantombuster_search(keyword, location) if not stop.is_set() else None
+            if not container_id:
+                return []
+            jobs = self.poll_phantombuster_results(container_id, timeout=timeout, stop=stop)
+            # Failed, timed-out and stopped runs also come back empty, so only real results are cached
+            if jobs:
+                self._cache_jobs("phantombuster", keyword, location, 0, jobs)
+            return jobs
+        
+        if self._background_executor is None:
+            self._background_executor = ThreadPoolExecutor(max_workers=4)
+        run = self._background_executor.submit(launch_and_poll)
+        self._phantom_stops[run] = stop
+        run.add_done_callback(lambda done: self._phantom_stops.pop(done, None))
+        return run
+    
+    def cancel_phantombuster_search(self, run: Future) -> None:
+        """Stop a run started by start_phantombuster_search (it resolves to an empty list)"""
+        stop = self._phantom_stops.pop(run, None)
+        if stop is not None:
+            stop.set()
+        run.cancel()
     
     def discover_job_listings_direct_scraping(
         self,
@@ -238,6 +640,8 @@ class JobSourceAgent:
         WARNING: LinkedIn blocks headless browsers. This is fragile.
         Use only as last resort fallback.
         
+        Collects iter_job_listings_direct_scraping into a list.
+        
         Args:
             keyword: Job search keyword
             location: Job location
@@ -245,6 +649,19 @@ class JobSourceAgent:
         Returns:
             List of job dictionaries
         """
+        return list(self.iter_job_listings_direct_scraping(keyword, location))
+    
+    def iter_job_listings_direct_scraping(
+        self,
+        keyword: str = "software engineer",
+        location: str = "United States"
+    ) -> Iterator[Dict]:
+        """Streaming variant of discover_job_listings_direct_scraping: yields jobs as they are parsed"""
+        cached = self._cached_jobs("direct_scraping", keyword, location)
+        if cached is not None:
+            yield from cached
+            return
+        
         try:
             # Build LinkedIn search URL
             search_url = f"https://www.linkedin.com/jobs/search/?keywords={quote_plus(keyword)}&location={quote_plus(location)}"
@@ -252,14 +669,15 @@ class JobSourceAgent:
             logger.info(f"🔍 [Direct Scraping] Attempting to scrape: {search_url}")
             logger.warning("⚠️  [Direct Scraping] This method is brittle and may be blocked by LinkedIn")
             
-            res = self.session.get(search_url, timeout=15, allow_redirects=True)
+            res = fetch_page(self.session, search_url, self.max_page_bytes["linkedin"], timeout=15, allow_redirects=True)
             
             # LinkedIn often returns login page or blocks requests
             if "login" in res.url.lower() or res.status_code != 200:
                 logger.error("❌ [Direct Scraping] Blocked by LinkedIn (login required or rate limited)")
-                return []
+                self._record_source_error()
+                return
             
-            soup = BeautifulSoup(res.text, "html.parser")
+            soup = BeautifulSoup(res.text, self.html_parser)
             jobs = []
             
             # Try to find job listings in HTML (structure may change)
@@ -284,20 +702,120 @@ class JobSourceAgent:
                     continue
             
             logger.info(f"✅ [Direct Scraping] Found {len(jobs)} job listings (may be incomplete)")
-            return jobs
+            self._cache_jobs("direct_scraping", keyword, location, 0, jobs)
+            yield from jobs
             
         except requests.exceptions.RequestException as e:
             logger.error(f"❌ [Direct Scraping] Error: {e}")
-            return []
+            self._record_source_error()
         except Exception as e:
             logger.error(f"❌ [Direct Scraping] Unexpected error: {e}")
+            self._record_source_error()
+    
+    def _cached_jobs(self, source: str, keyword: str, location: str, offset: int = 0) -> Optional[List[Dict]]:
+        """Jobs cached for this discovery page, or None if caching is off or the entry is missing/expired"""
+        if self.discovery_cache is None:
+            return None
+        return self.discovery_cache.get(source, keyword, location, offset)
+    
+    def _cache_jobs(self, source: str, keyword: str, location: str, offset: int, jobs: List[Dict]) -> None:
+        """Store the jobs of one discovery page if caching is on"""
+        if self.discovery_cache is not None:
+            self.discovery_cache.set(source, keyword, location, offset, jobs)
+    
+    def _discovery_sources(
+        self,
+        keyword: str,
+        location: str,
+        limit: int,
+        exclude_sources: Optional[List[str]] = None
+    ) -> List[Tuple[str, Callable[[], List[Dict]]]]:
+        """Configured discovery sources in failover preference order"""
+        sources = [("scrapin", lambda: self.discover_job_listings_scrapin(keyword, location, limit))]
+        if self.serpapi_key:
+            sources.append(("serpapi", lambda: self.discover_job_listings_serpapi(keyword, location)))
+        if self.phantombuster_key and self.phantombuster_agent_id:
+            sources.append(("phantombuster", lambda: self.discover_job_listings_phantombuster(keyword, location)))
+        sources.append(("direct_scraping", lambda: self.discover_job_listings_direct_scraping(keyword, location)))
+        return [(name, fetch) for name, fetch in sources if name not in (exclude_sources or [])]
+    
+    def _timed_source_call(
+        self,
+        name: str,
+        fetch: Callable[[], List[Dict]],
+        latencies: Dict[str, float]
+    ) -> List[Dict]:
+        """
+        Run one discovery source through its circuit breaker and record its
+        latency in `latencies`. Returns [] without calling the source while its
+        circuit is open.
+        """
+        breaker = self.circuit_breakers[name]
+        if not breaker.allow_request():
+            logger.warning(f"⏭️  [{name}] Circuit open, skipping source")
             return []
+        
+        self._source_call.failed = False
+        started = time.monotonic()
+        try:
+            return fetch()
+        except Exception:
+            self._source_call.failed = True
+            raise
+        finally:
+            latency = time.monotonic() - started
+            latencies[name] = latency
+            if self._source_call.failed:
+                breaker.record_failure(latency)
+            else:
+                breaker.record_success(latency)
+    
+    def _guarded_source_iter(self, name: str, make_jobs: Callable[[], Iterator[Dict]]) -> Iterator[Dict]:
+        """
+        Streaming counterpart of _timed_source_call. Latency is measured up to
+        the first job (or the end of an empty stream), so time the consumer
+        spends between jobs doesn't count against the source.
+        """
+        breaker = self.circuit_breakers[name]
+        if not breaker.allow_request():
+            logger.warning(f"⏭️  [{name}] Circuit open, skipping source")
+            return
+        
+        self._source_call.failed = False
+        started = time.monotonic()
+        latency = None
+        try:
+            for job in make_jobs():
+                if latency is None:
+                    latency = time.monotonic() - started
+                yield job
+        except Exception:
+            self._source_call.failed = True
+            raise
+        finally:
+            if latency is None:
+                latency = time.monotonic() - started
+            if self._source_call.failed:
+                breaker.record_failure(latency)
+            else:
+                breaker.record_success(latency)
+    
+    def _record_source_error(self) -> None:
+        """Mark the discovery source running on this thread as failed for its circuit breaker"""
+        self._source_call.failed = True
+    
+    def circuit_breaker_status(self) -> Dict[str, Dict]:
+        """State and recent failure/latency stats of each discovery source's circuit breaker"""
+        return {name: breaker.status() for name, breaker in self.circuit_breakers.items()}
     
     def discover_job_listings_with_failover(
         self,
         keyword: str = "software engineer",
         location: str = "United States",
-        limit: int = 100
+        limit: int = 100,
+        strategy: str = "sequential",
+        latency_budgets: Optional[Dict[str, float]] = None,
+        exclude_sources: Optional[List[str]] = None
     ) -> List[Dict]:
         """
         HYBRID MULTI-SOURCE DISCOVERY WITH FAILOVER
@@ -308,41 +826,90 @@ class JobSourceAgent:
         3. PhantomBuster (fallback 2)
         4. Direct scraping (last resort)
         
+        Strategies:
+        - "sequential": wait for each source to finish before trying the next
+        - "hedged": launch the next source as soon as the running one exceeds
+          its latency budget (or fails), first non-empty answer wins
+        - "race": launch all configured sources at once, first non-empty answer wins
+        - "union": query all configured sources at once and merge their answers
+          (see discover_job_listings_union)
+        
+        Per-source latencies of the last call are kept in self.source_latencies
+        so the budgets can be tuned. Sources a hedged or race call stopped
+        waiting for are listed in self.unfinished_sources, with the time they
+        had run so far as their latency. Both are fixed once the call returns:
+        size budgets from the latencies of finished sources, and read an
+        unfinished source's value only as a lower bound.
+        
         Args:
             keyword: Job search keyword
             location: Job location
             limit: Maximum results
+            strategy: "sequential", "hedged", "race" or "union"
+            latency_budgets: Optional per-source budgets in seconds for "hedged"
+                (defaults to DEFAULT_LATENCY_BUDGETS)
+            exclude_sources: Source names to leave out, e.g. ["phantombuster"]
             
         Returns:
             List of job dictionaries
         """
+        if strategy == "union":
+            return self.discover_job_listings_union(keyword, location, limit, exclude_sources)
+        
         logger.info("=" * 60)
         logger.info("🚀 Starting Multi-Source Job Discovery Pipeline")
         logger.info("=" * 60)
         
+        latencies: Dict[str, float] = {}
+        self.source_latencies = latencies
+        self.unfinished_sources = set()
+        
+        if strategy in ("hedged", "race"):
+            sources = self._discovery_sources(keyword, location, limit, exclude_sources)
+            budgets = dict(self.DEFAULT_LATENCY_BUDGETS)
+            if latency_budgets:
+                budgets.update(latency_budgets)
+            if strategy == "race":
+                budgets = {name: 0.0 for name, _ in sources}
+            jobs = self._discover_hedged(sources, budgets, latencies, self.unfinished_sources)
+            self._log_source_latencies()
+            return jobs
+        
+        if strategy != "sequential":
+            raise ValueError(f"Unknown discovery strategy: {strategy}")
+        
+        excluded = set(exclude_sources or [])
+        
+        def call_source(name: str, fetch: Callable[[], List[Dict]]) -> List[Dict]:
+            return [] if name in excluded else self._timed_source_call(name, fetch, latencies)
+        
         # Try Scrapin (PRIMARY - BEST)
-        jobs = self.discover_job_listings_scrapin(keyword, location, limit)
+        jobs = call_source("scrapin", lambda: self.discover_job_listings_scrapin(keyword, location, limit))
         if jobs:
             logger.info(f"✅ Success via Scrapin: {len(jobs)} jobs found")
+            self._log_source_latencies()
             return jobs
         
         # Try SerpAPI (FALLBACK 1)
         logger.info("⚠️  Scrapin failed, trying SerpAPI...")
-        jobs = self.discover_job_listings_serpapi(keyword, location)
+        jobs = call_source("serpapi", lambda: self.discover_job_listings_serpapi(keyword, location))
         if jobs:
             logger.info(f"✅ Success via SerpAPI: {len(jobs)} jobs found")
+            self._log_source_latencies()
             return jobs
         
         # Try PhantomBuster (FALLBACK 2)
         logger.info("⚠️  SerpAPI failed, trying PhantomBuster...")
-        jobs = self.discover_job_listings_phantombuster(keyword, location)
+        jobs = call_source("phantombuster", lambda: self.discover_job_listings_phantombuster(keyword, location))
         if jobs:
             logger.info(f"✅ Success via PhantomBuster: {len(jobs)} jobs found")
+            self._log_source_latencies()
             return jobs
         
         # Try Direct Scraping (LAST RESORT)
         logger.warning("⚠️  All APIs failed, trying direct scraping (brittle)...")
-        jobs = self.discover_job_listings_direct_scraping(keyword, location)
+        jobs = call_source("direct_scraping", lambda: self.discover_job_listings_direct_scraping(keyword, location))
+        self._log_source_latencies()
         if jobs:
             logger.warning(f"⚠️  Success via Direct Scraping: {len(jobs)} jobs found (may be incomplete)")
             return jobs
@@ -350,6 +917,193 @@ class JobSourceAgent:
         logger.error("❌ All discovery methods failed")
         return []
     
+    def iter_job_listings_with_failover(
+        self,
+        keyword: str = "software engineer",
+        location: str = "United States",
+        limit: int = 100
+    ) -> Iterator[Dict]:
+        """
+        Streaming sequential failover
+        
+        Yields jobs from the first source (in failover order) that produces any,
+        as soon as that source parses them.
+        
+        Args:
+            keyword: Job search keyword
+            location: Job location
+            limit: Maximum results
+            
+        Yields:
+            Job dictionaries
+        """
+        sources = [
+            ("Scrapin", "scrapin", lambda: self.iter_job_listings_scrapin(keyword, location, limit)),
+            ("SerpAPI", "serpapi", lambda: self.iter_job_listings_serpapi(keyword, location)),
+            ("PhantomBuster", "phantombuster", lambda: self.iter_job_listings_phantombuster(keyword, location)),
+            ("Direct Scraping", "direct_scraping", lambda: self.iter_job_listings_direct_scraping(keyword, location))
+        ]
+        
+        for name, source, make_jobs in sources:
+            found = 0
+            for job in self._guarded_source_iter(source, make_jobs):
+                found += 1
+                yield job
+            if found:
+                logger.info(f"✅ Success via {name}: {found} jobs found")
+                return
+            logger.info(f"⚠️  {name} returned no jobs, trying next source...")
+        
+        logger.error("❌ All discovery methods failed")
+    
+    def _discover_hedged(
+        self,
+        sources: List[Tuple[str, Callable[[], List[Dict]]]],
+        budgets: Dict[str, float],
+        latencies: Dict[str, float],
+        unfinished: Set[str]
+    ) -> List[Dict]:
+        """
+        Launch sources in preference order, starting the next one whenever the
+        newest running source exceeds its latency budget or every running source
+        has failed. Returns the first non-empty answer without waiting for the
+        rest: sources not started yet are cancelled, running ones can't be
+        interrupted and finish in the background. Each running source is added
+        to `unfinished` with the time it has run so far as its latency.
+        
+        Sources time themselves into a dict private to this call, and only
+        latencies of calls that finished before the return are copied into
+        `latencies`, so a source finishing in the background later can't
+        change what the caller reads.
+        """
+        executor = ThreadPoolExecutor(max_workers=len(sources))
+        call_latencies: Dict[str, float] = {}
+        pending = {}
+        next_index = 0
+        launched_at = 0.0
+        
+        try:
+            while True:
+                # Launch the next source if nothing is running or the newest one is over budget
+                if next_index < len(sources):
+                    newest_budget = budgets.get(sources[next_index - 1][0], 0.0) if next_index else 0.0
+                    if not pending or time.monotonic() - launched_at >= newest_budget:
+                        name, fetch = sources[next_index]
+                        logger.info(f"🏁 Launching discovery source: {name}")
+                        future = executor.submit(self._timed_source_call, name, fetch, call_latencies)
+                        pending[future] = (next_index, name, time.monotonic())
+                        launched_at = time.monotonic()
+                        next_index += 1
+                        continue
+                
+                if not pending:
+                    logger.error("❌ All discovery methods failed")
+                    return []
+                
+                timeout = None
+                if next_index < len(sources):
+                    newest_budget = budgets.get(sources[next_index - 1][0], 0.0)
+                    timeout = max(0.0, launched_at + newest_budget - time.monotonic())
+                
+                done, _ = wait(pending, timeout=timeout, return_when=FIRST_COMPLETED)
+                
+                # Prefer the earliest source in failover order when several finish together
+                for future in sorted(done, key=lambda f: pending[f][0]):
+                    _, name, _ = pending.pop(future)
+                    latencies[name] = call_latencies[name]
+                    try:
+                        jobs = future.result()
+                    except Exception as e:
+                        logger.error(f"❌ [{name}] Unexpected error: {e}")
+                        continue
+                    if jobs:
+                        logger.info(f"✅ Success via {name}: {len(jobs)} jobs found")
+                        return jobs
+        finally:
+            now = time.monotonic()
+            for future, (_, name, started) in pending.items():
+                if future.cancel():
+                    logger.info(f"🛑 Cancelled discovery source: {name}")
+                elif future.done():
+                    # Finished alongside the winner but not looked at
+                    latencies[name] = call_latencies[name]
+                else:
+                    latencies[name] = now - started
+                    unfinished.add(name)
+                    logger.info(f"⏳ Not waiting for discovery source: {name}")
+            executor.shutdown(wait=False, cancel_futures=True)
+    
+    def discover_job_listings_union(
+        self,
+        keyword: str = "software engineer",
+        location: str = "United States",
+        limit: int = 100,
+        exclude_sources: Optional[List[str]] = None
+    ) -> List[Dict]:
+        """
+        UNION MULTI-SOURCE DISCOVERY
+        
+        Queries all configured sources concurrently, normalizes their records
+        into one shape and deduplicates them by LinkedIn job ID. When several
+        sources return the same job, the record from the source earliest in
+        failover order is kept and its missing fields are filled from the others.
+        
+        Args:
+            keyword: Job search keyword
+            location: Job location
+            limit: Maximum results per source request
+            exclude_sources: Source names to leave out, e.g. ["phantombuster"]
+            
+        Returns:
+            List of unique normalized job dictionaries
+        """
+        logger.info("=" * 60)
+        logger.info("🚀 Starting Union Multi-Source Job Discovery")
+        logger.info("=" * 60)
+        
+        latencies: Dict[str, float] = {}
+        self.source_latencies = latencies
+        self.unfinished_sources = set()
+        sources = self._discovery_sources(keyword, location, limit, exclude_sources)
+        
+        results: Dict[str, List[Dict]] = {}
+        with ThreadPoolExecutor(max_workers=len(sources)) as executor:
+            futures = {
+                executor.submit(self._timed_source_call, name, fetch, latencies): name
+                for name, fetch in sources
+            }
+            for future in as_completed(futures):
+                name = futures[future]
+                try:
+                    results[name] = future.result()
+                except Exception as e:
+                    logger.error(f"❌ [{name}] Unexpected error: {e}")
+                    results[name] = []
+        
+        # Merge in failover order so the most reliable source wins duplicates
+        index = JobIndex()
+        for name, _ in sources:
+            source_jobs = results.get(name, [])
+            added = sum(index.add(normalize_job(job, name)) for job in source_jobs)
+            logger.info(f"🔗 [{name}] {len(source_jobs)} jobs, {added} new")
+        
+        self._log_source_latencies()
+        
+        if not len(index):
+            logger.error("❌ All discovery methods failed")
+            return []
+        
+        logger.info(f"✅ Union discovery: {len(index)} unique jobs")
+        return index.jobs()
+    
+    def _log_source_latencies(self) -> None:
+        """Log per-source latencies of the last discovery call"""
+        for name, latency in self.source_latencies.items():
+            if name in self.unfinished_sources:
+                logger.info(f"⏱️  [{name}] >= {latency:.2f}s (still running)")
+            else:
+                logger.info(f"⏱️  [{name}] {latency:.2f}s")
+    
     # ==================== STEP 2: EXTRACT COMPANY DATA ====================
     
     def extract_company_data(self, job_url: str) -> Optional[Tuple[str, str]]:
@@ -400,54 +1154,52 @@ class JobSourceAgent:
         Returns:
             Career page URL or None if not found
         """
+        candidates = self.find_career_page_candidates(company_website)
+        return candidates[0] if candidates else None
+    
+    def find_career_page_candidates(self, company_website: str) -> List[str]:
+        """
+        Ranked career page candidates from the company homepage, best first
+        
+        Every link is scored in one pass (see link_ranking.rank_links). If no
+        link qualifies, self.career_paths are probed concurrently instead.
+        
+        Args:
+            company_website: Company website URL
+            
+        Returns:
+            Candidate URLs, best first (empty if none found)
+        """
         try:
             if not company_website.startswith(('http://', 'https://')):
                 company_website = 'https://' + company_website
             
             logger.info(f"🌐 Finding career page for: {company_website}")
             
-            res = self.session.get(company_website, timeout=10, allow_redirects=True)
+            res = self.page_cache.fetch(
+                self.session, company_website, self.max_page_bytes["homepage"],
+                allow_redirects=True, http_cache=self.http_cache
+            )
             res.raise_for_status()
             
-            soup = BeautifulSoup(res.text, "html.parser")
-            base_url = f"{urlparse(company_website).scheme}://{urlparse(company_website).netloc}"
-            
-            # Search for career links
-            for a in soup.find_all("a", href=True):
-                href = a.get("href", "").lower()
-                text = (a.text or "").lower().strip()
-                
-                if any(keyword in href for keyword in CAREER_KEYWORDS) or \
-                   any(keyword in text for keyword in CAREER_KEYWORDS):
-                    
-                    if href.startswith("http"):
-                        career_url = href
-                    elif href.startswith("/"):
-                        career_url = base_url + href
-                    else:
-                        career_url = urljoin(company_website, href)
-                    
-                    logger.info(f"✅ Found career page: {career_url}")
-                    return career_url
+            soup = res.soup(self.html_parser, LINK_REGION_STRAINER)
+            ranked = rank_links(soup, res.url or company_website, self.career_matcher)
+            if ranked:
+                logger.info(f"✅ Found career page: {ranked[0]['url']} (score {ranked[0]['score']:.1f}, {len(ranked)} candidates)")
+                return [candidate["url"] for candidate in ranked]
             
-            # Try common paths
-            common_paths = ["/careers", "/career", "/jobs", "/join-us", "/work-with-us"]
-            for path in common_paths:
-                try:
-                    test_url = urljoin(company_website, path)
-                    test_res = self.session.get(test_url, timeout=5, allow_redirects=True)
-                    if test_res.status_code == 200:
-                        logger.info(f"✅ Found career page via common path: {test_url}")
-                        return test_url
-                except:
-                    continue
+            # Probe common paths concurrently
+            career_url = probe_paths(self.transport, company_website, self.career_paths, timeout=5)
+            if career_url:
+                logger.info(f"✅ Found career page via common path: {career_url}")
+                return [career_url]
             
             logger.warning(f"⚠️  Career page not found for: {company_website}")
-            return None
+            return []
             
         except Exception as e:
             logger.error(f"❌ Error finding career page: {e}")
-            return None
+            return []
     
     # ==================== STEP 4: EXTRACT JOB POSTING ====================
     
@@ -464,10 +1216,15 @@ class JobSourceAgent:
         try:
             logger.info(f"💼 Extracting job posting from: {career_page_url}")
             
-            res = self.session.get(career_page_url, timeout=10, allow_redirects=True)
+            # Only the first job link is used, so stop downloading once one has arrived
+            res = self.page_cache.fetch(
+                self.session, career_page_url, self.max_page_bytes["career_page"],
+                stop_when=anchor_href_check(lambda href: self._is_job_link_href(href, career_page_url)),
+                allow_redirects=True, http_cache=self.http_cache
+            )
             res.raise_for_status()
             
-            soup = BeautifulSoup(res.text, "html.parser")
+            soup = res.soup(self.html_parser, ANCHOR_STRAINER)
             base_url = f"{urlparse(career_page_url).scheme}://{urlparse(career_page_url).netloc}"
             
             job_links = []
@@ -475,8 +1232,7 @@ class JobSourceAgent:
                 href = a.get("href", "").lower()
                 text = (a.text or "").lower().strip()
                 
-                if any(keyword in href for keyword in JOB_KEYWORDS) or \
-                   any(keyword in text for keyword in JOB_KEYWORDS):
+                if self.job_matcher.search(href) or self.job_matcher.search(text):
                     
                     if href.startswith("http"):
                         job_url = href
@@ -500,6 +1256,10 @@ class JobSourceAgent:
             logger.error(f"❌ Error extracting job posting: {e}")
             return None
     
+    def _is_job_link_href(self, href: str, page_url: str) -> bool:
+        """Whether an href on `page_url` is a link extract_one_job would select"""
+        return self.job_matcher.search(href) and "career" not in urljoin(page_url, href).lower()
+    
     # ==================== STEP 5: POSTGRES STORAGE ====================
     
     def store_in_postgres(self, job_data: Dict) -> bool:
@@ -576,11 +1336,80 @@ class JobSourceAgent:
     
     # ==================== FULL PIPELINE ====================
     
+    def process_job(self, job: Dict) -> Optional[Dict]:
+        """
+        Run Steps 2-5 of the pipeline for one discovered job
+        
+        Args:
+            job: Job dictionary from discovery (needs job_url or link)
+            
+        Returns:
+            Result dictionary, or None if the job could not be processed
+        """
+        job_url = job.get("job_url") or job.get("link")
+        if not job_url:
+            return None
+        
+        # Step 2: Extract company data
+        company_data = self.extract_company_data(job_url)
+        if not company_data:
+            return None
+        
+        company_name, company_website = company_data
+        
+        # Step 3: Find career page candidates, best first
+        candidates = self.find_career_page_candidates(company_website)
+        career_page = candidates[0] if candidates else None
+        
+        # Step 4: Extract job posting, moving on to the next candidate if a page has none
+        open_job = None
+        for candidate in candidates[:self.MAX_CAREER_CANDIDATES]:
+            open_job = self.extract_one_job(candidate)
+            if open_job:
+                career_page = candidate
+                break
+        
+        result = {
+            "linkedin_job_url": job_url,
+            "company_name": company_name,
+            "company_website": company_website,
+            "career_page_url": career_page,
+            "open_position_url": open_job,
+            "source": job.get("source", "unknown"),
+            "title": job.get("title"),
+            "location": job.get("location")
+        }
+        
+        # Step 5: Store in Postgres
+        if self.postgres_config:
+            self.store_in_postgres(result)
+        
+        return result
+    
+    def _reset_page_caches(self) -> None:
+        """Forget the last run's pages and zero the HTTP cache counters"""
+        self.page_cache.clear()
+        if self.http_cache is not None:
+            self.http_cache.reset_stats()
+    
+    def _log_page_cache_stats(self) -> None:
+        stats = self.page_cache.stats()
+        logger.info(f"📄 Page cache: {stats['hits']} fetches saved, {stats['misses']} pages downloaded")
+        if self.http_cache is not None:
+            stats = self.http_cache.stats()
+            logger.info(
+                f"🗄️  HTTP cache: {stats['hits']} fresh, {stats['revalidated']} revalidated (304), "
+                f"{stats['misses']} downloaded"
+            )
+    
     def run_full_pipeline(
         self,
         keyword: str = "software engineer",
         location: str = "United States",
-        limit: int = 10
+        limit: int = 10,
+        strategy: str = "sequential",
+        phantombuster_async: bool = False,
+        phantombuster_timeout: float = 600.0
     ) -> List[Dict]:
         """
         Complete autonomous pipeline with failover
@@ -592,10 +1421,18 @@ class JobSourceAgent:
         4. Extract job posting
         5. Store in Postgres
         
+        With phantombuster_async, PhantomBuster is launched in the background
+        instead of being a blocking fallback. The other sources are processed
+        meanwhile, and the phantom's jobs not already seen are merged in and
+        processed when it finishes (while the limit allows).
+        
         Args:
             keyword: Job search keyword
             location: Job location
             limit: Number of jobs to process
+            strategy: Discovery strategy (see discover_job_listings_with_failover)
+            phantombuster_async: Run PhantomBuster in launch-and-poll mode
+            phantombuster_timeout: Seconds to wait for the PhantomBuster run
             
         Returns:
             List of complete job data dictionaries
@@ -604,53 +1441,66 @@ class JobSourceAgent:
         logger.info("🚀 Starting Full Autonomous Pipeline")
         logger.info("=" * 60)
         
+        self._reset_page_caches()
+        
+        phantom_run = None
+        exclude_sources = None
+        if phantombuster_async and self.phantombuster_key and self.phantombuster_agent_id:
+            phantom_run = self.start_phantombuster_search(keyword, location, phantombuster_timeout)
+            exclude_sources = ["phantombuster"]
+        
         # Step 1: Discover jobs with failover
-        jobs = self.discover_job_listings_with_failover(keyword, location, limit)
-        if not jobs:
+        jobs = self.discover_job_listings_with_failover(
+            keyword, location, limit, strategy=strategy, exclude_sources=exclude_sources
+        )
+        if not jobs and not phantom_run:
             logger.error("❌ No jobs discovered")
             return []
         
+        jobs = jobs[:limit]
+        seen = JobIndex()
+        for job in jobs:
+            seen.add(normalize_job(job, "discovery"))
+        
         results = []
-        for i, job in enumerate(jobs[:limit], 1):
-            logger.info(f"\n📦 Processing job {i}/{min(len(jobs), limit)}")
-            
-            job_url = job.get("job_url") or job.get("link")
-            if not job_url:
-                continue
+        for i, job in enumerate(jobs, 1):
+            logger.info(f"\n📦 Processing job {i}/{len(jobs)}")
             
-            # Step 2: Extract company data
-            company_data = self.extract_company_data(job_url)
-            if not company_data:
+            result = self.process_job(job)
+            if not result:
                 continue
             
-            company_name, company_website = company_data
-            
-            # Step 3: Find career page
-            career_page = self.find_career_page(company_website)
-            
-            # Step 4: Extract job posting
-            open_job = self.extract_one_job(career_page) if career_page else None
-            
-            result = {
-                "linkedin_job_url": job_url,
-                "company_name": company_name,
-                "company_website": company_website,
-                "career_page_url": career_page,
-                "open_position_url": open_job,
-                "source": job.get("source", "unknown"),
-                "title": job.get("title"),
-                "location": job.get("location")
-            }
-            
-            # Step 5: Store in Postgres
-            if self.postgres_config:
-                self.store_in_postgres(result)
-            
             results.append(result)
-            time.sleep(1)  # Rate limiting
+        
+        # Merge in the PhantomBuster run once it finishes
+        remaining = limit - len(jobs)
+        if phantom_run and remaining <= 0:
+            logger.info("🛑 [PhantomBuster] Limit reached by other sources, stopping the background run")
+            self.cancel_phantombuster_search(phantom_run)
+        elif phantom_run:
+            logger.info("⏳ Waiting for PhantomBuster results...")
+            phantom_jobs = [
+                job for job in (normalize_job(job, "phantombuster") for job in phantom_run.result())
+                if seen.add(job)
+            ][:remaining]
+            logger.info(f"🔗 [PhantomBuster] Merging {len(phantom_jobs)} new jobs")
+            
+            for i, job in enumerate(phantom_jobs, 1):
+                logger.info(f"\n📦 Processing PhantomBuster job {i}/{len(phantom_jobs)}")
+                
+                result = self.process_job(job)
+                if not result:
+                    continue
+                
+                results.append(result)
+        
+        if not results and not jobs:
+            logger.error("❌ No jobs discovered")
+            return []
         
         logger.info("=" * 60)
         logger.info(f"✅ Pipeline Complete: {len(results)} jobs processed")
+        self._log_page_cache_stats()
         logger.info("=" * 60)
         
         return results
@@ -691,7 +1541,10 @@ def main():
     )
     
     # Run full pipeline
-    results = agent.run_full_pipeline(keyword="software engineer", limit=5)
+    try:
+        results = agent.run_full_pipeline(keyword="software engineer", limit=5)
+    finally:
+        agent.close()
     
     print("\n" + "=" * 60)
     print("RESULTS")
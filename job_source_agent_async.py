@@ -0,0 +1,743 @@
+"""
+AI Job Source Agent - 100% FREE Pipeline (asyncio engine)
+
+Same pipeline as job_source_agent_free.py, but every HTTP call (guest search,
+LinkedIn job and company pages, company sites, Scrapin, Ollama) is made with
+aiohttp, so one process can keep hundreds of jobs in flight while it waits on
+the network. Parsing, ranking and result building are inherited from
+FreeJobSourceAgent, so both engines return the same results; they run in
+worker threads (asyncio.to_thread), like the caches' disk I/O, so they don't
+stall the requests in flight.
+"""
+
+import asyncio
+import logging
+from typing import Any, AsyncIterator, Callable, Dict, List, Optional, Tuple
+
+import requests
+
+from async_http import AsyncHttpTransport, AsyncPageCache, fetch_page_async, probe_paths_async
+from guest_cards import parse_guest_job_cards
+from html_parsing import ANCHOR_STRAINER, DEFAULT_HTML_PARSER
+from job_records import job_key, unique_queries
+from job_source_agent_free import LINKEDIN_PAGE_SIZE, FreeJobSourceAgent
+from link_ranking import LINK_REGION_STRAINER
+from page_fetch import FetchedPage, anchor_href_check
+from rate_limiter import RateLimiter
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+class AsyncFreeJobSourceAgent(FreeJobSourceAgent):
+    """
+    asyncio version of FreeJobSourceAgent
+
+    The network-bound steps are coroutines with the same names and arguments
+    as their sync counterparts. Discovery uses the guest search endpoint only
+    (Playwright's sync browser pool is not available here). Use it with
+    `async with` or await aclose(); the sync context manager is disabled.
+    """
+
+    def __init__(
+        self,
+        scrapin_api_key: Optional[str] = None,
+        ollama_base_url: str = "http://localhost:11434",
+        ollama_model: str = "gpt-oss:120b-cloud",
+        postgres_config: Optional[Dict] = None,
+        seen_jobs_path: str = "seen_jobs.json",
+        discovery_cache_config: Optional[Dict] = None,
+        html_parser: str = DEFAULT_HTML_PARSER,
+        extra_career_keywords: Optional[List[str]] = None,
+        extra_job_keywords: Optional[List[str]] = None,
+        max_page_bytes: Optional[Dict[str, int]] = None,
+        http_cache_config: Optional[Dict] = None,
+        async_transport: Optional[AsyncHttpTransport] = None,
+        async_transport_config: Optional[Dict] = None,
+        career_paths: Optional[List[str]] = None
+    ):
+        """
+        Initialize async FREE agent
+
+        Args:
+            async_transport: Optional AsyncHttpTransport to share with other agents
+            async_transport_config: Optional dict of AsyncHttpTransport settings
+                (max_connections, pool_maxsize, host_pool_sizes, host_rates,
+                default_host_rate, max_retries, backoff_factor), used when no transport is given
+
+            The other arguments are the same as FreeJobSourceAgent's.
+        """
+        super().__init__(
+            scrapin_api_key=scrapin_api_key,
+            ollama_base_url=ollama_base_url,
+            ollama_model=ollama_model,
+            use_playwright=False,
+            postgres_config=postgres_config,
+            seen_jobs_path=seen_jobs_path,
+            discovery_cache_config=discovery_cache_config,
+            html_parser=html_parser,
+            extra_career_keywords=extra_career_keywords,
+            extra_job_keywords=extra_job_keywords,
+            max_page_bytes=max_page_bytes,
+            http_cache_config=http_cache_config,
+            career_paths=career_paths
+        )
+
+        # aiohttp session with the same retry policy as the sync transport, see async_http.py
+        self._owns_async_transport = async_transport is None
+        self.async_transport = async_transport or AsyncHttpTransport.from_config(async_transport_config or {})
+
+        # Concurrent fetches of the same page share one download
+        self.page_cache = AsyncPageCache()
+
+    async def aclose(self) -> None:
+        """Close the aiohttp session (unless shared) and the sync transport"""
+        self.close()
+        if self._owns_async_transport:
+            await self.async_transport.aclose()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.aclose()
+
+    def __enter__(self):
+        # close() alone would leave the aiohttp session open
+        raise TypeError("AsyncFreeJobSourceAgent must be used with 'async with'")
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        pass
+
+    async def _parse_page(self, page: FetchedPage, parse: Callable[..., Any], *args, parse_only=None) -> Any:
+        """parse(soup, *args) for the page's soup, built and parsed in a worker thread"""
+        return await asyncio.to_thread(lambda: parse(page.soup(self.html_parser, parse_only), *args))
+
+    # ==================== STEP 1: FREE LinkedIn Job Discovery ====================
+
+    async def discover_jobs_linkedin_public_api(
+        self,
+        keyword: str = "software engineer",
+        location: str = "United States",
+        max_results: int = 100,
+        concurrency: int = 1,
+        requests_per_second: Optional[float] = None,
+        incremental: bool = False,
+        limiter: Optional[RateLimiter] = None
+    ) -> List[Dict]:
+        """Collects iter_jobs_linkedin_public_api into a list"""
+        return [
+            job async for job in self.iter_jobs_linkedin_public_api(
+                keyword, location, max_results, concurrency, requests_per_second, incremental, limiter
+            )
+        ]
+
+    async def iter_jobs_linkedin_public_api(
+        self,
+        keyword: str = "software engineer",
+        location: str = "United States",
+        max_results: int = 100,
+        concurrency: int = 1,
+        requests_per_second: Optional[float] = None,
+        incremental: bool = False,
+        limiter: Optional[RateLimiter] = None
+    ) -> AsyncIterator[Dict]:
+        """
+        Async generator version of FreeJobSourceAgent.iter_jobs_linkedin_public_api
+
+        Pages are fetched in windows that start at one page and double after
+        each full window, up to `concurrency`, and are consumed in offset order,
+        with the same stopping rules as the sync version.
+        """
+        total = 0
+        emitted_keys = []  # Only kept in incremental mode
+        start = 0
+        page_size = LINKEDIN_PAGE_SIZE
+        concurrency = max(1, concurrency)
+        if limiter is None and requests_per_second:
+            limiter = RateLimiter(requests_per_second)
+        known_jobs = await asyncio.to_thread(self.seen_jobs.ids, keyword, location) if incremental else None
+
+        logger.info("=" * 60)
+        logger.info("🆓 FREE LinkedIn Public API Job Discovery (async)")
+        logger.info("=" * 60)
+
+        try:
+            reached_end = False
+            window = 1
+            while not reached_end and total < max_results:
+                # Never request more pages than max_results still needs
+                pages_needed = -(-(max_results - total) // page_size)
+                offsets = [start + i * page_size for i in range(min(window, pages_needed))]
+                tasks = [
+                    asyncio.ensure_future(
+                        self._fetch_linkedin_public_page(keyword, location, offset, limiter, incremental)
+                    )
+                    for offset in offsets
+                ]
+
+                try:
+                    for task in tasks:
+                        try:
+                            page_jobs = await task
+                        except requests.exceptions.RequestException as e:
+                            logger.error(f"❌ Error fetching jobs: {e}")
+                            reached_end = True
+                            break
+                        except Exception as e:
+                            logger.error(f"❌ Unexpected error: {e}")
+                            reached_end = True
+                            break
+
+                        if page_jobs is None:
+                            logger.warning("No job cards found in response. LinkedIn may have changed structure.")
+                            reached_end = True
+                            break
+
+                        if not page_jobs:
+                            logger.info("No more jobs found. Reached end of results.")
+                            reached_end = True
+                            break
+
+                        new_jobs = page_jobs
+                        if known_jobs is not None:
+                            new_jobs = [job for job in page_jobs if job_key(job) not in known_jobs]
+                            if not new_jobs:
+                                logger.info("🛑 Page contains only previously seen jobs. Stopping.")
+                                reached_end = True
+                                break
+
+                        new_jobs = new_jobs[:max_results - total]
+                        total += len(new_jobs)
+                        logger.info(f"✅ Found {len(new_jobs)} jobs (total: {total})")
+                        for job in new_jobs:
+                            if incremental:
+                                emitted_keys.append(job_key(job))
+                            yield job
+
+                        # Check if there are more pages
+                        if len(page_jobs) < page_size or total >= max_results:
+                            reached_end = True
+                            break
+                finally:
+                    # Pages past the end (or left behind by a consumer that stopped early)
+                    for task in tasks:
+                        task.cancel()
+
+                start += len(offsets) * page_size
+                # Every page in the window was full, so the results likely go on
+                window = min(concurrency, window * 2)
+
+            logger.info(f"✅ Total jobs discovered: {total}")
+        finally:
+            # Also runs when the consumer stops early, so only handed-out jobs are remembered
+            if incremental:
+                await asyncio.to_thread(self._remember_job_keys, keyword, location, emitted_keys)
+
+    async def discover_jobs_batch(
+        self,
+        queries: List[Tuple[str, str]],
+        max_results_per_query: int = 100,
+        workers: int = 4,
+        requests_per_second: Optional[float] = None,
+        incremental: bool = False
+    ) -> List[Dict]:
+        """
+        FREE: Discover jobs for many (keyword, location) queries at once
+
+        Up to `workers` queries run at a time, paced by the transport's per-host
+        scheduler (plus requests_per_second if given); results
+        are merged and deduped as in FreeJobSourceAgent.discover_jobs_batch.
+        """
+        queries = unique_queries(queries)
+        limiter = RateLimiter(requests_per_second) if requests_per_second else None
+        slots = asyncio.Semaphore(max(1, workers))
+
+        logger.info(f"🗂️  Batch discovery for {len(queries)} queries")
+
+        async def run_query(keyword: str, location: str) -> List[Dict]:
+            async with slots:
+                try:
+                    return await self.discover_jobs_linkedin_public_api(
+                        keyword, location, max_results_per_query, 1, requests_per_second, incremental, limiter
+                    )
+                except Exception as e:
+                    logger.error(f"❌ Batch query {(keyword, location)} failed: {e}")
+                    return []
+
+        query_jobs = await asyncio.gather(*(run_query(keyword, location) for keyword, location in queries))
+        return self._merge_query_results(queries, dict(zip(queries, query_jobs)))
+
+    async def _fetch_linkedin_public_page(
+        self,
+        keyword: str,
+        location: str,
+        start: int,
+        limiter: Optional[RateLimiter] = None,
+        newest_first: bool = False
+    ) -> Optional[List[Dict]]:
+        """Fetch and parse one page of the LinkedIn guest job search endpoint"""
+        cache_source, url = self._guest_search_request(keyword, location, start, newest_first)
+        if self.discovery_cache is not None:
+            cached = await asyncio.to_thread(self.discovery_cache.get, cache_source, keyword, location, start)
+            if cached is not None:
+                return cached
+
+        if limiter:
+            await limiter.acquire_async()
+
+        logger.info(f"📡 Fetching jobs {start} to {start + LINKEDIN_PAGE_SIZE}...")
+
+        res = await fetch_page_async(self.async_transport, url, self.max_page_bytes["linkedin"], timeout=15)
+        res.raise_for_status()
+
+        page_jobs = await asyncio.to_thread(parse_guest_job_cards, res.text, location)
+        if page_jobs is None:
+            return None
+
+        if self.discovery_cache is not None:
+            await asyncio.to_thread(self.discovery_cache.set, cache_source, keyword, location, start, page_jobs)
+
+        return page_jobs
+
+    async def discover_jobs_playwright(
+        self,
+        keyword: str = "software engineer",
+        location: str = "United States",
+        max_results: int = 50,
+        scroll_target: Optional[int] = None,
+        scroll_timeout: float = 5.0
+    ) -> List[Dict]:
+        """Collects iter_jobs_playwright into a list"""
+        return [
+            job async for job in self.iter_jobs_playwright(
+                keyword, location, max_results, scroll_target, scroll_timeout
+            )
+        ]
+
+    async def iter_jobs_playwright(
+        self,
+        keyword: str = "software engineer",
+        location: str = "United States",
+        max_results: int = 50,
+        scroll_target: Optional[int] = None,
+        scroll_timeout: float = 5.0
+    ) -> AsyncIterator[Dict]:
+        """
+        Async generator version of FreeJobSourceAgent.iter_jobs_playwright
+
+        Playwright is never used here, so this is the sync version's fallback:
+        the guest search endpoint (scroll_target and scroll_timeout are ignored).
+        """
+        logger.warning("Playwright not available, falling back to requests")
+        async for job in self.iter_jobs_linkedin_public_api(keyword, location, max_results):
+            yield job
+
+    # ==================== STEP 2: FREE Company Website Extraction ====================
+
+    async def extract_company_website_from_linkedin_job(self, job_url: str) -> Optional[Tuple[str, str]]:
+        """FREE: Extract company name and website from LinkedIn job page HTML"""
+        try:
+            logger.info(f"📋 Extracting company data from: {job_url}")
+
+            # Method 1: Try to get company info from job page
+            res = await self.page_cache.fetch(self.async_transport, job_url, self.max_page_bytes["linkedin"], timeout=15)
+            res.raise_for_status()
+
+            company_name, company_linkedin_url = await self._parse_page(res, self._parse_job_page_company, job_url)
+
+            # If we have company LinkedIn URL, try to get website from company page
+            if company_linkedin_url:
+                company_website = await self._extract_website_from_company_page(company_linkedin_url)
+                if company_website and company_name:
+                    logger.info(f"✅ Extracted: {company_name} → {company_website}")
+                    return company_name, company_website
+
+            # Method 2: Use Scrapin FREE tier if available (100 calls/day)
+            if self.scrapin_key:
+                result = await self._extract_company_via_scrapin_free(job_url)
+                if result:
+                    return result
+
+            # Method 3: Try to get website by company name (fallback for well-known companies)
+            if company_name:
+                company_website = await self._get_company_website_by_name(company_name)
+                if company_website:
+                    logger.info(f"✅ Found website via name lookup: {company_name} → {company_website}")
+                    return company_name, company_website
+
+            logger.warning("⚠️  Could not extract company website. Try using Scrapin free tier.")
+            return (company_name, None) if company_name else None
+
+        except Exception as e:
+            logger.error(f"❌ Error extracting company data: {e}")
+            return None
+
+    async def _extract_website_from_company_page(self, company_linkedin_url: str) -> Optional[str]:
+        """Extract website from LinkedIn company page"""
+        try:
+            logger.info(f"🔍 Extracting website from company page: {company_linkedin_url}")
+            res = await self.page_cache.fetch(
+                self.async_transport, company_linkedin_url, self.max_page_bytes["linkedin"], timeout=15
+            )
+            res.raise_for_status()
+
+            return await self._parse_page(res, self._parse_company_page_website)
+
+        except Exception as e:
+            logger.debug(f"Error extracting from company page: {e}")
+            return None
+
+    async def _get_company_website_by_name(self, company_name: str) -> Optional[str]:
+        """Known website for the company name, else the first guessed domain that answers"""
+        try:
+            website = self._known_company_website(company_name)
+            if website:
+                return website
+
+            for domain in self._company_domain_guesses(company_name):
+                try:
+                    async with self.async_transport.request("HEAD", domain, timeout=5, allow_redirects=True) as res:
+                        if res.status < 400:
+                            logger.info(f"✅ Found website via pattern: {domain}")
+                            return domain
+                except requests.exceptions.RequestException:
+                    continue
+
+            return None
+
+        except Exception as e:
+            logger.debug(f"Error in company website lookup: {e}")
+            return None
+
+    async def _extract_company_via_scrapin_free(self, job_url: str) -> Optional[Tuple[str, str]]:
+        """Use Scrapin FREE tier (100 calls/day)"""
+        try:
+            endpoint = "https://api.scrapin.io/linkedin/job"
+            params = {"url": job_url, "key": self.scrapin_key}
+
+            async with self.async_transport.request("GET", endpoint, params=params, timeout=30) as res:
+                if res.status >= 400:
+                    logger.debug(f"Scrapin free tier error: HTTP {res.status}")
+                    return None
+                data = await res.json(content_type=None)
+
+            return self._parse_scrapin_company(data)
+
+        except Exception as e:
+            logger.debug(f"Scrapin free tier error: {e}")
+            return None
+
+    # ==================== STEP 3: FREE LLM Web Navigator ====================
+
+    async def find_career_page_with_llm(self, company_website: str) -> Optional[str]:
+        """FREE: Best career page candidate (see find_career_page_candidates)"""
+        candidates = await self.find_career_page_candidates(company_website)
+        return candidates[0] if candidates else None
+
+    async def find_career_page_candidates(self, company_website: str) -> List[str]:
+        """
+        Ranked career page candidates, best first
+
+        Homepage link ranking and common-path probes first; the LLM is only
+        asked if they find nothing.
+        """
+        try:
+            if not company_website.startswith(('http://', 'https://')):
+                company_website = 'https://' + company_website
+
+            logger.info(f"🤖 Using LLM to find career page for: {company_website}")
+
+            # First, try traditional method
+            candidates = await self._find_career_page_candidates_traditional(company_website)
+            if candidates:
+                return candidates
+
+            # If not found, use LLM to analyze page structure
+            try:
+                res = await self.page_cache.fetch(
+                    self.async_transport, company_website, self.max_page_bytes["homepage"],
+                    allow_redirects=True, http_cache=self.http_cache
+                )
+                prompt = await self._parse_page(res, self._career_page_prompt, parse_only=LINK_REGION_STRAINER)
+
+                ollama_url = f"{self.ollama_base_url}/api/chat"
+                async with self.async_transport.request(
+                    "POST", ollama_url, json=self._ollama_chat_payload(prompt), timeout=60
+                ) as response:
+                    data = await response.json(content_type=None) if response.status == 200 else None
+
+                if data is not None:
+                    career_url = self._parse_llm_career_url(data)
+                    if career_url:
+                        return [career_url]
+
+            except Exception as e:
+                logger.debug(f"LLM navigation error: {e}")
+
+            return []
+
+        except Exception as e:
+            logger.error(f"❌ Error finding career page: {e}")
+            return []
+
+    async def _find_career_page_candidates_traditional(self, company_website: str) -> List[str]:
+        """Ranked career page candidates from homepage links, falling back to common paths"""
+        try:
+            res = await self.page_cache.fetch(
+                self.async_transport, company_website, self.max_page_bytes["homepage"],
+                allow_redirects=True, http_cache=self.http_cache
+            )
+            res.raise_for_status()
+
+            ranked = await asyncio.to_thread(self._rank_career_candidates, res, company_website)
+            if ranked:
+                return ranked
+
+            # Probe common paths concurrently
+            career_url = await probe_paths_async(self.async_transport, company_website, self.career_paths, timeout=5)
+            return [career_url] if career_url else []
+
+        except Exception as e:
+            logger.debug(f"Traditional method error: {e}")
+            return []
+
+    # ==================== STEP 4: Extract Job Posting ====================
+
+    async def extract_one_job(self, career_page_url: str) -> Optional[str]:
+        """Extract one job posting from career page"""
+        try:
+            logger.info(f"💼 Extracting job posting from: {career_page_url}")
+
+            # Only the first job link is used, so stop downloading once one has arrived
+            res = await self.page_cache.fetch(
+                self.async_transport, career_page_url, self.max_page_bytes["career_page"],
+                stop_when=anchor_href_check(lambda href: self._is_job_link_href(href, career_page_url)),
+                allow_redirects=True, http_cache=self.http_cache
+            )
+            res.raise_for_status()
+
+            selected_job = await self._parse_page(
+                res, self._select_job_link, career_page_url, parse_only=ANCHOR_STRAINER
+            )
+            if selected_job:
+                logger.info(f"✅ Found job posting: {selected_job}")
+                return selected_job
+
+            logger.warning("⚠️  No job postings found")
+            return None
+
+        except Exception as e:
+            logger.error(f"❌ Error extracting job posting: {e}")
+            return None
+
+    # ==================== FULL FREE PIPELINE ====================
+
+    async def process_job(self, job: Dict) -> Optional[Dict]:
+        """Run Steps 2-5 of the FREE pipeline for one discovered job"""
+        job_url = job.get("job_url")
+        if not job_url:
+            return None
+
+        # Step 2: Extract company data (FREE)
+        company_data = await self.extract_company_website_from_linkedin_job(job_url)
+        if not company_data:
+            # Still save job info even if company extraction fails
+            return self._job_result(job, "company_extraction_failed")
+
+        company_name, company_website = company_data
+
+        # Step 3: Find career page (FREE - with LLM)
+        career_page = None
+        open_job = None
+
+        if company_website:
+            candidates = await self.find_career_page_candidates(company_website)
+            career_page = candidates[0] if candidates else None
+            # Step 4: Extract job posting, moving on to the next candidate if a page has none
+            for candidate in candidates[:self.MAX_CAREER_CANDIDATES]:
+                open_job = await self.extract_one_job(candidate)
+                if open_job:
+                    career_page = candidate
+                    break
+        else:
+            logger.warning(f"⚠️  No website for {company_name}, skipping career page search")
+
+        result = self._job_result(
+            job, "complete" if open_job else "partial",
+            company_name, company_website, career_page, open_job
+        )
+
+        # Step 5: Store in Postgres (optional), off the event loop
+        if self.postgres_config:
+            await asyncio.to_thread(self.store_in_postgres, result)
+
+        return result
+
+    async def _process_jobs(self, jobs: AsyncIterator[Dict], max_jobs: int, concurrency: int) -> Tuple[int, List[Dict]]:
+        """
+        Process jobs as they are discovered, up to `concurrency` at a time
+
+        Returns:
+            Number of jobs discovered and their results, in discovery order
+        """
+        slots = asyncio.Semaphore(max(1, concurrency))
+
+        async def process(index: int, job: Dict) -> Optional[Dict]:
+            async with slots:
+                logger.info(f"\n📦 Processing job {index}/{max_jobs}: {job.get('title', 'Unknown')}")
+                try:
+                    return await self.process_job(job)
+                except Exception as e:
+                    logger.error(f"❌ Error processing job {job.get('job_url')}: {e}")
+                    return None
+
+        tasks = []
+        try:
+            async for job in jobs:
+                tasks.append(asyncio.ensure_future(process(len(tasks) + 1, job)))
+                if len(tasks) >= max_jobs:
+                    break
+        finally:
+            await jobs.aclose()
+
+        results = await asyncio.gather(*tasks)
+        return len(tasks), [result for result in results if result]
+
+    async def run_free_pipeline(
+        self,
+        keyword: str = "software engineer",
+        location: str = "United States",
+        max_jobs: int = 10,
+        save_json: bool = True,
+        json_filename: Optional[str] = None,
+        incremental: bool = False,
+        concurrency: int = 100
+    ) -> List[Dict]:
+        """
+        Complete FREE pipeline, with up to `concurrency` jobs processed at once
+
+        Each job starts as soon as discovery yields it. Instead of the sync
+        pipeline's pause between jobs, requests are paced per host by the
+        transport (host_rates) and its connection limits.
+
+        Args:
+            keyword: Job search keyword
+            location: Job location
+            max_jobs: Maximum jobs to process
+            save_json: Whether to save results to JSON file (default: True)
+            json_filename: Optional JSON filename (default: auto-generated)
+            incremental: Only process jobs not discovered by previous runs
+            concurrency: Jobs processed at the same time
+
+        Returns:
+            List of complete job data, in discovery order
+        """
+        logger.info("=" * 60)
+        logger.info("🆓 Starting 100% FREE Pipeline (async)")
+        logger.info("=" * 60)
+
+        self._reset_page_caches()
+
+        jobs = self.iter_jobs_linkedin_public_api(keyword, location, max_jobs, incremental=incremental)
+        discovered, results = await self._process_jobs(jobs, max_jobs, concurrency)
+
+        if not discovered:
+            logger.error("❌ No jobs discovered")
+            return []
+
+        logger.info("=" * 60)
+        logger.info(f"✅ FREE Pipeline Complete: {len(results)} jobs processed")
+        self._log_page_cache_stats()
+        logger.info("=" * 60)
+
+        if save_json:
+            json_file = await asyncio.to_thread(self.save_results_to_json, results, json_filename)
+            logger.info(f"📄 Results saved to JSON: {json_file}")
+
+        return results
+
+    async def run_free_pipeline_batch(
+        self,
+        queries: List[Tuple[str, str]],
+        max_jobs_per_query: int = 10,
+        workers: int = 4,
+        requests_per_second: Optional[float] = None,
+        save_json: bool = True,
+        json_filename: Optional[str] = None,
+        incremental: bool = False,
+        concurrency: int = 100
+    ) -> List[Dict]:
+        """
+        FREE pipeline for many (keyword, location) queries
+
+        Args:
+            queries: List of (keyword, location) tuples
+            max_jobs_per_query: Maximum jobs discovered per query
+            workers: Number of queries fetched in parallel
+            requests_per_second: Extra cap on guest search requests per second (the
+                transport already paces linkedin.com)
+            save_json: Whether to save results to JSON file (default: True)
+            json_filename: Optional JSON filename (default: auto-generated)
+            incremental: Only process jobs not discovered by previous runs
+            concurrency: Jobs processed at the same time
+
+        Returns:
+            List of complete job data
+        """
+        logger.info("=" * 60)
+        logger.info(f"🆓 Starting FREE Batch Pipeline ({len(queries)} queries, async)")
+        logger.info("=" * 60)
+
+        self._reset_page_caches()
+
+        jobs = await self.discover_jobs_batch(
+            queries, max_jobs_per_query, workers, requests_per_second, incremental
+        )
+        if not jobs:
+            logger.error("❌ No jobs discovered")
+            return []
+
+        async def job_stream() -> AsyncIterator[Dict]:
+            for job in jobs:
+                yield job
+
+        _, results = await self._process_jobs(job_stream(), len(jobs), concurrency)
+
+        logger.info("=" * 60)
+        logger.info(f"✅ FREE Batch Pipeline Complete: {len(results)} jobs processed")
+        self._log_page_cache_stats()
+        logger.info("=" * 60)
+
+        if save_json:
+            json_file = await asyncio.to_thread(self.save_results_to_json, results, json_filename)
+            logger.info(f"📄 Results saved to JSON: {json_file}")
+
+        return results
+
+
+async def main():
+    """Example usage of the async FREE pipeline"""
+    import os
+    from dotenv import load_dotenv
+
+    load_dotenv()
+
+    async with AsyncFreeJobSourceAgent(
+        scrapin_api_key=os.getenv("SCRAPIN_API_KEY"),  # Optional
+        ollama_base_url=os.getenv("OLLAMA_BASE_URL", "http://localhost:11434"),
+        ollama_model=os.getenv("OLLAMA_MODEL", "gpt-oss:120b-cloud")
+    ) as agent:
+        results = await agent.run_free_pipeline(
+            keyword="software engineer",
+            location="United States",
+            max_jobs=50,
+            concurrency=50
+        )
+
+    complete = sum(1 for r in results if r.get("status") == "complete")
+    print(f"\n✅ {len(results)} jobs processed, {complete} complete")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
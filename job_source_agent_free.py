@@ -12,12 +12,26 @@ Step 5: Store in Postgres (optional)
 
 import requests
 import logging
-from typing import Optional, Dict, List, Tuple
-from bs4 import BeautifulSoup
+from typing import Optional, Dict, List, Tuple, Iterator, Iterable
 from urllib.parse import urljoin, urlparse, quote_plus
 import re
-import time
 import json
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextlib import contextmanager
+from itertools import islice
+
+from job_records import JobIndex, SeenJobStore, extract_linkedin_job_id, job_key, unique_queries
+from rate_limiter import RateLimiter
+from discovery_cache import DiscoveryCache
+from http_transport import HttpTransport
+from html_parsing import ANCHOR_STRAINER, DEFAULT_HTML_PARSER, resolve_html_parser
+from keyword_matcher import KeywordMatcher
+from link_ranking import LINK_REGION_STRAINER, rank_links
+from page_fetch import DEFAULT_MAX_PAGE_BYTES, FetchedPage, anchor_href_check, fetch_page
+from page_cache import PageCache
+from path_probe import COMMON_CAREER_PATHS, probe_paths
+from http_cache import HttpCache
+from guest_cards import parse_guest_job_cards
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -26,17 +40,66 @@ logger = logging.getLogger(__name__)
 CAREER_KEYWORDS = ["career", "careers", "jobs", "join", "work", "team", "hiring", "opportunities"]
 JOB_KEYWORDS = ["job", "opening", "position", "role", "vacancy", "apply"]
 
+# LinkedIn's guest search endpoint returns 25 jobs per page
+LINKEDIN_PAGE_SIZE = 25
+
+# Job list items on the public LinkedIn job search page
+PLAYWRIGHT_JOB_CARD_SELECTOR = "ul.jobs-search__results-list > li, li.jobs-search-results__list-item"
+
+# Resource types the Playwright browser never downloads (not needed to read job cards)
+BLOCKED_RESOURCE_TYPES = {"image", "media", "font", "stylesheet"}
+
+# Extracts every job card in one round-trip to the browser. Job IDs are parsed
+# from the URLs in Python with job_records.extract_linkedin_job_id.
+PLAYWRIGHT_EXTRACT_JOBS_JS = """
+([selector, maxResults]) => {
+    const text = (card, sel) => {
+        const elem = card.querySelector(sel);
+        return elem ? elem.innerText.trim() : null;
+    };
+    const jobs = [];
+    for (const card of document.querySelectorAll(selector)) {
+        if (jobs.length >= maxResults) break;
+        const link = card.querySelector("a.base-card__full-link");
+        const href = link && link.getAttribute("href");
+        if (!href) continue;
+        jobs.push({
+            job_url: href,
+            title: text(card, "h3.base-search-card__title"),
+            company_name: text(card, "h4.base-search-card__subtitle"),
+            location: text(card, "span.job-search-card__location")
+        });
+    }
+    return jobs;
+}
+"""
+
 
 class FreeJobSourceAgent:
     """100% FREE job source agent using LinkedIn public endpoints"""
     
+    # Career page candidates tried per company before giving up on finding a job posting
+    MAX_CAREER_CANDIDATES = 3
+    
     def __init__(
         self,
         scrapin_api_key: Optional[str] = None,  # Optional - only for free tier (100 calls/day)
         ollama_base_url: str = "http://localhost:11434",  # Free local LLM
         ollama_model: str = "gpt-oss:120b-cloud",  # Your Ollama model
         use_playwright: bool = True,  # Use Playwright for better reliability
-        postgres_config: Optional[Dict] = None
+        postgres_config: Optional[Dict] = None,
+        seen_jobs_path: str = "seen_jobs.json",
+        browser_pool_size: int = 2,
+        block_resources: bool = True,
+        discovery_cache_config: Optional[Dict] = None,
+        html_parser: str = DEFAULT_HTML_PARSER,
+        extra_career_keywords: Optional[List[str]] = None,
+        extra_job_keywords: Optional[List[str]] = None,
+        max_page_bytes: Optional[Dict[str, int]] = None,
+        http_cache_config: Optional[Dict] = None,
+        transport: Optional[HttpTransport] = None,
+        transport_config: Optional[Dict] = None,
+        career_paths: Optional[List[str]] = None
     ):
         """
         Initialize FREE agent
@@ -47,39 +110,180 @@ class FreeJobSourceAgent:
             ollama_model: Ollama model name (default: gpt-oss:120b-cloud)
             use_playwright: Use Playwright for browser automation (more reliable)
             postgres_config: Optional Postgres config for storage
+            seen_jobs_path: JSON file remembering discovered job IDs for incremental runs
+            browser_pool_size: Number of idle browser contexts kept for reuse
+            block_resources: Abort images, media, fonts and stylesheets in Playwright
+            discovery_cache_config: Optional dict (directory, ttl, max_mb) enabling the
+                on-disk cache of discovery results
+            html_parser: BeautifulSoup parser backend ("lxml", "html.parser", "html5lib")
+            extra_career_keywords: Keywords added to CAREER_KEYWORDS (e.g. localized "karriere")
+            extra_job_keywords: Keywords added to JOB_KEYWORDS (e.g. localized "empleo")
+            max_page_bytes: Per-stage byte caps for page downloads ("linkedin", "homepage",
+                "career_page"), overriding DEFAULT_MAX_PAGE_BYTES
+            http_cache_config: Optional dict (directory, max_age, max_mb) enabling the
+                on-disk conditional-GET cache of company homepages and career pages
+            transport: Optional HttpTransport to share (per-thread sessions, host rates) with other agents
+            transport_config: Optional dict of HttpTransport settings (pool sizes,
+                host_pool_sizes, max_retries, backoff_factor, host_rates,
+                default_host_rate), used when no transport is given
+            career_paths: Paths probed when no homepage link looks like a career page,
+                most preferred first (default: path_probe.COMMON_CAREER_PATHS)
         """
         self.scrapin_key = scrapin_api_key
         self.ollama_base_url = ollama_base_url
         self.ollama_model = ollama_model
         self.use_playwright = use_playwright
         self.postgres_config = postgres_config
+        self.seen_jobs_path = seen_jobs_path
+        self._seen_jobs: Optional[SeenJobStore] = None
+        
+        # Cached discovery pages per (source, keyword, location, offset), see discovery_cache.py
+        self.discovery_cache = DiscoveryCache.from_config(discovery_cache_config) if discovery_cache_config else None
+        
+        # BeautifulSoup backend for every page parse (falls back to html.parser if missing)
+        self.html_parser = resolve_html_parser(html_parser)
+        
+        # Compiled matchers for career-page and job-link keywords
+        self.career_matcher = KeywordMatcher(CAREER_KEYWORDS + list(extra_career_keywords or []))
+        self.job_matcher = KeywordMatcher(JOB_KEYWORDS + list(extra_job_keywords or []))
+        
+        # Page downloads are streamed and cut off at these sizes, see page_fetch.py
+        self.max_page_bytes = {**DEFAULT_MAX_PAGE_BYTES, **(max_page_bytes or {})}
+        
+        # Pages fetched during the current run, so each URL is downloaded and parsed once
+        self.page_cache = PageCache()
         
-        self.session = requests.Session()
-        self.session.headers.update({
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
-            'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
-            'Accept-Language': 'en-US,en;q=0.5',
-            'Accept-Encoding': 'gzip, deflate',
-            'Connection': 'keep-alive',
-        })
+        # Homepages and career pages kept across runs and revalidated with ETag / Last-Modified
+        self.http_cache = HttpCache.from_config(http_cache_config) if http_cache_config else None
         
+        # Fallback paths probed concurrently with HEAD requests, see path_probe.py
+        self.career_paths = list(COMMON_CAREER_PATHS if career_paths is None else career_paths)
+        
+        # Jobs found / unique jobs contributed per (keyword, location) by the last batch discovery
+        self.query_yields: Dict[Tuple[str, str], Dict[str, int]] = {}
+        
+        # Pooled per-thread sessions with retry/backoff for every HTTP call, see http_transport.py
+        self._owns_transport = transport is None
+        self.transport = transport or HttpTransport.from_config(transport_config or {})
+        
+        # Shared Playwright browser, started on first use and shut down by close()
+        self.browser_pool_size = browser_pool_size
+        self.block_resources = block_resources
+        self._playwright = None
         self.playwright_browser = None
+        self._idle_contexts = []
         if self.use_playwright:
             try:
-                from playwright.sync_api import sync_playwright
-                self.playwright = sync_playwright()
-                self.playwright_browser = None  # Will be initialized on first use
+                import playwright.sync_api  # noqa: F401
             except ImportError:
                 logger.warning("Playwright not installed. Install with: pip install playwright && playwright install")
                 self.use_playwright = False
     
+    @property
+    def session(self) -> requests.Session:
+        """The calling thread's pooled session"""
+        return self.transport.session
+    
+    # ==================== BROWSER POOL ====================
+    
+    def _get_browser(self):
+        """Start the shared headless Chromium on first use"""
+        if self.playwright_browser is not None and not self.playwright_browser.is_connected():
+            logger.warning("⚠️  Playwright browser disconnected, restarting")
+            self._close_browser()
+        
+        if self.playwright_browser is None:
+            from playwright.sync_api import sync_playwright
+            
+            logger.info("🎭 Starting shared Playwright browser...")
+            if self._playwright is None:
+                self._playwright = sync_playwright().start()
+            self.playwright_browser = self._playwright.chromium.launch(headless=True)
+        return self.playwright_browser
+    
+    @contextmanager
+    def _browser_page(self):
+        """
+        Borrow a page from the browser context pool
+        
+        Contexts are returned to the pool after use (up to browser_pool_size),
+        or closed if the caller raised an error. Playwright's sync API is bound
+        to the thread that started it, so the pool must be used from one thread.
+        """
+        if self._idle_contexts:
+            context = self._idle_contexts.pop()
+        else:
+            context = self._get_browser().new_context()
+            if self.block_resources:
+                context.route("**/*", self._route_request)
+        
+        page = context.pages[0] if context.pages else context.new_page()
+        reusable = True
+        try:
+            yield page
+        except Exception:
+            reusable = False
+            raise
+        finally:
+            if reusable and len(self._idle_contexts) < self.browser_pool_size:
+                self._idle_contexts.append(context)
+            else:
+                try:
+                    context.close()
+                except Exception as e:
+                    logger.debug(f"Error closing browser context: {e}")
+    
+    @staticmethod
+    def _route_request(route) -> None:
+        """Abort non-essential resource types, let everything else through"""
+        if route.request.resource_type in BLOCKED_RESOURCE_TYPES:
+            route.abort()
+        else:
+            route.continue_()
+    
+    def _close_browser(self) -> None:
+        """Shut down the shared Playwright browser and its pooled contexts"""
+        for context in self._idle_contexts:
+            try:
+                context.close()
+            except Exception as e:
+                logger.debug(f"Error closing browser context: {e}")
+        self._idle_contexts = []
+        
+        if self.playwright_browser is not None:
+            try:
+                self.playwright_browser.close()
+            except Exception as e:
+                logger.debug(f"Error closing browser: {e}")
+            self.playwright_browser = None
+        
+        if self._playwright is not None:
+            self._playwright.stop()
+            self._playwright = None
+    
+    def close(self) -> None:
+        """Shut down the Playwright browser and close the HTTP transport (unless shared)"""
+        self._close_browser()
+        if self._owns_transport:
+            self.transport.close()
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+    
     # ==================== STEP 1: FREE LinkedIn Job Discovery ====================
     
     def discover_jobs_linkedin_public_api(
         self,
         keyword: str = "software engineer",
         location: str = "United States",
-        max_results: int = 100
+        max_results: int = 100,
+        concurrency: int = 1,
+        requests_per_second: Optional[float] = None,
+        incremental: bool = False,
+        limiter: Optional[RateLimiter] = None
     ) -> List[Dict]:
         """
         FREE: Scrape LinkedIn Public Guest Job Search Endpoint
@@ -88,215 +292,464 @@ class FreeJobSourceAgent:
         
         This is LinkedIn's public API used for infinite scroll - 100% legal and free!
         
+        Collects iter_jobs_linkedin_public_api into a list.
+        
         Args:
             keyword: Job search keyword
             location: Job location
             max_results: Maximum number of jobs to retrieve
+            concurrency: Number of pages fetched in parallel (1 = sequential)
+            requests_per_second: Extra cap on page requests per second (the transport
+                already paces linkedin.com, see rate_limiter.DEFAULT_HOST_RATES)
+            incremental: Only return jobs not discovered by previous runs
+            limiter: Shared RateLimiter to use instead of requests_per_second
             
         Returns:
             List of job dictionaries with job_url, company_name, title, location
         """
-        jobs = []
+        return list(self.iter_jobs_linkedin_public_api(
+            keyword, location, max_results, concurrency, requests_per_second, incremental, limiter
+        ))
+    
+    def iter_jobs_linkedin_public_api(
+        self,
+        keyword: str = "software engineer",
+        location: str = "United States",
+        max_results: int = 100,
+        concurrency: int = 1,
+        requests_per_second: Optional[float] = None,
+        incremental: bool = False,
+        limiter: Optional[RateLimiter] = None
+    ) -> Iterator[Dict]:
+        """
+        Streaming variant of discover_jobs_linkedin_public_api
+        
+        Jobs are yielded as soon as their page is parsed, so callers can start
+        processing the first job while later pages are still being fetched.
+        
+        Pages are fetched in windows of offsets at once: the first window is one
+        page, and each window that comes back full doubles the next one, up to
+        `concurrency`, so short searches don't request pages past their end.
+        Results are consumed in offset order, so pagination still stops at the
+        last page and jobs come out in the same order as a sequential crawl.
+        Pages not started yet when pagination stops (or the consumer stops
+        early) are cancelled rather than waited for.
+        
+        In incremental mode results are sorted newest first, only jobs not seen
+        by earlier runs for this (keyword, location) are yielded, and pagination
+        stops at the first page made up entirely of known jobs.
+        
+        Args:
+            keyword: Job search keyword
+            location: Job location
+            max_results: Maximum number of jobs to yield
+            concurrency: Number of pages fetched in parallel (1 = sequential)
+            requests_per_second: Extra cap on page requests per second (the transport
+                already paces linkedin.com, see rate_limiter.DEFAULT_HOST_RATES)
+            incremental: Only yield jobs not discovered by previous runs
+            limiter: Shared RateLimiter to use instead of requests_per_second
+            
+        Yields:
+            Job dictionaries with job_url, company_name, title, location
+        """
+        total = 0
+        emitted_keys = []  # Only kept in incremental mode
         start = 0
-        page_size = 25  # LinkedIn returns 25 jobs per page
+        page_size = LINKEDIN_PAGE_SIZE
+        concurrency = max(1, concurrency)
+        if limiter is None and requests_per_second:
+            limiter = RateLimiter(requests_per_second)
+        known_jobs = self.seen_jobs.ids(keyword, location) if incremental else None
         
         logger.info("=" * 60)
         logger.info("🆓 FREE LinkedIn Public API Job Discovery")
         logger.info("=" * 60)
         
-        while len(jobs) < max_results:
-            try:
-                # Build LinkedIn public guest endpoint URL
-                base_url = "https://www.linkedin.com/jobs-guest/jobs/api/seeMoreJobPostings/search"
-                params = {
-                    "keywords": keyword,
-                    "location": location,
-                    "start": start
-                }
-                
-                # Build query string
-                query_string = "&".join([f"{k}={quote_plus(str(v))}" for k, v in params.items()])
-                url = f"{base_url}?{query_string}"
-                
-                logger.info(f"📡 Fetching jobs {start} to {start + page_size}...")
-                
-                res = self.session.get(url, timeout=15)
-                res.raise_for_status()
-                
-                # Parse HTML response
-                soup = BeautifulSoup(res.text, "html.parser")
-                
-                # Find all job cards
-                job_cards = soup.find_all("div", class_=re.compile(r"base-card|job-result-card", re.I))
-                
-                if not job_cards:
-                    # Try alternative selectors
-                    job_cards = soup.find_all("li", class_=re.compile(r"result-card", re.I))
-                
-                if not job_cards:
-                    logger.warning("No job cards found in response. LinkedIn may have changed structure.")
-                    break
+        executor = ThreadPoolExecutor(max_workers=concurrency)
+        try:
+            reached_end = False
+            window = 1
+            while not reached_end and total < max_results:
+                # Never request more pages than max_results still needs
+                pages_needed = -(-(max_results - total) // page_size)
+                offsets = [start + i * page_size for i in range(min(window, pages_needed))]
+                futures = [
+                    executor.submit(
+                        self._fetch_linkedin_public_page, keyword, location, offset, limiter, incremental
+                    )
+                    for offset in offsets
+                ]
                 
-                page_jobs = []
-                for card in job_cards:
+                for future in futures:
                     try:
-                        # Extract job URL
-                        link_elem = card.find("a", href=re.compile(r"/jobs/view/"))
-                        if not link_elem:
-                            continue
-                        
-                        job_path = link_elem.get("href", "")
-                        if not job_path.startswith("http"):
-                            job_url = "https://www.linkedin.com" + job_path
-                        else:
-                            job_url = job_path
-                        
-                        # Extract job title
-                        title_elem = card.find("h3", class_=re.compile(r"title|job-title", re.I)) or \
-                                    card.find("h3") or \
-                                    link_elem.find("h3")
-                        title = title_elem.text.strip() if title_elem else "Unknown"
-                        
-                        # Extract company name
-                        company_elem = card.find("h4", class_=re.compile(r"company|subtitle", re.I)) or \
-                                     card.find("h4") or \
-                                     card.find("a", class_=re.compile(r"company", re.I))
-                        company_name = company_elem.text.strip() if company_elem else "Unknown"
-                        
-                        # Extract location
-                        location_elem = card.find("span", class_=re.compile(r"location|job-location", re.I)) or \
-                                       card.find("div", class_=re.compile(r"location", re.I))
-                        job_location = location_elem.text.strip() if location_elem else location
-                        
-                        # Extract job ID from URL
-                        job_id_match = re.search(r'/jobs/view/(\d+)', job_url)
-                        job_id = job_id_match.group(1) if job_id_match else None
-                        
-                        page_jobs.append({
-                            "job_url": job_url,
-                            "job_id": job_id,
-                            "title": title,
-                            "company_name": company_name,
-                            "location": job_location,
-                            "source": "linkedin_public_api"
-                        })
+                        page_jobs = future.result()
+                    except requests.exceptions.RequestException as e:
+                        logger.error(f"❌ Error fetching jobs: {e}")
+                        reached_end = True
+                        break
                     except Exception as e:
-                        logger.debug(f"Error parsing job card: {e}")
-                        continue
-                
-                if not page_jobs:
-                    logger.info("No more jobs found. Reached end of results.")
-                    break
-                
-                jobs.extend(page_jobs)
-                logger.info(f"✅ Found {len(page_jobs)} jobs (total: {len(jobs)})")
-                
-                # Check if there are more pages
-                if len(page_jobs) < page_size:
-                    break
-                
-                start += page_size
-                time.sleep(1)  # Rate limiting - be nice to LinkedIn
+                        logger.error(f"❌ Unexpected error: {e}")
+                        reached_end = True
+                        break
+                    
+                    if page_jobs is None:
+                        logger.warning("No job cards found in response. LinkedIn may have changed structure.")
+                        reached_end = True
+                        break
+                    
+                    if not page_jobs:
+                        logger.info("No more jobs found. Reached end of results.")
+                        reached_end = True
+                        break
+                    
+                    new_jobs = page_jobs
+                    if known_jobs is not None:
+                        new_jobs = [job for job in page_jobs if job_key(job) not in known_jobs]
+                        if not new_jobs:
+                            logger.info("🛑 Page contains only previously seen jobs. Stopping.")
+                            reached_end = True
+                            break
+                    
+                    new_jobs = new_jobs[:max_results - total]
+                    total += len(new_jobs)
+                    logger.info(f"✅ Found {len(new_jobs)} jobs (total: {total})")
+                    for job in new_jobs:
+                        if incremental:
+                            emitted_keys.append(job_key(job))
+                        yield job
+                    
+                    # Check if there are more pages
+                    if len(page_jobs) < page_size or total >= max_results:
+                        reached_end = True
+                        break
                 
-            except requests.exceptions.RequestException as e:
-                logger.error(f"❌ Error fetching jobs: {e}")
-                break
-            except Exception as e:
-                logger.error(f"❌ Unexpected error: {e}")
-                break
+                start += len(offsets) * page_size
+                # Every page in the window was full, so the results likely go on
+                window = min(concurrency, window * 2)
+            
+            logger.info(f"✅ Total jobs discovered: {total}")
+        finally:
+            # Pages past the end (or left behind by a consumer that stopped early) aren't waited for
+            executor.shutdown(wait=False, cancel_futures=True)
+            # Also runs when the consumer stops early, so only handed-out jobs are remembered
+            if incremental:
+                self._remember_job_keys(keyword, location, emitted_keys)
+    
+    def discover_jobs_batch(
+        self,
+        queries: List[Tuple[str, str]],
+        max_results_per_query: int = 100,
+        workers: int = 4,
+        requests_per_second: Optional[float] = None,
+        incremental: bool = False
+    ) -> List[Dict]:
+        """
+        FREE: Discover jobs for many (keyword, location) queries at once
+        
+        Queries run on a shared worker pool paced by the transport's per-host
+        scheduler (plus requests_per_second if given), and jobs
+        returned by several overlapping queries are kept only once (first query
+        in list order wins). Repeated queries are run once. Per-query yield is
+        kept in self.query_yields.
+        
+        Args:
+            queries: List of (keyword, location) tuples
+            max_results_per_query: Maximum jobs retrieved per query
+            workers: Number of queries fetched in parallel
+            requests_per_second: Extra cap on guest search requests per second across all
+                queries (the transport already paces linkedin.com)
+            incremental: Only return jobs not discovered by previous runs
+            
+        Returns:
+            List of unique job dictionaries
+        """
+        queries = unique_queries(queries)
+        limiter = RateLimiter(requests_per_second) if requests_per_second else None
+        results: Dict[Tuple[str, str], List[Dict]] = {}
+        
+        logger.info(f"🗂️  Batch discovery for {len(queries)} queries")
+        
+        with ThreadPoolExecutor(max_workers=max(1, workers)) as executor:
+            futures = {
+                executor.submit(
+                    self.discover_jobs_linkedin_public_api,
+                    keyword, location, max_results_per_query, 1, requests_per_second, incremental, limiter
+                ): (keyword, location)
+                for keyword, location in queries
+            }
+            for future in as_completed(futures):
+                query = futures[future]
+                try:
+                    results[query] = future.result()
+                except Exception as e:
+                    logger.error(f"❌ Batch query {query} failed: {e}")
+                    results[query] = []
         
-        logger.info(f"✅ Total jobs discovered: {len(jobs)}")
-        return jobs[:max_results]
+        return self._merge_query_results(queries, results)
+    
+    def _merge_query_results(self, queries: List[Tuple[str, str]], results: Dict[Tuple[str, str], List[Dict]]) -> List[Dict]:
+        """Dedupe per-query discovery results and record each query's yield in self.query_yields"""
+        # Merge in query order so the outcome doesn't depend on thread timing
+        index = JobIndex()
+        self.query_yields = {}
+        for query in queries:
+            query_jobs = results.get(query, [])
+            unique = sum(index.add(job) for job in query_jobs)
+            self.query_yields[query] = {"found": len(query_jobs), "unique": unique}
+            logger.info(f"📊 {query[0]} / {query[1]}: {len(query_jobs)} found, {unique} unique")
+        
+        logger.info(f"✅ Batch discovery: {len(index)} unique jobs")
+        return index.jobs()
+    
+    @property
+    def seen_jobs(self) -> SeenJobStore:
+        """Persistent seen-job store, loaded on first use"""
+        if self._seen_jobs is None:
+            self._seen_jobs = SeenJobStore(self.seen_jobs_path)
+        return self._seen_jobs
+    
+    def _remember_job_keys(self, keyword: str, location: str, keys: List[str]) -> None:
+        """Mark job keys as seen for this query and persist the store"""
+        self.seen_jobs.add(keyword, location, keys)
+        try:
+            self.seen_jobs.save()
+        except OSError as e:
+            logger.warning(f"⚠️  Could not save seen jobs: {e}")
+    
+    def filter_new_jobs(self, keyword: str, location: str, jobs: List[Dict]) -> List[Dict]:
+        """Drop jobs already seen for this query and remember the rest"""
+        return list(self.iter_new_jobs(keyword, location, jobs))
+    
+    def iter_new_jobs(self, keyword: str, location: str, jobs: Iterable[Dict]) -> Iterator[Dict]:
+        """Streaming variant of filter_new_jobs"""
+        known_jobs = self.seen_jobs.ids(keyword, location)
+        new_keys = []
+        try:
+            for job in jobs:
+                key = job_key(job)
+                if key in known_jobs:
+                    continue
+                known_jobs.add(key)
+                new_keys.append(key)
+                yield job
+        finally:
+            logger.info(f"🆕 {len(new_keys)} new jobs")
+            self._remember_job_keys(keyword, location, new_keys)
+    
+    def _fetch_linkedin_public_page(
+        self,
+        keyword: str,
+        location: str,
+        start: int,
+        limiter: Optional[RateLimiter] = None,
+        newest_first: bool = False
+    ) -> Optional[List[Dict]]:
+        """
+        Fetch and parse one page of the LinkedIn guest job search endpoint
+        
+        Args:
+            newest_first: Sort results by posting date (newest first)
+        
+        Returns:
+            List of job dictionaries for the page, or None if the response had no job cards
+        """
+        cache_source, url = self._guest_search_request(keyword, location, start, newest_first)
+        if self.discovery_cache is not None:
+            cached = self.discovery_cache.get(cache_source, keyword, location, start)
+            if cached is not None:
+                return cached
+        
+        if limiter:
+            limiter.acquire()
+        
+        logger.info(f"📡 Fetching jobs {start} to {start + LINKEDIN_PAGE_SIZE}...")
+        
+        res = fetch_page(self.session, url, self.max_page_bytes["linkedin"], timeout=15)
+        res.raise_for_status()
+        
+        # Parse job cards (precompiled lxml XPath, see guest_cards.py)
+        page_jobs = parse_guest_job_cards(res.text, location)
+        if page_jobs is None:
+            return None
+        
+        if self.discovery_cache is not None:
+            self.discovery_cache.set(cache_source, keyword, location, start, page_jobs)
+        
+        return page_jobs
+    
+    @staticmethod
+    def _guest_search_request(keyword: str, location: str, start: int, newest_first: bool = False) -> Tuple[str, str]:
+        """Discovery cache source and URL of one guest job search page"""
+        # Build LinkedIn public guest endpoint URL
+        base_url = "https://www.linkedin.com/jobs-guest/jobs/api/seeMoreJobPostings/search"
+        params = {
+            "keywords": keyword,
+            "location": location,
+            "start": start
+        }
+        if newest_first:
+            params["sortBy"] = "DD"
+        
+        # Build query string
+        query_string = "&".join([f"{k}={quote_plus(str(v))}" for k, v in params.items()])
+        cache_source = "linkedin_public_api/newest" if newest_first else "linkedin_public_api"
+        return cache_source, f"{base_url}?{query_string}"
     
     def discover_jobs_playwright(
         self,
         keyword: str = "software engineer",
         location: str = "United States",
-        max_results: int = 50
+        max_results: int = 50,
+        scroll_target: Optional[int] = None,
+        scroll_timeout: float = 5.0
     ) -> List[Dict]:
         """
         FREE: Use Playwright to scrape LinkedIn jobs (more reliable)
         
+        Collects iter_jobs_playwright into a list.
+        
         Args:
             keyword: Job search keyword
             location: Job location
             max_results: Maximum number of jobs
+            scroll_target: Number of loaded job cards to scroll for (default: max_results)
+            scroll_timeout: Seconds to wait for more cards after each scroll
             
         Returns:
             List of job dictionaries
         """
+        return list(self.iter_jobs_playwright(keyword, location, max_results, scroll_target, scroll_timeout))
+    
+    def iter_jobs_playwright(
+        self,
+        keyword: str = "software engineer",
+        location: str = "United States",
+        max_results: int = 50,
+        scroll_target: Optional[int] = None,
+        scroll_timeout: float = 5.0
+    ) -> Iterator[Dict]:
+        """
+        Streaming variant of discover_jobs_playwright
+        
+        Jobs are yielded as each card is extracted. Falls back to the guest
+        search endpoint if Playwright fails before yielding anything.
+        
+        Args:
+            keyword: Job search keyword
+            location: Job location
+            max_results: Maximum number of jobs
+            scroll_target: Number of loaded job cards to scroll for (default: max_results)
+            scroll_timeout: Seconds to wait for more cards after each scroll
+            
+        Yields:
+            Job dictionaries
+        """
         if not self.use_playwright:
             logger.warning("Playwright not available, falling back to requests")
-            return self.discover_jobs_linkedin_public_api(keyword, location, max_results)
+            yield from self.iter_jobs_linkedin_public_api(keyword, location, max_results)
+            return
+        
+        cache_source = f"playwright/{max_results}"
+        if self.discovery_cache is not None:
+            cached = self.discovery_cache.get(cache_source, keyword, location, 0)
+            if cached is not None:
+                yield from cached
+                return
         
+        found = 0
+        jobs = []
         try:
-            from playwright.sync_api import sync_playwright
-            
             logger.info("🎭 Using Playwright for job discovery...")
             
-            with sync_playwright() as p:
-                browser = p.chromium.launch(headless=True)
-                page = browser.new_page()
-                
+            with self._browser_page() as page:
                 # Build LinkedIn job search URL
                 search_url = f"https://www.linkedin.com/jobs/search/?keywords={quote_plus(keyword)}&location={quote_plus(location)}"
                 
                 logger.info(f"🌐 Navigating to: {search_url}")
-                page.goto(search_url, wait_until="networkidle", timeout=30000)
+                self.transport.scheduler.acquire(search_url)
+                page.goto(search_url, wait_until="domcontentloaded", timeout=30000)
                 
                 # Wait for job listings to load
                 page.wait_for_selector("ul.jobs-search__results-list", timeout=10000)
                 
-                # Scroll to load more jobs
-                for _ in range(3):  # Scroll 3 times to load more
-                    page.evaluate("window.scrollTo(0, document.body.scrollHeight)")
-                    time.sleep(2)
-                
-                # Extract jobs
-                jobs = []
-                job_elements = page.query_selector_all("li.jobs-search-results__list-item")
-                
-                for elem in job_elements[:max_results]:
-                    try:
-                        link_elem = elem.query_selector("a.base-card__full-link")
-                        if not link_elem:
-                            continue
-                        
-                        job_url = link_elem.get_attribute("href")
-                        if not job_url.startswith("http"):
-                            job_url = "https://www.linkedin.com" + job_url
-                        
-                        title_elem = elem.query_selector("h3.base-search-card__title")
-                        title = title_elem.inner_text() if title_elem else "Unknown"
-                        
-                        company_elem = elem.query_selector("h4.base-search-card__subtitle")
-                        company_name = company_elem.inner_text() if company_elem else "Unknown"
-                        
-                        location_elem = elem.query_selector("span.job-search-card__location")
-                        job_location = location_elem.inner_text() if location_elem else location
-                        
-                        jobs.append({
-                            "job_url": job_url,
-                            "title": title,
-                            "company_name": company_name,
-                            "location": job_location,
-                            "source": "playwright"
-                        })
-                    except Exception as e:
-                        logger.debug(f"Error extracting job: {e}")
-                        continue
-                
-                browser.close()
+                # Scroll until enough job cards are loaded
+                self._scroll_job_list(page, scroll_target or max_results, scroll_timeout)
                 
-                logger.info(f"✅ Found {len(jobs)} jobs via Playwright")
-                return jobs
+                # Extract all jobs in a single round-trip to the browser
+                cards = page.evaluate(PLAYWRIGHT_EXTRACT_JOBS_JS, [PLAYWRIGHT_JOB_CARD_SELECTOR, max_results])
                 
+                for card in cards:
+                    job_url = card["job_url"]
+                    if not job_url.startswith("http"):
+                        job_url = "https://www.linkedin.com" + job_url
+                    
+                    job = {
+                        "job_url": job_url,
+                        "job_id": extract_linkedin_job_id(job_url),
+                        "title": card["title"] or "Unknown",
+                        "company_name": card["company_name"] or "Unknown",
+                        "location": card["location"] or location,
+                        "source": "playwright"
+                    }
+                    
+                    found += 1
+                    jobs.append(job)
+                    yield job
+            
+            logger.info(f"✅ Found {found} jobs via Playwright")
+            if self.discovery_cache is not None:
+                self.discovery_cache.set(cache_source, keyword, location, 0, jobs)
+            
         except ImportError:
             logger.warning("Playwright not installed")
-            return self.discover_jobs_linkedin_public_api(keyword, location, max_results)
+            yield from self.iter_jobs_linkedin_public_api(keyword, location, max_results)
         except Exception as e:
             logger.error(f"❌ Playwright error: {e}")
-            return self.discover_jobs_linkedin_public_api(keyword, location, max_results)
+            # Only fall back if nothing was handed out yet, otherwise callers would see duplicates
+            if not found:
+                yield from self.iter_jobs_linkedin_public_api(keyword, location, max_results)
+    
+    def _scroll_job_list(self, page, target: int, timeout: float, max_scrolls: int = 50) -> int:
+        """
+        Scroll the job list until `target` cards are loaded
+        
+        Each scroll waits for the card count to grow instead of sleeping a fixed
+        time. Stops when the target is reached or no new cards appear within
+        `timeout` seconds (after trying LinkedIn's "See more jobs" button).
+        
+        Returns:
+            Number of job cards loaded
+        """
+        from playwright.sync_api import TimeoutError as PlaywrightTimeoutError
+        
+        count = page.locator(PLAYWRIGHT_JOB_CARD_SELECTOR).count()
+        clicked_show_more = False
+        for _ in range(max_scrolls):
+            if count >= target:
+                break
+            
+            page.evaluate("window.scrollTo(0, document.body.scrollHeight)")
+            try:
+                page.wait_for_function(
+                    "([selector, count]) => document.querySelectorAll(selector).length > count",
+                    arg=[PLAYWRIGHT_JOB_CARD_SELECTOR, count],
+                    timeout=timeout * 1000
+                )
+            except PlaywrightTimeoutError:
+                # Past a few pages LinkedIn stops infinite scroll and shows a button instead
+                show_more = page.query_selector("button.infinite-scroller__show-more-button")
+                if clicked_show_more or not show_more or not show_more.is_visible():
+                    break
+                show_more.click()
+                clicked_show_more = True
+                continue
+            
+            clicked_show_more = False
+            count = page.locator(PLAYWRIGHT_JOB_CARD_SELECTOR).count()
+        
+        count = page.locator(PLAYWRIGHT_JOB_CARD_SELECTOR).count()
+        logger.info(f"📜 Loaded {count} job cards")
+        return count
     
     # ==================== STEP 2: FREE Company Website Extraction ====================
     
@@ -320,48 +773,10 @@ class FreeJobSourceAgent:
             logger.info(f"📋 Extracting company data from: {job_url}")
             
             # Method 1: Try to get company info from job page
-            res = self.session.get(job_url, timeout=15)
+            res = self.page_cache.fetch(self.session, job_url, self.max_page_bytes["linkedin"], timeout=15)
             res.raise_for_status()
             
-            soup = BeautifulSoup(res.text, "html.parser")
-            
-            # Find company name
-            company_name = None
-            company_elem = soup.find("a", class_=re.compile(r"topcard__org-name-link|company-name", re.I)) or \
-                          soup.find("h4", class_=re.compile(r"topcard__flavor", re.I)) or \
-                          soup.find("a", {"data-tracking-control-name": re.compile(r"public_jobs.*company", re.I)})
-            
-            if company_elem:
-                company_name = company_elem.text.strip()
-            
-            # Find company LinkedIn URL - try multiple methods
-            company_linkedin_url = None
-            
-            # Method 1: From company element
-            if company_elem and company_elem.get("href"):
-                company_path = company_elem.get("href")
-                if not company_path.startswith("http"):
-                    company_linkedin_url = "https://www.linkedin.com" + company_path
-                else:
-                    company_linkedin_url = company_path
-            
-            # Method 2: Search for company links in page
-            if not company_linkedin_url:
-                company_link = soup.find("a", href=re.compile(r"/company/[^/]+", re.I))
-                if company_link:
-                    path = company_link.get("href", "")
-                    if not path.startswith("http"):
-                        company_linkedin_url = "https://www.linkedin.com" + path
-                    else:
-                        company_linkedin_url = path
-            
-            # Method 3: Extract from job URL structure or meta tags
-            if not company_linkedin_url:
-                # Try to extract from URL pattern: ...-at-company-name-...
-                url_match = re.search(r'-at-([^-]+(?:-[^-]+)*?)-', job_url)
-                if url_match:
-                    company_slug = url_match.group(1)
-                    company_linkedin_url = f"https://www.linkedin.com/company/{company_slug}/"
+            company_name, company_linkedin_url = self._parse_job_page_company(res.soup(self.html_parser), job_url)
             
             # If we have company LinkedIn URL, try to get website from company page
             if company_linkedin_url:
@@ -390,119 +805,134 @@ class FreeJobSourceAgent:
             logger.error(f"❌ Error extracting company data: {e}")
             return None
     
+    @staticmethod
+    def _parse_job_page_company(soup, job_url: str) -> Tuple[Optional[str], Optional[str]]:
+        """Company name and LinkedIn company page URL from a parsed LinkedIn job page"""
+        # Find company name
+        company_name = None
+        company_elem = soup.find("a", class_=re.compile(r"topcard__org-name-link|company-name", re.I)) or \
+                      soup.find("h4", class_=re.compile(r"topcard__flavor", re.I)) or \
+                      soup.find("a", {"data-tracking-control-name": re.compile(r"public_jobs.*company", re.I)})
+        
+        if company_elem:
+            company_name = company_elem.text.strip()
+        
+        # Find company LinkedIn URL - try multiple methods
+        company_linkedin_url = None
+        
+        # Method 1: From company element
+        if company_elem and company_elem.get("href"):
+            company_path = company_elem.get("href")
+            if not company_path.startswith("http"):
+                company_linkedin_url = "https://www.linkedin.com" + company_path
+            else:
+                company_linkedin_url = company_path
+        
+        # Method 2: Search for company links in page
+        if not company_linkedin_url:
+            company_link = soup.find("a", href=re.compile(r"/company/[^/]+", re.I))
+            if company_link:
+                path = company_link.get("href", "")
+                if not path.startswith("http"):
+                    company_linkedin_url = "https://www.linkedin.com" + path
+                else:
+                    company_linkedin_url = path
+        
+        # Method 3: Extract from job URL structure or meta tags
+        if not company_linkedin_url:
+            # Try to extract from URL pattern: ...-at-company-name-...
+            url_match = re.search(r'-at-([^-]+(?:-[^-]+)*?)-', job_url)
+            if url_match:
+                company_slug = url_match.group(1)
+                company_linkedin_url = f"https://www.linkedin.com/company/{company_slug}/"
+        
+        return company_name, company_linkedin_url
+    
     def _extract_website_from_company_page(self, company_linkedin_url: str) -> Optional[str]:
         """Extract website from LinkedIn company page"""
         try:
             logger.info(f"🔍 Extracting website from company page: {company_linkedin_url}")
-            res = self.session.get(company_linkedin_url, timeout=15)
+            res = self.page_cache.fetch(self.session, company_linkedin_url, self.max_page_bytes["linkedin"], timeout=15)
             res.raise_for_status()
             
-            soup = BeautifulSoup(res.text, "html.parser")
-            
-            # Method 1: Find website link with specific selectors
-            website_elem = (
-                soup.find("a", href=re.compile(r"^https?://", re.I), 
-                         class_=re.compile(r"website|link", re.I)) or
-                soup.find("a", {"data-tracking-control-name": re.compile(r"website", re.I)}) or
-                soup.find("a", {"data-control-name": re.compile(r"website", re.I)}) or
-                soup.find("dd", class_=re.compile(r"website", re.I))
-            )
-            
-            if website_elem:
-                href = website_elem.get("href") or website_elem.text.strip()
-                if href and href.startswith("http"):
-                    return href
-            
-            # Method 2: Look for structured data (JSON-LD)
-            json_ld_scripts = soup.find_all("script", type="application/ld+json")
-            for script in json_ld_scripts:
-                try:
-                    import json
-                    data = json.loads(script.string)
-                    if isinstance(data, dict):
-                        # Try various paths
-                        url = (data.get("url") or 
-                              data.get("sameAs") or
-                              (data.get("contactPoint", {}) if isinstance(data.get("contactPoint"), dict) else {}).get("url"))
-                        if url and isinstance(url, str) and url.startswith("http"):
-                            return url
-                except:
-                    continue
-            
-            # Method 3: Search for external links in company info section
-            company_section = soup.find("section", class_=re.compile(r"company|about", re.I)) or \
-                            soup.find("div", class_=re.compile(r"company-info", re.I))
-            
-            if company_section:
-                for link in company_section.find_all("a", href=re.compile(r"^https?://", re.I)):
-                    href = link.get("href", "")
-                    if "linkedin.com" not in href and not href.startswith("mailto:") and not href.startswith("tel:"):
-                        # Filter out social media links
-                        if not any(social in href.lower() for social in ["facebook.com", "twitter.com", "instagram.com", "youtube.com"]):
-                            return href
-            
-            # Method 4: Try to find any external link (last resort)
-            # Filter out LinkedIn URLs more strictly
-            for link in soup.find_all("a", href=re.compile(r"^https?://", re.I)):
-                href = link.get("href", "")
-                if (href and 
-                    "linkedin.com" not in href.lower() and 
-                    not href.startswith("mailto:") and 
-                    not href.startswith("tel:") and
-                    not any(social in href.lower() for social in ["facebook.com", "twitter.com", "instagram.com", "youtube.com", "linkedin.com/in", "linkedin.com/top-content", "linkedin.com/jobs/search"])):
-                    # Prefer .com, .org, .io domains
-                    if any(domain in href.lower() for domain in [".com", ".org", ".io", ".ai", ".net"]):
-                        return href
-            
-            return None
+            return self._parse_company_page_website(res.soup(self.html_parser))
             
         except Exception as e:
             logger.debug(f"Error extracting from company page: {e}")
             return None
     
+    @staticmethod
+    def _parse_company_page_website(soup) -> Optional[str]:
+        """Company website from a parsed LinkedIn company page"""
+        # Method 1: Find website link with specific selectors
+        website_elem = (
+            soup.find("a", href=re.compile(r"^https?://", re.I), 
+                     class_=re.compile(r"website|link", re.I)) or
+            soup.find("a", {"data-tracking-control-name": re.compile(r"website", re.I)}) or
+            soup.find("a", {"data-control-name": re.compile(r"website", re.I)}) or
+            soup.find("dd", class_=re.compile(r"website", re.I))
+        )
+        
+        if website_elem:
+            href = website_elem.get("href") or website_elem.text.strip()
+            if href and href.startswith("http"):
+                return href
+        
+        # Method 2: Look for structured data (JSON-LD)
+        json_ld_scripts = soup.find_all("script", type="application/ld+json")
+        for script in json_ld_scripts:
+            try:
+                import json
+                data = json.loads(script.string)
+                if isinstance(data, dict):
+                    # Try various paths
+                    url = (data.get("url") or 
+                          data.get("sameAs") or
+                          (data.get("contactPoint", {}) if isinstance(data.get("contactPoint"), dict) else {}).get("url"))
+                    if url and isinstance(url, str) and url.startswith("http"):
+                        return url
+            except:
+                continue
+        
+        # Method 3: Search for external links in company info section
+        company_section = soup.find("section", class_=re.compile(r"company|about", re.I)) or \
+                        soup.find("div", class_=re.compile(r"company-info", re.I))
+        
+        if company_section:
+            for link in company_section.find_all("a", href=re.compile(r"^https?://", re.I)):
+                href = link.get("href", "")
+                if "linkedin.com" not in href and not href.startswith("mailto:") and not href.startswith("tel:"):
+                    # Filter out social media links
+                    if not any(social in href.lower() for social in ["facebook.com", "twitter.com", "instagram.com", "youtube.com"]):
+                        return href
+        
+        # Method 4: Try to find any external link (last resort)
+        # Filter out LinkedIn URLs more strictly
+        for link in soup.find_all("a", href=re.compile(r"^https?://", re.I)):
+            href = link.get("href", "")
+            if (href and 
+                "linkedin.com" not in href.lower() and 
+                not href.startswith("mailto:") and 
+                not href.startswith("tel:") and
+                not any(social in href.lower() for social in ["facebook.com", "twitter.com", "instagram.com", "youtube.com", "linkedin.com/in", "linkedin.com/top-content", "linkedin.com/jobs/search"])):
+                # Prefer .com, .org, .io domains
+                if any(domain in href.lower() for domain in [".com", ".org", ".io", ".ai", ".net"]):
+                    return href
+        
+        return None
+    
     def _get_company_website_by_name(self, company_name: str) -> Optional[str]:
         """
         Try to get company website by searching common patterns
         This is a fallback when LinkedIn extraction fails
         """
         try:
-            # Common patterns for well-known companies
-            company_websites = {
-                "netflix": "https://jobs.netflix.com",
-                "nike": "https://jobs.nike.com",
-                "intuit": "https://www.intuit.com/careers",
-                "nuro": "https://www.nuro.ai/careers",
-                "seatgeek": "https://seatgeek.com/jobs",
-                "google": "https://careers.google.com",
-                "microsoft": "https://careers.microsoft.com",
-                "apple": "https://www.apple.com/careers",
-                "amazon": "https://www.amazon.jobs",
-                "meta": "https://www.metacareers.com",
-                "facebook": "https://www.metacareers.com",
-            }
-            
-            company_lower = company_name.lower().strip()
-            if company_lower in company_websites:
-                website = company_websites[company_lower]
-                logger.info(f"✅ Found website via lookup: {website}")
+            website = self._known_company_website(company_name)
+            if website:
                 return website
             
-            # Also check if company name contains known company names
-            for known_company, website in company_websites.items():
-                if known_company in company_lower:
-                    logger.info(f"✅ Found website via partial match: {website}")
-                    return website
-            
-            # Try common domain patterns
-            company_slug = company_lower.replace(" ", "").replace("-", "")
-            common_domains = [
-                f"https://www.{company_slug}.com",
-                f"https://{company_slug}.com",
-                f"https://www.{company_lower.replace(' ', '-')}.com",
-            ]
-            
             # Test if domain exists (quick check)
-            for domain in common_domains:
+            for domain in self._company_domain_guesses(company_name):
                 try:
                     test_res = self.session.head(domain, timeout=5, allow_redirects=True)
                     if test_res.status_code < 400:
@@ -517,6 +947,50 @@ class FreeJobSourceAgent:
             logger.debug(f"Error in company website lookup: {e}")
             return None
     
+    @staticmethod
+    def _known_company_website(company_name: str) -> Optional[str]:
+        """Website of a well-known company, matched on its name"""
+        # Common patterns for well-known companies
+        company_websites = {
+            "netflix": "https://jobs.netflix.com",
+            "nike": "https://jobs.nike.com",
+            "intuit": "https://www.intuit.com/careers",
+            "nuro": "https://www.nuro.ai/careers",
+            "seatgeek": "https://seatgeek.com/jobs",
+            "google": "https://careers.google.com",
+            "microsoft": "https://careers.microsoft.com",
+            "apple": "https://www.apple.com/careers",
+            "amazon": "https://www.amazon.jobs",
+            "meta": "https://www.metacareers.com",
+            "facebook": "https://www.metacareers.com",
+        }
+        
+        company_lower = company_name.lower().strip()
+        if company_lower in company_websites:
+            website = company_websites[company_lower]
+            logger.info(f"✅ Found website via lookup: {website}")
+            return website
+        
+        # Also check if company name contains known company names
+        for known_company, website in company_websites.items():
+            if known_company in company_lower:
+                logger.info(f"✅ Found website via partial match: {website}")
+                return website
+        
+        return None
+    
+    @staticmethod
+    def _company_domain_guesses(company_name: str) -> List[str]:
+        """Likely homepage URLs built from the company name, to be tested in order"""
+        # Try common domain patterns
+        company_lower = company_name.lower().strip()
+        company_slug = company_lower.replace(" ", "").replace("-", "")
+        return [
+            f"https://www.{company_slug}.com",
+            f"https://{company_slug}.com",
+            f"https://www.{company_lower.replace(' ', '-')}.com",
+        ]
+    
     def _extract_company_via_scrapin_free(self, job_url: str) -> Optional[Tuple[str, str]]:
         """Use Scrapin FREE tier (100 calls/day)"""
         try:
@@ -526,20 +1000,24 @@ class FreeJobSourceAgent:
             res = self.session.get(endpoint, params=params, timeout=30)
             res.raise_for_status()
             
-            data = res.json()
-            company_name = data.get("company", {}).get("name")
-            company_website = data.get("company", {}).get("website")
-            
-            if company_name and company_website:
-                logger.info(f"✅ [Scrapin FREE] Extracted: {company_name} → {company_website}")
-                return company_name, company_website
-            
-            return None
+            return self._parse_scrapin_company(res.json())
             
         except Exception as e:
             logger.debug(f"Scrapin free tier error: {e}")
             return None
     
+    @staticmethod
+    def _parse_scrapin_company(data: Dict) -> Optional[Tuple[str, str]]:
+        """(company_name, company_website) from a Scrapin job response, if it has both"""
+        company_name = data.get("company", {}).get("name")
+        company_website = data.get("company", {}).get("website")
+        
+        if company_name and company_website:
+            logger.info(f"✅ [Scrapin FREE] Extracted: {company_name} → {company_website}")
+            return company_name, company_website
+        
+        return None
+    
     # ==================== STEP 3: FREE LLM Web Navigator ====================
     
     def find_career_page_with_llm(self, company_website: str) -> Optional[str]:
@@ -552,6 +1030,23 @@ class FreeJobSourceAgent:
         Returns:
             Career page URL or None
         """
+        candidates = self.find_career_page_candidates(company_website)
+        return candidates[0] if candidates else None
+    
+    def find_career_page_candidates(self, company_website: str) -> List[str]:
+        """
+        Ranked career page candidates, best first
+        
+        Homepage links are scored in one pass (see link_ranking.rank_links), with
+        common career paths probed if no link qualifies. Only if that finds
+        nothing is the LLM asked for its pick.
+        
+        Args:
+            company_website: Company website URL
+            
+        Returns:
+            Candidate URLs, best first (empty if none found)
+        """
         try:
             if not company_website.startswith(('http://', 'https://')):
                 company_website = 'https://' + company_website
@@ -559,107 +1054,109 @@ class FreeJobSourceAgent:
             logger.info(f"🤖 Using LLM to find career page for: {company_website}")
             
             # First, try traditional method
-            career_page = self._find_career_page_traditional(company_website)
-            if career_page:
-                return career_page
+            candidates = self._find_career_page_candidates_traditional(company_website)
+            if candidates:
+                return candidates
             
             # If not found, use LLM to analyze page structure
             try:
-                import requests as req
-                
                 # Get page content
-                res = self.session.get(company_website, timeout=10)
-                soup = BeautifulSoup(res.text, "html.parser")
-                
-                # Extract all links
-                links = []
-                for a in soup.find_all("a", href=True)[:50]:  # Limit to first 50 links
-                    href = a.get("href", "")
-                    text = a.text.strip()
-                    if href and text:
-                        links.append(f"{text}: {href}")
-                
-                links_text = "\n".join(links[:20])  # Limit for LLM
-                
-                # Ask LLM which link is most likely the career page
-                prompt = f"""Given these links from a company website, which one is most likely the careers/jobs page?
-                
-Links:
-{links_text}
-
-Respond with ONLY the href URL of the most likely career page, or "none" if none seem relevant."""
+                res = self.page_cache.fetch(
+                    self.session, company_website, self.max_page_bytes["homepage"],
+                    allow_redirects=True, http_cache=self.http_cache
+                )
+                prompt = self._career_page_prompt(res.soup(self.html_parser, LINK_REGION_STRAINER))
                 
                 # Use Ollama API with your model
                 ollama_url = f"{self.ollama_base_url}/api/chat"
-                response = req.post(ollama_url, json={
-                    "model": self.ollama_model,  # Your model: gpt-oss:120b-cloud
-                    "messages": [{"role": "user", "content": prompt}],
-                    "stream": False
-                }, timeout=60)  # Increased timeout for large model
+                response = self.session.post(ollama_url, json=self._ollama_chat_payload(prompt), timeout=60)  # Increased timeout for large model
                 
                 if response.status_code == 200:
-                    data = response.json()
-                    llm_response = data.get("message", {}).get("content", "").strip().lower()
-                    
-                    if "none" not in llm_response and "http" in llm_response:
-                        # Extract URL from LLM response
-                        url_match = re.search(r'https?://[^\s<>"]+', llm_response)
-                        if url_match:
-                            career_url = url_match.group(0)
-                            logger.info(f"✅ LLM suggested career page: {career_url}")
-                            return career_url
+                    career_url = self._parse_llm_career_url(response.json())
+                    if career_url:
+                        return [career_url]
                 
-            except ImportError:
-                logger.warning("requests not available for Ollama API calls")
             except Exception as e:
                 logger.debug(f"LLM navigation error: {e}")
             
-            return None
+            return []
             
         except Exception as e:
             logger.error(f"❌ Error finding career page: {e}")
-            return None
+            return []
+    
+    @staticmethod
+    def _career_page_prompt(soup) -> str:
+        """Ollama prompt asking which of the homepage's links is the career page"""
+        # Extract all links
+        links = []
+        for a in soup.find_all("a", href=True)[:50]:  # Limit to first 50 links
+            href = a.get("href", "")
+            text = a.text.strip()
+            if href and text:
+                links.append(f"{text}: {href}")
+        
+        links_text = "\n".join(links[:20])  # Limit for LLM
+        
+        # Ask LLM which link is most likely the career page
+        return f"""Given these links from a company website, which one is most likely the careers/jobs page?
+                
+Links:
+{links_text}
+
+Respond with ONLY the href URL of the most likely career page, or "none" if none seem relevant."""
+    
+    def _ollama_chat_payload(self, prompt: str) -> Dict:
+        """Request body for a single-message Ollama /api/chat call"""
+        return {
+            "model": self.ollama_model,  # Your model: gpt-oss:120b-cloud
+            "messages": [{"role": "user", "content": prompt}],
+            "stream": False
+        }
     
-    def _find_career_page_traditional(self, company_website: str) -> Optional[str]:
-        """Traditional method to find career page"""
+    @staticmethod
+    def _parse_llm_career_url(data: Dict) -> Optional[str]:
+        """Career page URL from an Ollama chat response, or None if the LLM found none"""
+        llm_response = data.get("message", {}).get("content", "").strip().lower()
+        
+        if "none" not in llm_response and "http" in llm_response:
+            # Extract URL from LLM response
+            url_match = re.search(r'https?://[^\s<>"]+', llm_response)
+            if url_match:
+                career_url = url_match.group(0)
+                logger.info(f"✅ LLM suggested career page: {career_url}")
+                return career_url
+        
+        return None
+    
+    def _find_career_page_candidates_traditional(self, company_website: str) -> List[str]:
+        """Ranked career page candidates from homepage links, falling back to common paths"""
         try:
-            res = self.session.get(company_website, timeout=10, allow_redirects=True)
+            res = self.page_cache.fetch(
+                self.session, company_website, self.max_page_bytes["homepage"],
+                allow_redirects=True, http_cache=self.http_cache
+            )
             res.raise_for_status()
             
-            soup = BeautifulSoup(res.text, "html.parser")
-            base_url = f"{urlparse(company_website).scheme}://{urlparse(company_website).netloc}"
-            
-            # Search for career links
-            for a in soup.find_all("a", href=True):
-                href = a.get("href", "").lower()
-                text = (a.text or "").lower().strip()
-                
-                if any(keyword in href for keyword in CAREER_KEYWORDS) or \
-                   any(keyword in text for keyword in CAREER_KEYWORDS):
-                    
-                    if href.startswith("http"):
-                        return href
-                    elif href.startswith("/"):
-                        return base_url + href
-                    else:
-                        return urljoin(company_website, href)
-            
-            # Try common paths
-            common_paths = ["/careers", "/career", "/jobs", "/join-us", "/work-with-us"]
-            for path in common_paths:
-                try:
-                    test_url = urljoin(company_website, path)
-                    test_res = self.session.get(test_url, timeout=5, allow_redirects=True)
-                    if test_res.status_code == 200:
-                        return test_url
-                except:
-                    continue
+            ranked = self._rank_career_candidates(res, company_website)
+            if ranked:
+                return ranked
             
-            return None
+            # Probe common paths concurrently
+            career_url = probe_paths(self.transport, company_website, self.career_paths, timeout=5)
+            return [career_url] if career_url else []
             
         except Exception as e:
             logger.debug(f"Traditional method error: {e}")
-            return None
+            return []
+    
+    def _rank_career_candidates(self, homepage: FetchedPage, company_website: str) -> List[str]:
+        """Career page candidates among a fetched homepage's links, best first"""
+        soup = homepage.soup(self.html_parser, LINK_REGION_STRAINER)
+        ranked = rank_links(soup, homepage.url or company_website, self.career_matcher)
+        if ranked:
+            logger.info(f"✅ Found career page: {ranked[0]['url']} (score {ranked[0]['score']:.1f}, {len(ranked)} candidates)")
+        return [candidate["url"] for candidate in ranked]
     
     # ==================== STEP 4: Extract Job Posting ====================
     
@@ -668,32 +1165,16 @@ Respond with ONLY the href URL of the most likely career page, or "none" if none
         try:
             logger.info(f"💼 Extracting job posting from: {career_page_url}")
             
-            res = self.session.get(career_page_url, timeout=10, allow_redirects=True)
+            # Only the first job link is used, so stop downloading once one has arrived
+            res = self.page_cache.fetch(
+                self.session, career_page_url, self.max_page_bytes["career_page"],
+                stop_when=anchor_href_check(lambda href: self._is_job_link_href(href, career_page_url)),
+                allow_redirects=True, http_cache=self.http_cache
+            )
             res.raise_for_status()
             
-            soup = BeautifulSoup(res.text, "html.parser")
-            base_url = f"{urlparse(career_page_url).scheme}://{urlparse(career_page_url).netloc}"
-            
-            job_links = []
-            for a in soup.find_all("a", href=True):
-                href = a.get("href", "").lower()
-                text = (a.text or "").lower().strip()
-                
-                if any(keyword in href for keyword in JOB_KEYWORDS) or \
-                   any(keyword in text for keyword in JOB_KEYWORDS):
-                    
-                    if href.startswith("http"):
-                        job_url = href
-                    elif href.startswith("/"):
-                        job_url = base_url + href
-                    else:
-                        job_url = urljoin(career_page_url, href)
-                    
-                    if job_url not in job_links and "career" not in job_url.lower():
-                        job_links.append(job_url)
-            
-            if job_links:
-                selected_job = job_links[0]
+            selected_job = self._select_job_link(res.soup(self.html_parser, ANCHOR_STRAINER), career_page_url)
+            if selected_job:
                 logger.info(f"✅ Found job posting: {selected_job}")
                 return selected_job
             
@@ -704,6 +1185,32 @@ Respond with ONLY the href URL of the most likely career page, or "none" if none
             logger.error(f"❌ Error extracting job posting: {e}")
             return None
     
+    def _select_job_link(self, soup, career_page_url: str) -> Optional[str]:
+        """First job posting link on a parsed career page"""
+        base_url = f"{urlparse(career_page_url).scheme}://{urlparse(career_page_url).netloc}"
+        
+        for a in soup.find_all("a", href=True):
+            href = a.get("href", "").lower()
+            text = (a.text or "").lower().strip()
+            
+            if self.job_matcher.search(href) or self.job_matcher.search(text):
+                
+                if href.startswith("http"):
+                    job_url = href
+                elif href.startswith("/"):
+                    job_url = base_url + href
+                else:
+                    job_url = urljoin(career_page_url, href)
+                
+                if "career" not in job_url.lower():
+                    return job_url
+        
+        return None
+    
+    def _is_job_link_href(self, href: str, page_url: str) -> bool:
+        """Whether an href on `page_url` is a link extract_one_job would select"""
+        return self.job_matcher.search(href) and "career" not in urljoin(page_url, href).lower()
+    
     # ==================== STEP 5: Postgres Storage ====================
     
     def store_in_postgres(self, job_data: Dict) -> bool:
@@ -803,6 +1310,93 @@ Respond with ONLY the href URL of the most likely career page, or "none" if none
         logger.info(f"💾 Results saved to: {filename}")
         return filename
     
+    def process_job(self, job: Dict) -> Optional[Dict]:
+        """
+        Run Steps 2-5 of the FREE pipeline for one discovered job
+        
+        Args:
+            job: Job dictionary from discovery (needs job_url)
+            
+        Returns:
+            Result dictionary, or None if the job has no URL
+        """
+        job_url = job.get("job_url")
+        if not job_url:
+            return None
+        
+        # Step 2: Extract company data (FREE)
+        company_data = self.extract_company_website_from_linkedin_job(job_url)
+        if not company_data:
+            # Still save job info even if company extraction fails
+            return self._job_result(job, "company_extraction_failed")
+        
+        company_name, company_website = company_data
+        
+        # Step 3: Find career page (FREE - with LLM)
+        career_page = None
+        open_job = None
+        
+        if company_website:
+            candidates = self.find_career_page_candidates(company_website)
+            career_page = candidates[0] if candidates else None
+            # Step 4: Extract job posting, moving on to the next candidate if a page has none
+            for candidate in candidates[:self.MAX_CAREER_CANDIDATES]:
+                open_job = self.extract_one_job(candidate)
+                if open_job:
+                    career_page = candidate
+                    break
+        else:
+            logger.warning(f"⚠️  No website for {company_name}, skipping career page search")
+        
+        result = self._job_result(
+            job, "complete" if open_job else "partial",
+            company_name, company_website, career_page, open_job
+        )
+        
+        # Step 5: Store in Postgres (optional)
+        if self.postgres_config:
+            self.store_in_postgres(result)
+        
+        return result
+    
+    @staticmethod
+    def _job_result(
+        job: Dict,
+        status: str,
+        company_name: Optional[str] = None,
+        company_website: Optional[str] = None,
+        career_page: Optional[str] = None,
+        open_job: Optional[str] = None
+    ) -> Dict:
+        """Result dictionary for one processed job"""
+        return {
+            "linkedin_job_url": job.get("job_url"),
+            "company_name": company_name,
+            "company_website": company_website,
+            "career_page_url": career_page,
+            "open_position_url": open_job,
+            "title": job.get("title"),
+            "location": job.get("location"),
+            "source": "free_pipeline",
+            "status": status
+        }
+    
+    def _reset_page_caches(self) -> None:
+        """Forget the last run's pages and zero the HTTP cache counters"""
+        self.page_cache.clear()
+        if self.http_cache is not None:
+            self.http_cache.reset_stats()
+    
+    def _log_page_cache_stats(self) -> None:
+        stats = self.page_cache.stats()
+        logger.info(f"📄 Page cache: {stats['hits']} fetches saved, {stats['misses']} pages downloaded")
+        if self.http_cache is not None:
+            stats = self.http_cache.stats()
+            logger.info(
+                f"🗄️  HTTP cache: {stats['hits']} fresh, {stats['revalidated']} revalidated (304), "
+                f"{stats['misses']} downloaded"
+            )
+    
     def run_free_pipeline(
         self,
         keyword: str = "software engineer",
@@ -810,7 +1404,8 @@ Respond with ONLY the href URL of the most likely career page, or "none" if none
         max_jobs: int = 10,
         use_playwright: Optional[bool] = None,
         save_json: bool = True,
-        json_filename: Optional[str] = None
+        json_filename: Optional[str] = None,
+        incremental: bool = False
     ) -> List[Dict]:
         """
         Complete FREE pipeline - $0 cost!
@@ -822,6 +1417,7 @@ Respond with ONLY the href URL of the most likely career page, or "none" if none
             use_playwright: Override default Playwright setting
             save_json: Whether to save results to JSON file (default: True)
             json_filename: Optional JSON filename (default: auto-generated)
+            incremental: Only process jobs not discovered by previous runs
             
         Returns:
             List of complete job data
@@ -830,83 +1426,105 @@ Respond with ONLY the href URL of the most likely career page, or "none" if none
         logger.info("🆓 Starting 100% FREE Pipeline")
         logger.info("=" * 60)
         
+        self._reset_page_caches()
+        
         # Step 1: Discover jobs (FREE)
         if use_playwright is None:
             use_playwright = self.use_playwright
         
+        # Jobs are streamed, so Step 2 starts as soon as the first one is parsed
         if use_playwright:
-            jobs = self.discover_jobs_playwright(keyword, location, max_jobs)
+            jobs = self.iter_jobs_playwright(keyword, location, max_jobs)
+            if incremental:
+                jobs = self.iter_new_jobs(keyword, location, jobs)
         else:
-            jobs = self.discover_jobs_linkedin_public_api(keyword, location, max_jobs)
+            jobs = self.iter_jobs_linkedin_public_api(keyword, location, max_jobs, incremental=incremental)
         
+        results = []
+        discovered = 0
+        for i, job in enumerate(islice(jobs, max_jobs), 1):
+            discovered = i
+            logger.info(f"\n📦 Processing job {i}/{max_jobs}: {job.get('title', 'Unknown')}")
+            
+            result = self.process_job(job)
+            if not result:
+                continue
+            
+            results.append(result)
+        
+        if not discovered:
+            logger.error("❌ No jobs discovered")
+            return []
+        
+        logger.info("=" * 60)
+        logger.info(f"✅ FREE Pipeline Complete: {len(results)} jobs processed")
+        self._log_page_cache_stats()
+        logger.info("=" * 60)
+        
+        # Save to JSON file
+        if save_json:
+            json_file = self.save_results_to_json(results, json_filename)
+            logger.info(f"📄 Results saved to JSON: {json_file}")
+        
+        return results
+    
+    def run_free_pipeline_batch(
+        self,
+        queries: List[Tuple[str, str]],
+        max_jobs_per_query: int = 10,
+        workers: int = 4,
+        requests_per_second: Optional[float] = None,
+        save_json: bool = True,
+        json_filename: Optional[str] = None,
+        incremental: bool = False
+    ) -> List[Dict]:
+        """
+        FREE pipeline for many (keyword, location) queries
+        
+        Discovery runs through discover_jobs_batch, so a job returned by several
+        overlapping queries goes through company and career-page work only once.
+        
+        Args:
+            queries: List of (keyword, location) tuples
+            max_jobs_per_query: Maximum jobs discovered per query
+            workers: Number of queries fetched in parallel
+            requests_per_second: Extra cap on guest search requests per second (the
+                transport already paces linkedin.com)
+            save_json: Whether to save results to JSON file (default: True)
+            json_filename: Optional JSON filename (default: auto-generated)
+            incremental: Only process jobs not discovered by previous runs
+            
+        Returns:
+            List of complete job data
+        """
+        logger.info("=" * 60)
+        logger.info(f"🆓 Starting FREE Batch Pipeline ({len(queries)} queries)")
+        logger.info("=" * 60)
+        
+        self._reset_page_caches()
+        
+        jobs = self.discover_jobs_batch(
+            queries, max_jobs_per_query, workers, requests_per_second, incremental
+        )
         if not jobs:
             logger.error("❌ No jobs discovered")
             return []
         
         results = []
-        for i, job in enumerate(jobs[:max_jobs], 1):
-            logger.info(f"\n📦 Processing job {i}/{min(len(jobs), max_jobs)}: {job.get('title', 'Unknown')}")
+        for i, job in enumerate(jobs, 1):
+            logger.info(f"\n📦 Processing job {i}/{len(jobs)}: {job.get('title', 'Unknown')}")
             
-            job_url = job.get("job_url")
-            if not job_url:
+            result = self.process_job(job)
+            if not result:
                 continue
             
-            # Step 2: Extract company data (FREE)
-            company_data = self.extract_company_website_from_linkedin_job(job_url)
-            if not company_data:
-                # Still save job info even if company extraction fails
-                result = {
-                    "linkedin_job_url": job_url,
-                    "company_name": None,
-                    "company_website": None,
-                    "career_page_url": None,
-                    "open_position_url": None,
-                    "title": job.get("title"),
-                    "location": job.get("location"),
-                    "source": "free_pipeline",
-                    "status": "company_extraction_failed"
-                }
-                results.append(result)
-                continue
-            
-            company_name, company_website = company_data
-            
-            # Step 3: Find career page (FREE - with LLM)
-            career_page = None
-            open_job = None
-            
-            if company_website:
-                career_page = self.find_career_page_with_llm(company_website)
-                # Step 4: Extract job posting
-                if career_page:
-                    open_job = self.extract_one_job(career_page)
-            else:
-                logger.warning(f"⚠️  No website for {company_name}, skipping career page search")
-            
-            result = {
-                "linkedin_job_url": job_url,
-                "company_name": company_name,
-                "company_website": company_website,
-                "career_page_url": career_page,
-                "open_position_url": open_job,
-                "title": job.get("title"),
-                "location": job.get("location"),
-                "source": "free_pipeline",
-                "status": "complete" if open_job else "partial"
-            }
-            
-            # Step 5: Store in Postgres (optional)
-            if self.postgres_config:
-                self.store_in_postgres(result)
-            
             results.append(result)
-            time.sleep(2)  # Rate limiting
         
         logger.info("=" * 60)
-        logger.info(f"✅ FREE Pipeline Complete: {len(results)} jobs processed")
+        logger.info(f"✅ FREE Batch Pipeline Complete: {len(results)} jobs processed")
+        self._log_page_cache_stats()
         logger.info("=" * 60)
         
-        # Save to JSON file
         if save_json:
             json_file = self.save_results_to_json(results, json_filename)
             logger.info(f"📄 Results saved to JSON: {json_file}")
@@ -945,13 +1563,16 @@ def main():
     )
     
     # Run FREE pipeline (results automatically saved to JSON)
-    results = agent.run_free_pipeline(
-        keyword="software engineer",
-        location="United States",
-        max_jobs=5,
-        save_json=True,  # Save to JSON file
-        json_filename=None  # Auto-generate filename
-    )
+    try:
+        results = agent.run_free_pipeline(
+            keyword="software engineer",
+            location="United States",
+            max_jobs=5,
+            save_json=True,  # Save to JSON file
+            json_filename=None  # Auto-generate filename
+        )
+    finally:
+        agent.close()  # Shut down the shared Playwright browser and HTTP connections
     
     print("\n" + "=" * 60)
     print("🆓 FREE PIPELINE RESULTS")
@@ -0,0 +1,77 @@
+"""
+Compiled multi-keyword matcher for link scanning.
+
+All keywords are folded into a single precompiled regex shaped like a
+prefix trie ("career", "careers", "carrera" -> "car(?:eer(?:s)?|rera)"), so
+scanning a string is one regex pass whose cost depends on the text, not on
+how many keywords (for example localized ones) are in the list.
+"""
+
+import re
+from typing import Dict, Iterable, List, Optional, Pattern, Tuple
+
+
+def _trie_regex(keywords: Iterable[str]) -> str:
+    """Build a regex matching any of `keywords`, longest match first"""
+    trie: Dict = {}
+    for keyword in keywords:
+        node = trie
+        for char in keyword:
+            node = node.setdefault(char, {})
+        node[""] = True
+
+    def build(node: Dict) -> str:
+        branches = [re.escape(char) + build(child) for char, child in sorted(node.items()) if char]
+        if not branches:
+            return ""
+        optional = "" in node
+        if len(branches) == 1 and not optional:
+            return branches[0]
+        pattern = "(?:" + "|".join(branches) + ")"
+        return pattern + "?" if optional else pattern
+
+    return build(trie)
+
+
+class KeywordMatcher:
+    """Case-insensitive matcher for a list of keywords, compiled once"""
+
+    def __init__(self, keywords: Iterable[str]):
+        """
+        Args:
+            keywords: Keywords to look for (substring match, case-insensitive)
+        """
+        self.keywords: List[str] = []
+        self._pattern: Optional[Pattern] = None
+        self.extend(keywords)
+
+    def extend(self, keywords: Iterable[str]) -> None:
+        """Add keywords (e.g. localized terms like "karriere" or "empleo") and recompile"""
+        for keyword in keywords:
+            keyword = keyword.strip().lower()
+            if keyword and keyword not in self.keywords:
+                self.keywords.append(keyword)
+        # Text is lowercased before matching; re.IGNORECASE makes every step of the scan slower
+        self._pattern = re.compile(_trie_regex(self.keywords)) if self.keywords else None
+
+    def search(self, text: Optional[str]) -> bool:
+        """Whether any keyword occurs in `text`"""
+        if not text or self._pattern is None:
+            return False
+        return self._pattern.search(text.lower()) is not None
+
+    def matches(self, text: Optional[str]) -> List[Tuple[str, int]]:
+        """
+        Every keyword occurrence in `text`
+
+        Returns:
+            List of (keyword, position) tuples; where keywords overlap ("career" and
+            "careers") the longest one is reported
+        """
+        if not text or self._pattern is None:
+            return []
+        return [(match.group(0), match.start()) for match in self._pattern.finditer(text.lower())]
+
+    def match_link(self, href: Optional[str], text: Optional[str]) -> Dict[str, List[Tuple[str, int]]]:
+        """Keyword matches in a link's href and its text, as {"href": [...], "text": [...]}"""
+        return {"href": self.matches(href), "text": self.matches(text)}
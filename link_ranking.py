@@ -0,0 +1,128 @@
+"""
+Single-pass ranking of career-page candidate links.
+
+Instead of taking the first anchor that contains any career keyword (which
+often lands on "/team" or "/work"), every anchor on the page is scored once:
+keyword strength in the href and in the link text, navigation/footer
+placement, same-site vs. external host, and known applicant tracking system
+(ATS) hosts. Callers get a ranked candidate list and fetch the best first.
+"""
+
+from typing import Dict, List, Optional
+from urllib.parse import urljoin, urlparse
+
+from bs4 import SoupStrainer
+
+from keyword_matcher import KeywordMatcher
+
+# Anchors plus the page regions whose placement is scored; everything else is skipped
+LINK_REGION_STRAINER = SoupStrainer(["a", "nav", "header", "footer"])
+
+# Hosted job boards companies link to from their sites
+ATS_HOSTS = (
+    "greenhouse.io", "lever.co", "myworkdayjobs.com", "workday.com", "smartrecruiters.com",
+    "ashbyhq.com", "jobvite.com", "icims.com", "bamboohr.com", "workable.com", "recruitee.com",
+    "personio.de", "personio.com", "teamtailor.com", "breezy.hr", "applytojob.com"
+)
+
+# Weight of each career keyword; keywords not listed (e.g. localized extras) get the default
+CAREER_KEYWORD_WEIGHTS = {
+    "career": 3.0,
+    "careers": 3.0,
+    "jobs": 3.0,
+    "hiring": 2.0,
+    "opportunities": 2.0,
+    "join": 1.0,
+    "work": 0.5,
+    "team": 0.5
+}
+DEFAULT_KEYWORD_WEIGHT = 2.0
+
+TEXT_MATCH_FACTOR = 1.5   # link text is a stronger signal than the URL
+ATS_BONUS = 5.0
+NAV_BONUS = 1.0           # career links usually sit in the header, nav or footer
+SAME_SITE_BONUS = 1.0
+EXTERNAL_PENALTY = 6.0    # other sites (social profiles, job aggregators)
+MIN_CANDIDATE_SCORE = 0.0  # candidates at or below this are dropped, so callers fall back to probing
+
+SKIPPED_SCHEMES = ("#", "mailto:", "tel:", "javascript:")
+
+
+def _bare_host(url: str) -> str:
+    host = urlparse(url).netloc.lower().split(":")[0]
+    return host[4:] if host.startswith("www.") else host
+
+
+def is_ats_url(url: str) -> bool:
+    """Whether the URL points to a known applicant tracking system"""
+    host = _bare_host(url)
+    return any(host == ats or host.endswith("." + ats) for ats in ATS_HOSTS)
+
+
+def is_same_site(url: str, site_url: str) -> bool:
+    """Whether `url` is on the site's host or one of its subdomains (careers.example.com)"""
+    host, site = _bare_host(url), _bare_host(site_url)
+    return bool(host) and (host == site or host.endswith("." + site) or site.endswith("." + host))
+
+
+def rank_links(
+    soup,
+    page_url: str,
+    matcher: KeywordMatcher,
+    weights: Optional[Dict[str, float]] = None
+) -> List[Dict]:
+    """
+    Score every anchor on a page as a career-page candidate
+
+    Args:
+        soup: Parsed page (LINK_REGION_STRAINER keeps the regions that are scored)
+        page_url: URL of the page, used to resolve relative links
+        matcher: Keyword matcher for career keywords
+        weights: Keyword weights (default: CAREER_KEYWORD_WEIGHTS)
+
+    Returns:
+        Candidate dicts (url, score, text, matches, ats), best first; links that
+        match no keyword and aren't on an ATS host, or that score at most
+        MIN_CANDIDATE_SCORE (e.g. social profiles), are left out
+    """
+    weights = CAREER_KEYWORD_WEIGHTS if weights is None else weights
+    best: Dict[str, Dict] = {}
+
+    for a in soup.find_all("a", href=True):
+        href = a["href"].strip()
+        if not href or href.lower().startswith(SKIPPED_SCHEMES):
+            continue
+
+        url = urljoin(page_url, href).split("#")[0]
+        if not url.startswith(("http://", "https://")):
+            continue
+
+        text = a.get_text(" ", strip=True)
+        matches = matcher.match_link(href, text)
+        ats = is_ats_url(url)
+        if not matches["href"] and not matches["text"] and not ats:
+            continue
+
+        score = sum(weights.get(keyword, DEFAULT_KEYWORD_WEIGHT) for keyword in {k for k, _ in matches["href"]})
+        score += TEXT_MATCH_FACTOR * sum(
+            weights.get(keyword, DEFAULT_KEYWORD_WEIGHT) for keyword in {k for k, _ in matches["text"]}
+        )
+        if ats:
+            score += ATS_BONUS
+        elif is_same_site(url, page_url):
+            score += SAME_SITE_BONUS
+        else:
+            score -= EXTERNAL_PENALTY
+        if a.find_parent(["nav", "header", "footer"]) is not None:
+            score += NAV_BONUS
+
+        # The same URL linked twice keeps its best score and first position
+        existing = best.get(url)
+        if existing is None:
+            best[url] = {"url": url, "score": score, "text": text, "matches": matches, "ats": ats}
+        elif score > existing["score"]:
+            existing.update(score=score, text=text, matches=matches)
+
+    candidates = [candidate for candidate in best.values() if candidate["score"] > MIN_CANDIDATE_SCORE]
+    # sorted() is stable, so equal scores keep page order
+    return sorted(candidates, key=lambda candidate: candidate["score"], reverse=True)
@@ -0,0 +1,143 @@
+"""
+Per-run cache of fetched pages.
+
+The same company homepage is fetched by career-page ranking, again by the
+LLM fallback, and again for every other job at that company; career pages
+are fetched by the common-path probe and again by extract_one_job. PageCache
+keeps each fetched page (and the trees parsed from it, see FetchedPage.soup)
+keyed by normalized URL, so within a run every URL is downloaded and parsed
+at most once. Fetches that fail for good (an unsupported content type, a
+404 or 410) are remembered too; timeouts, connection errors, 429s and 5xx
+responses are not, so a later job at the same company tries again.
+"""
+
+import threading
+from collections import OrderedDict
+from typing import Callable, Dict, Optional, Tuple, Union
+from urllib.parse import urlsplit, urlunsplit
+
+import requests
+
+from page_fetch import FetchedPage, UnsupportedContentType, fetch_page
+
+DEFAULT_PORTS = {"http": 80, "https": 443}
+
+# Fetch errors that a retry within the same run would only repeat
+PERMANENT_ERRORS = (UnsupportedContentType,)
+
+# Non-2xx statuses that a retry within the same run would only repeat
+PERMANENT_STATUSES = frozenset({404, 410})
+
+
+def normalize_url(url: str) -> str:
+    """Cache key for a URL: lowercase scheme/host, no default port, fragment or trailing slash"""
+    parts = urlsplit(url.strip())
+    scheme = parts.scheme.lower()
+    host = (parts.hostname or "").lower()
+    if parts.port and parts.port != DEFAULT_PORTS.get(scheme):
+        host = f"{host}:{parts.port}"
+    path = parts.path.rstrip("/") or "/"
+    return urlunsplit((scheme, host, path, parts.query, ""))
+
+
+class PageCache:
+    """Thread-safe LRU cache of FetchedPage objects (or permanent fetch errors) keyed by normalized URL"""
+
+    def __init__(self, max_pages: int = 256):
+        """
+        Args:
+            max_pages: Pages kept before the least recently used one is dropped
+        """
+        self.max_pages = max_pages
+        # Pages are stored with the byte cap they were fetched with
+        self._pages: "OrderedDict[str, Union[Tuple[FetchedPage, int], Exception]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def fetch(
+        self,
+        session: requests.Session,
+        url: str,
+        max_bytes: int,
+        stop_when: Optional[Callable[[str], bool]] = None,
+        **kwargs
+    ) -> FetchedPage:
+        """
+        fetch_page through the cache
+
+        A cached page that was cut short by another caller's stop_when is only
+        reused by callers that also pass stop_when, and one truncated at a
+        smaller byte cap only by callers with at most that cap; others refetch.
+        """
+        key = normalize_url(url)
+        cached = self._lookup(key, stop_when, max_bytes)
+        if cached is not None:
+            if isinstance(cached, Exception):
+                raise cached
+            return cached
+
+        try:
+            page = fetch_page(session, url, max_bytes, stop_when=stop_when, **kwargs)
+        except PERMANENT_ERRORS as e:
+            self._store(key, e)
+            raise
+
+        self._store_page(key, page, max_bytes)
+        return page
+
+    def _lookup(
+        self,
+        key: str,
+        stop_when: Optional[Callable[[str], bool]],
+        max_bytes: int
+    ) -> Optional[Union[FetchedPage, Exception]]:
+        """Usable cache entry for `key` (counted as a hit), or None (counted as a miss)"""
+        with self._lock:
+            cached = self._pages.get(key)
+            if cached is not None and self._usable(cached, stop_when, max_bytes):
+                self._pages.move_to_end(key)
+                self.hits += 1
+                return cached if isinstance(cached, Exception) else cached[0]
+            self.misses += 1
+            return None
+
+    @staticmethod
+    def _usable(
+        cached: Union[Tuple[FetchedPage, int], Exception],
+        stop_when: Optional[Callable[[str], bool]],
+        max_bytes: int
+    ) -> bool:
+        if isinstance(cached, Exception):
+            return True
+        page, fetched_max_bytes = cached
+        if page.stopped_early and stop_when is None:
+            return False
+        return not (page.truncated and max_bytes > fetched_max_bytes)
+
+    def _store_page(self, key: str, page: FetchedPage, max_bytes: int) -> None:
+        if not (200 <= page.status_code < 300 or page.status_code in PERMANENT_STATUSES):
+            return
+        self._store(key, (page, max_bytes))
+        # Also reachable under the URL it redirected to
+        if page.url and normalize_url(page.url) != key:
+            self._store(normalize_url(page.url), (page, max_bytes))
+
+    def _store(self, key: str, entry: Union[Tuple[FetchedPage, int], Exception]) -> None:
+        with self._lock:
+            self._pages[key] = entry
+            self._pages.move_to_end(key)
+            while len(self._pages) > self.max_pages:
+                self._pages.popitem(last=False)
+
+    def stats(self) -> Dict[str, int]:
+        """Hits, misses and cached pages since the last clear()"""
+        with self._lock:
+            return {"hits": self.hits, "misses": self.misses, "pages": len(self._pages)}
+
+    def clear(self) -> None:
+        """Forget all pages (called at the start of each pipeline run)"""
+        with self._lock:
+            self._pages.clear()
+            self.hits = 0
+            self.misses = 0
@@ -0,0 +1,214 @@
+"""
+Streamed, size-capped fetching of HTML pages.
+
+`session.get(...)` downloads the whole body before anything looks at it, so
+a multi-megabyte homepage or an accidental PDF/video link costs full
+bandwidth and time. fetch_page streams the body instead: it rejects
+unexpected content types before reading, stops at a per-stage byte cap, and
+can stop as soon as a caller-supplied check has seen what it needs.
+"""
+
+import codecs
+import re
+from typing import TYPE_CHECKING, Callable, Optional, Tuple
+
+import requests
+from bs4 import BeautifulSoup
+
+if TYPE_CHECKING:
+    from http_cache import HttpCache
+
+# Content types parsed as HTML pages
+HTML_CONTENT_TYPES = ("text/html", "application/xhtml+xml")
+
+# Byte cap per fetch stage; bodies beyond the cap are cut off and parsed as-is
+DEFAULT_MAX_PAGE_BYTES = {
+    "linkedin": 3 * 1024 * 1024,     # guest search, job and company pages
+    "homepage": 2 * 1024 * 1024,     # company homepages (career link search)
+    "career_page": 2 * 1024 * 1024,  # career pages and common-path probes
+}
+
+CHUNK_SIZE = 16 * 1024
+
+# Text carried over between chunks so early-stop checks see tags split across chunks
+STOP_CHECK_OVERLAP = 2048
+
+ANCHOR_HREF_PATTERN = re.compile(r"""<a\b[^>]*?\bhref\s*=\s*["']([^"']+)["']""", re.IGNORECASE)
+
+
+class UnsupportedContentType(requests.exceptions.RequestException):
+    """Raised when a page's Content-Type is not in the allowlist"""
+
+
+class FetchedPage:
+    """Decoded body of a streamed fetch plus the response metadata callers need"""
+
+    def __init__(
+        self,
+        response: requests.Response,
+        text: str,
+        truncated: bool = False,
+        stopped_early: bool = False
+    ):
+        self.response = response
+        self.url = response.url
+        self.status_code = response.status_code
+        self.headers = response.headers
+        self.text = text
+        self.truncated = truncated
+        self.stopped_early = stopped_early
+        self._soups = {}
+
+    def raise_for_status(self) -> None:
+        self.response.raise_for_status()
+
+    def soup(self, parser: str, parse_only=None) -> BeautifulSoup:
+        """Parsed tree of the page, built once per (parser, strainer)"""
+        key = (parser, id(parse_only))
+        if key not in self._soups:
+            self._soups[key] = BeautifulSoup(self.text, parser, parse_only=parse_only)
+        return self._soups[key]
+
+
+def _content_type(response: requests.Response) -> Tuple[str, Optional[str]]:
+    """Media type and declared charset of a response"""
+    header = response.headers.get("Content-Type", "")
+    media_type = header.split(";")[0].strip().lower()
+    match = re.search(r"charset=([\w.:-]+)", header, re.IGNORECASE)
+    return media_type, match.group(1) if match else None
+
+
+class StreamedBody:
+    """
+    Incremental reader for a response body, shared by fetch_page and the async fetcher
+
+    Checks the Content-Type up front, then decodes chunks as they are fed in
+    and reports when reading should stop (byte cap reached or stop_when fired).
+    """
+
+    def __init__(
+        self,
+        response: requests.Response,
+        url: str,
+        max_bytes: int,
+        allowed_types: Optional[Tuple[str, ...]] = HTML_CONTENT_TYPES,
+        stop_when: Optional[Callable[[str], bool]] = None
+    ):
+        """
+        Raises:
+            UnsupportedContentType: If the Content-Type is not allowed
+        """
+        media_type, charset = _content_type(response)
+        if allowed_types and media_type and media_type not in allowed_types:
+            raise UnsupportedContentType(f"Unsupported content type {media_type} for {url}", response=response)
+
+        # Without a charset in the header, decode as UTF-8 (what nearly all pages use)
+        try:
+            self._decoder = codecs.getincrementaldecoder(charset or "utf-8")(errors="replace")
+        except LookupError:
+            self._decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+
+        self.response = response
+        self.max_bytes = max_bytes
+        self.stop_when = stop_when
+        self.truncated = False
+        self.stopped_early = False
+        self._parts = []
+        self._read = 0
+        self._tail = ""
+
+    def feed(self, chunk: bytes) -> bool:
+        """Decode the next chunk; returns True once no more chunks should be read"""
+        if self._read + len(chunk) > self.max_bytes:
+            chunk = chunk[:self.max_bytes - self._read]
+            self.truncated = True
+        self._read += len(chunk)
+        text = self._decoder.decode(chunk)
+        self._parts.append(text)
+
+        if self.truncated:
+            return True
+        if self.stop_when is not None:
+            window = self._tail + text
+            if self.stop_when(window):
+                self.stopped_early = True
+                return True
+            self._tail = window[-STOP_CHECK_OVERLAP:]
+        return False
+
+    def page(self) -> FetchedPage:
+        """The page read so far"""
+        self._parts.append(self._decoder.decode(b"", final=True))
+        return FetchedPage(self.response, "".join(self._parts), self.truncated, self.stopped_early)
+
+
+def fetch_page(
+    session: requests.Session,
+    url: str,
+    max_bytes: int = 2 * 1024 * 1024,
+    allowed_types: Optional[Tuple[str, ...]] = HTML_CONTENT_TYPES,
+    stop_when: Optional[Callable[[str], bool]] = None,
+    timeout: float = 10,
+    http_cache: Optional["HttpCache"] = None,
+    **kwargs
+) -> FetchedPage:
+    """
+    GET a page, streaming the body and stopping at `max_bytes`
+
+    Args:
+        session: Session to fetch with
+        url: Page URL
+        max_bytes: Stop reading after this many bytes (the page is marked truncated)
+        allowed_types: Accepted media types (None = any); a response without a
+            Content-Type header is accepted
+        stop_when: Optional check called with each newly decoded chunk (plus a
+            little overlap); returning True stops the download early
+        timeout: Request timeout in seconds
+        http_cache: Optional HttpCache; a stored copy is revalidated with its
+            ETag / Last-Modified and served on 304 Not Modified
+        **kwargs: Passed on to session.get (allow_redirects, headers, ...)
+
+    Returns:
+        FetchedPage (non-2xx responses come back with an empty body, call
+        raise_for_status() to turn them into errors)
+
+    Raises:
+        UnsupportedContentType: If the Content-Type is not allowed
+        requests.exceptions.RequestException: On connection errors
+    """
+    entry = None
+    if http_cache is not None:
+        entry = http_cache.lookup(url, partial_ok=stop_when is not None)
+        if entry is not None:
+            if http_cache.is_fresh(entry):
+                return http_cache.serve_fresh(entry)
+            kwargs["headers"] = {**(kwargs.get("headers") or {}), **http_cache.validators(entry)}
+
+    with session.get(url, stream=True, timeout=timeout, **kwargs) as res:
+        if entry is not None and res.status_code == 304:
+            return http_cache.serve_revalidated(url, entry, res)
+
+        if not res.ok:
+            page = FetchedPage(res, "")
+        else:
+            body = StreamedBody(res, url, max_bytes, allowed_types, stop_when)
+            for chunk in res.iter_content(chunk_size=CHUNK_SIZE):
+                if body.feed(chunk):
+                    break
+            page = body.page()
+
+    if http_cache is not None:
+        http_cache.store(url, page)
+    return page
+
+
+def anchor_href_check(matches_href: Callable[[str], bool]) -> Callable[[str], bool]:
+    """
+    Build a stop_when check that fires once an <a href> accepted by `matches_href` has been read
+
+    Args:
+        matches_href: Predicate on the raw href value
+    """
+    def check(text: str) -> bool:
+        return any(matches_href(href) for href in ANCHOR_HREF_PATTERN.findall(text))
+    return check
@@ -0,0 +1,88 @@
+"""
+Concurrent probing of well-known career page paths.
+
+When a homepage has no usable career link, the agents guess paths such as
+"/careers" or "/jobs". Each guess used to be a full GET made one after
+another, so a site without any of them cost one timeout per path. Here every
+path is probed at once with a HEAD request (headers only), and the first path
+in preference order that exists wins, so a longer path list adds requests but
+hardly any latency.
+"""
+
+from typing import TYPE_CHECKING, List, Optional
+from urllib.parse import urljoin
+
+import requests
+
+if TYPE_CHECKING:
+    from http_transport import HttpTransport
+
+# Paths probed when a homepage has no career link, most likely first
+COMMON_CAREER_PATHS = [
+    "/careers", "/career", "/jobs", "/join-us", "/work-with-us",
+    "/about/careers", "/company/careers", "/en/careers", "/join", "/open-positions"
+]
+
+# Statuses meaning the server does not answer HEAD, so the probe is repeated as a GET
+HEAD_UNSUPPORTED_STATUSES = frozenset({405, 501})
+
+
+def probe_urls(base_url: str, paths: List[str]) -> List[str]:
+    """Absolute URLs for the paths on the base URL's site, in the same order"""
+    return [urljoin(base_url, path) for path in paths]
+
+
+def path_exists(transport: "HttpTransport", url: str, timeout: float = 5) -> bool:
+    """
+    Whether the URL answers 200 (after redirects), without downloading its body
+
+    Servers that reject HEAD get a streamed GET whose body is never read.
+    """
+    session = transport.session
+    try:
+        res = session.head(url, timeout=timeout, allow_redirects=True)
+        if res.status_code in HEAD_UNSUPPORTED_STATUSES:
+            with session.get(url, timeout=timeout, allow_redirects=True, stream=True) as res:
+                pass
+        return res.status_code == 200
+    except requests.exceptions.RequestException:
+        return False
+
+
+def probe_paths(
+    transport: "HttpTransport",
+    base_url: str,
+    paths: List[str],
+    timeout: float = 5
+) -> Optional[str]:
+    """
+    First of the paths (in list order) that exists on the base URL's site
+
+    All paths are probed concurrently on the transport's shared worker pool
+    (HttpTransport.executor, max_workers threads). A path is returned as soon as it and
+    every path before it have answered, so a hit on an early path doesn't wait
+    for slow probes of later ones.
+
+    Args:
+        transport: Transport whose per-thread sessions send the probes
+        base_url: Company website URL
+        paths: Paths to try, most preferred first
+        timeout: Timeout per probe in seconds
+
+    Returns:
+        Absolute URL of the first existing path, or None
+    """
+    urls = probe_urls(base_url, paths)
+    if not urls:
+        return None
+
+    futures = [transport.executor.submit(path_exists, transport, url, timeout) for url in urls]
+    try:
+        for url, future in zip(urls, futures):
+            if future.result():
+                return url
+        return None
+    finally:
+        # Probes of less preferred paths that haven't started are no longer needed
+        for future in futures:
+            future.cancel()
@@ -0,0 +1,138 @@
+"""
+Rate limiting helpers shared by the job source agents.
+
+HostScheduler gives every host its own token bucket, so requests to one site
+are paced by that site's rate while requests to other sites go out at once.
+Both HTTP transports send every request through one.
+"""
+
+import asyncio
+import threading
+import time
+from typing import Dict, Optional
+from urllib.parse import urlsplit
+
+# Requests per second for specific domains and their subdomains (0 = unlimited)
+DEFAULT_HOST_RATES = {
+    "linkedin.com": 1.0,
+    "localhost": 0.0,
+    "127.0.0.1": 0.0,
+}
+# Requests per second for every other host (company websites, APIs), and how many
+# may go out at once after an idle spell (e.g. concurrent career path probes)
+DEFAULT_HOST_RATE = 5.0
+DEFAULT_HOST_BURST = 10.0
+
+
+class TokenBucket:
+    """Thread-safe token bucket: `burst` calls at once, refilled at `rate` per second"""
+
+    def __init__(self, rate: float = 1.0, burst: float = 1.0):
+        """
+        Args:
+            rate: Tokens added per second (0 or less disables limiting)
+            burst: Maximum tokens saved up while idle
+        """
+        self.rate = rate if rate and rate > 0 else 0.0
+        self.burst = max(1.0, burst)
+        self._lock = threading.Lock()
+        self._tokens = self.burst
+        self._updated = time.monotonic()
+
+    def acquire(self) -> None:
+        """Block until the caller is allowed to make its next call"""
+        wait = self._reserve()
+        if wait > 0:
+            time.sleep(wait)
+
+    async def acquire_async(self) -> None:
+        """Like acquire, but waits without blocking the event loop"""
+        wait = self._reserve()
+        if wait > 0:
+            await asyncio.sleep(wait)
+
+    def _reserve(self) -> float:
+        """Take a token and return how long to wait until it is available"""
+        if not self.rate:
+            return 0.0
+
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            # Going negative queues the caller behind earlier reservations
+            self._tokens -= 1
+            wait = -self._tokens / self.rate
+        return wait
+
+
+class RateLimiter(TokenBucket):
+    """Thread-safe limiter that spaces calls out to at most `rate` per second"""
+
+    def __init__(self, rate: float = 1.0):
+        """
+        Args:
+            rate: Maximum calls per second (0 or less disables limiting)
+        """
+        super().__init__(rate, burst=1.0)
+
+
+class HostScheduler:
+    """Per-host token buckets that every request waits on before it is sent"""
+
+    def __init__(
+        self,
+        host_rates: Optional[Dict[str, float]] = None,
+        default_rate: float = DEFAULT_HOST_RATE,
+        burst: float = 1.0,
+        default_burst: float = DEFAULT_HOST_BURST
+    ):
+        """
+        Args:
+            host_rates: Requests per second for specific domains and their subdomains,
+                which share one bucket, e.g. {"linkedin.com": 1.0} (default: DEFAULT_HOST_RATES)
+            default_rate: Requests per second for each other host (0 = unlimited)
+            burst: Requests a configured domain may receive at once after being idle
+            default_burst: Requests each other host may receive at once after being idle
+        """
+        self.host_rates = dict(DEFAULT_HOST_RATES if host_rates is None else host_rates)
+        self.default_rate = default_rate
+        self.burst = burst
+        self.default_burst = default_burst
+        self._lock = threading.Lock()
+        self._buckets: Dict[str, TokenBucket] = {}
+
+    @classmethod
+    def from_config(cls, config: Dict) -> "HostScheduler":
+        """Build a scheduler from a config dict with optional host_rates, default_rate, burst and default_burst keys"""
+        return cls(
+            host_rates=config.get("host_rates"),
+            default_rate=config.get("default_rate", DEFAULT_HOST_RATE),
+            burst=config.get("burst", 1.0),
+            default_burst=config.get("default_burst", DEFAULT_HOST_BURST)
+        )
+
+    def bucket(self, url: str) -> TokenBucket:
+        """Bucket for a URL's host (or its closest configured parent domain)"""
+        host = (urlsplit(url).hostname or "").lower()
+        key, rate, burst = host, self.default_rate, self.default_burst
+        parts = host.split(".")
+        for i in range(len(parts)):
+            domain = ".".join(parts[i:])
+            if domain in self.host_rates:
+                key, rate, burst = domain, self.host_rates[domain], self.burst
+                break
+
+        with self._lock:
+            bucket = self._buckets.get(key)
+            if bucket is None:
+                bucket = self._buckets[key] = TokenBucket(rate, burst)
+        return bucket
+
+    def acquire(self, url: str) -> None:
+        """Block until a request to the URL's host may be sent"""
+        self.bucket(url).acquire()
+
+    async def acquire_async(self, url: str) -> None:
+        """Like acquire, but waits without blocking the event loop"""
+        await self.bucket(url).acquire_async()